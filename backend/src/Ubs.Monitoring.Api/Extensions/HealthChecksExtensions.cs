@@ -1,3 +1,4 @@
+using System.Diagnostics;
 using System.Text.Json;
 using Microsoft.AspNetCore.Diagnostics.HealthChecks;
 using Microsoft.Extensions.Diagnostics.HealthChecks;
@@ -14,17 +15,47 @@ public static class HealthChecksExtensions
     /// <param name="services">
     /// The dependency injection container used to register health check implementations.
     /// </param>
+    /// <param name="configuration">
+    /// The application configuration; <c>HealthChecks:ExposeProcessMemory</c> (default <c>false</c>)
+    /// adds the <c>process</c> memory check to the anonymous <c>/api/health</c> endpoint.
+    /// </param>
     /// <returns>
     /// The same <see cref="IServiceCollection"/> instance, allowing fluent  chaining of service registrations.
     /// </returns>
-    public static IServiceCollection AddApiHealthChecks(this IServiceCollection services)
+    public static IServiceCollection AddApiHealthChecks(this IServiceCollection services, IConfiguration configuration)
     {
-        services.AddHealthChecks()
+        var builder = services.AddHealthChecks()
             .AddCheck("self", () => HealthCheckResult.Healthy(), tags: new[] { "live" })
             .AddDbContextCheck<AppDbContext>("db", tags: new[] { "ready" });
 
+        // Process memory is diagnostic telemetry for load tests; keep it off the public endpoint unless enabled.
+        if (configuration.GetValue<bool>("HealthChecks:ExposeProcessMemory"))
+        {
+            builder.AddCheck("process", ProcessMemory, tags: new[] { "live" });
+        }
+
         return services;
     }
+
+    /// <summary>
+    /// Reports the API process memory (working set, GC heap, cumulative allocations) as health data,
+    /// so load tests can follow server memory while they run. Only registered when
+    /// <c>HealthChecks:ExposeProcessMemory</c> is enabled.
+    /// </summary>
+    private static HealthCheckResult ProcessMemory()
+    {
+        using var process = Process.GetCurrentProcess();
+
+        var data = new Dictionary<string, object>
+        {
+            ["workingSetBytes"] = process.WorkingSet64,
+            ["peakWorkingSetBytes"] = process.PeakWorkingSet64,
+            ["gcHeapBytes"] = GC.GetTotalMemory(forceFullCollection: false),
+            ["gcTotalAllocatedBytes"] = GC.GetTotalAllocatedBytes(),
+        };
+
+        return HealthCheckResult.Healthy("Process memory", data);
+    }
     /// <summary>
     /// Maps HTTP endpoints that expose health check information for the API.
     /// </summary>
@@ -47,7 +78,8 @@ public static class HealthChecksExtensions
                 {
                     name = e.Key,
                     status = e.Value.Status.ToString(),
-                    description = e.Value.Description
+                    description = e.Value.Description,
+                    data = e.Value.Data
                 })
             };
             return Results.Json(payload, statusCode: StatusCodes.Status200OK);
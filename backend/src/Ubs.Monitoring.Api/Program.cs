@@ -19,7 +19,7 @@ builder.Services.AddHttpContextAccessor();
 
 // Infrastructure and application-layer dependencies
 builder.Services.AddInfrastructure(builder.Configuration);
-builder.Services.AddApiHealthChecks();
+builder.Services.AddApiHealthChecks(builder.Configuration);
 
 // Authentication and authorization using JWT
 builder.Services.AddJwtAuthentication(builder.Configuration);
@@ -0,0 +1,62 @@
+using Ubs.Monitoring.Domain.Enums;
+
+namespace Ubs.Monitoring.Application.ComplianceRules;
+
+/// <summary>
+/// An active compliance rule with its parameters parsed once, ready for per-transaction evaluation.
+/// </summary>
+/// <param name="Id">
+/// The unique identifier of the compliance rule.
+/// </param>
+/// <param name="Code">
+/// The system code identifying the compliance rule.
+/// </param>
+/// <param name="RuleType">
+/// The type or category of the compliance rule.
+/// </param>
+/// <param name="Severity">
+/// The severity assigned to violations of this rule.
+/// </param>
+/// <param name="Scope">
+/// The aggregation scope (<c>PerClient</c>, <c>PerAccount</c> or <c>null</c>).
+/// </param>
+/// <param name="Parameters">
+/// The typed rule parameters, or <c>null</c> when the rule type has no evaluator.
+/// </param>
+public sealed record ActiveComplianceRule(
+    Guid Id,
+    string Code,
+    RuleType RuleType,
+    Severity Severity,
+    string? Scope,
+    ComplianceRuleParameters? Parameters
+);
+
+/// <summary>
+/// Base type of the typed parameters of a compliance rule.
+/// </summary>
+public abstract record ComplianceRuleParameters;
+
+/// <summary>
+/// Parameters of a <see cref="RuleType.DailyLimit"/> rule.
+/// </summary>
+public sealed record DailyLimitParameters(decimal LimitBaseAmount) : ComplianceRuleParameters;
+
+/// <summary>
+/// Parameters of a <see cref="RuleType.BannedCountries"/> rule; country codes are matched case-insensitively.
+/// </summary>
+public sealed record BannedCountriesParameters(IReadOnlySet<string> Countries) : ComplianceRuleParameters;
+
+/// <summary>
+/// Parameters of a <see cref="RuleType.Structuring"/> rule.
+/// </summary>
+public sealed record StructuringParameters(int N, decimal XBaseAmount) : ComplianceRuleParameters;
+
+/// <summary>
+/// Snapshot of the active compliance rules, tagged with the cache version it was loaded at.
+/// </summary>
+public sealed record ActiveComplianceRuleSet(
+    long Version,
+    DateTimeOffset LoadedAtUtc,
+    IReadOnlyList<ActiveComplianceRule> Rules
+);
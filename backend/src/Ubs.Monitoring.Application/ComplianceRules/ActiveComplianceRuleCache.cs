@@ -0,0 +1,125 @@
+using System.Text.Json;
+using Microsoft.Extensions.Logging;
+using Ubs.Monitoring.Domain.Entities;
+using Ubs.Monitoring.Domain.Enums;
+
+namespace Ubs.Monitoring.Application.ComplianceRules;
+
+/// <summary>
+/// Versioned, process-wide cache of the active compliance rules.
+/// </summary>
+/// <remarks>
+/// Rules are loaded once and their JSON parameters parsed into typed records, so evaluating a transaction
+/// costs no rule query and no JSON parsing. <see cref="Invalidate"/> bumps the version; a snapshot loaded at an
+/// older version is reloaded on next use. Snapshots also expire after <see cref="MaxAge"/>, which bounds how long
+/// changes made outside the API (or on another instance) go unnoticed.
+/// </remarks>
+public sealed class ActiveComplianceRuleCache : IActiveComplianceRuleCache
+{
+    /// <summary>
+    /// Maximum age of a snapshot before it is reloaded even without invalidation.
+    /// </summary>
+    public static readonly TimeSpan MaxAge = TimeSpan.FromMinutes(5);
+
+    private readonly ILogger<ActiveComplianceRuleCache> _logger;
+    private readonly SemaphoreSlim _loadLock = new(1, 1);
+    private ActiveComplianceRuleSet? _snapshot;
+    private long _version;
+
+    public ActiveComplianceRuleCache(ILogger<ActiveComplianceRuleCache> logger)
+    {
+        _logger = logger;
+    }
+
+    public long Version => Interlocked.Read(ref _version);
+
+    public async Task<ActiveComplianceRuleSet> GetAsync(IComplianceRuleRepository rules, CancellationToken ct)
+    {
+        var snapshot = Volatile.Read(ref _snapshot);
+        if (IsCurrent(snapshot))
+            return snapshot!;
+
+        await _loadLock.WaitAsync(ct);
+        try
+        {
+            // Another caller may have reloaded while this one was waiting
+            snapshot = _snapshot;
+            if (IsCurrent(snapshot))
+                return snapshot!;
+
+            // Read the version before loading: an invalidation during the load leaves this snapshot stale
+            var version = Version;
+            var active = await rules.GetActiveAsync(ct);
+
+            snapshot = new ActiveComplianceRuleSet(
+                version,
+                DateTimeOffset.UtcNow,
+                active.Select(Compile).OfType<ActiveComplianceRule>().ToList());
+
+            Volatile.Write(ref _snapshot, snapshot);
+
+            _logger.LogInformation("Loaded {Count} active compliance rules (cache version {Version})",
+                snapshot.Rules.Count, version);
+
+            return snapshot;
+        }
+        finally
+        {
+            _loadLock.Release();
+        }
+    }
+
+    public void Invalidate()
+    {
+        var version = Interlocked.Increment(ref _version);
+        _logger.LogInformation("Active compliance rule cache invalidated (version {Version})", version);
+    }
+
+    private bool IsCurrent(ActiveComplianceRuleSet? snapshot) =>
+        snapshot is not null &&
+        snapshot.Version == Version &&
+        DateTimeOffset.UtcNow - snapshot.LoadedAtUtc < MaxAge;
+
+    /// <summary>
+    /// Parses the parameters of a rule into their typed form.
+    /// </summary>
+    /// <returns>
+    /// The compiled rule, or <c>null</c> if its parameters cannot be parsed (the rule is then skipped and logged).
+    /// </returns>
+    private ActiveComplianceRule? Compile(ComplianceRule rule)
+    {
+        try
+        {
+            using var doc = JsonDocument.Parse(rule.ParametersJson);
+            var parameters = doc.RootElement;
+
+            ComplianceRuleParameters? typed = rule.RuleType switch
+            {
+                RuleType.DailyLimit =>
+                    new DailyLimitParameters(parameters.GetProperty("limitBaseAmount").GetDecimal()),
+
+                RuleType.BannedCountries =>
+                    new BannedCountriesParameters(parameters.GetProperty("countries")
+                        .EnumerateArray()
+                        .Select(c => c.GetString())
+                        .OfType<string>()
+                        .Select(c => c.Trim())
+                        .ToHashSet(StringComparer.OrdinalIgnoreCase)),
+
+                RuleType.Structuring =>
+                    new StructuringParameters(
+                        parameters.GetProperty("n").GetInt32(),
+                        parameters.GetProperty("xBaseAmount").GetDecimal()),
+
+                _ => null
+            };
+
+            return new ActiveComplianceRule(rule.Id, rule.Code, rule.RuleType, rule.Severity, rule.Scope, typed);
+        }
+        catch (Exception ex) when (ex is JsonException or KeyNotFoundException or InvalidOperationException or FormatException)
+        {
+            _logger.LogError(ex, "Skipping compliance rule {RuleCode}: invalid parameters", rule.Code);
+            return null;
+        }
+    }
+}
@@ -7,11 +7,16 @@ public sealed class ComplianceRuleService : IComplianceRuleService
 {
     private readonly IComplianceRuleRepository _repo;
     private readonly IComplianceRuleParametersValidator _validator;
+    private readonly IActiveComplianceRuleCache _ruleCache;
 
-    public ComplianceRuleService( IComplianceRuleRepository repo, IComplianceRuleParametersValidator validator)
+    public ComplianceRuleService(
+        IComplianceRuleRepository repo,
+        IComplianceRuleParametersValidator validator,
+        IActiveComplianceRuleCache ruleCache)
     {
         _repo = repo;
         _validator = validator;
+        _ruleCache = ruleCache;
     }
     /// <summary>
     /// Searches compliance rules using pagination and optional filtering criteria.
@@ -118,6 +123,9 @@ public sealed class ComplianceRuleService : IComplianceRuleService
 
             await _repo.SaveChangesAsync(ct);
 
+            // The next transaction evaluation must see the updated rule
+            _ruleCache.Invalidate();
+
             return new PatchComplianceRuleResult(
                 PatchComplianceRuleStatus.Success,
                 Rule: ComplianceRuleMapper.ToDto(rule));
@@ -0,0 +1,26 @@
+namespace Ubs.Monitoring.Application.ComplianceRules;
+
+/// <summary>
+/// In-process cache of the active compliance rules with pre-parsed parameters.
+/// </summary>
+public interface IActiveComplianceRuleCache
+{
+    /// <summary>
+    /// Current version of the cache. Incremented by every <see cref="Invalidate"/> call.
+    /// </summary>
+    long Version { get; }
+
+    /// <summary>
+    /// Returns the active rules, loading them through <paramref name="rules"/> when the cached snapshot is missing,
+    /// stale or was invalidated.
+    /// </summary>
+    /// <param name="rules">The repository used to load the rules on a cache miss.</param>
+    /// <param name="ct">Cancellation token.</param>
+    /// <returns>The snapshot of active rules.</returns>
+    Task<ActiveComplianceRuleSet> GetAsync(IComplianceRuleRepository rules, CancellationToken ct);
+
+    /// <summary>
+    /// Discards the cached rules so the next evaluation reloads them. Call after a rule is changed.
+    /// </summary>
+    void Invalidate();
+}
@@ -15,6 +15,7 @@ namespace Ubs.Monitoring.Application.Transactions.Compliance;
 public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
 {
     private readonly IComplianceRuleRepository _rules;
+    private readonly IActiveComplianceRuleCache _ruleCache;
     private readonly ITransactionRepository _transactions;
     private readonly ICaseRepository _cases;
     private readonly ILogger<TransactionComplianceChecker> _logger;
@@ -23,12 +24,14 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
 
     public TransactionComplianceChecker(
         IComplianceRuleRepository rules,
+        IActiveComplianceRuleCache ruleCache,
         ITransactionRepository transactions,
         ICaseRepository cases,
         ILogger<TransactionComplianceChecker> logger,
         ICaseNotificationPublisher caseNotifications)
     {
         _rules = rules;
+        _ruleCache = ruleCache;
         _transactions = transactions;
         _cases = cases;
         _logger = logger;
@@ -54,18 +57,12 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
                 return;
             }
 
-            var rules = await _rules.SearchAsync(
-                new ComplianceRuleQuery
-                {
-                    IsActive = true,
-                    Page = new() { Page = 1, PageSize = 100 }
-                },
-                ct
-            );
+            // Active rules with pre-parsed parameters; reloaded only after a rule change
+            var rules = await _ruleCache.GetAsync(_rules, ct);
 
             var violations = new List<ComplianceViolation>();
 
-            foreach (var rule in rules.Items)
+            foreach (var rule in rules.Rules)
             {
                 var violation = await EvaluateRuleAsync(rule, tx, ct);
                 if (violation is null)
@@ -105,20 +102,18 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// <returns>
     /// A <see cref="ComplianceViolation"/> if the rule is violated; otherwise, <c>null</c>.
     /// </returns>
-    private async Task<ComplianceViolation?> EvaluateRuleAsync( ComplianceRule rule, Transaction tx, CancellationToken ct)
+    private async Task<ComplianceViolation?> EvaluateRuleAsync(ActiveComplianceRule rule, Transaction tx, CancellationToken ct)
     {
-        using var doc = JsonDocument.Parse(rule.ParametersJson);
-
-        return rule.RuleType switch
+        return rule.Parameters switch
         {
-            RuleType.DailyLimit =>
-                await CheckDailyLimit(rule, doc.RootElement, tx, ct),
+            DailyLimitParameters parameters =>
+                await CheckDailyLimit(rule, parameters, tx, ct),
 
-            RuleType.BannedCountries =>
-                CheckBannedCountries(rule, doc.RootElement, tx),
+            BannedCountriesParameters parameters =>
+                CheckBannedCountries(rule, parameters, tx),
 
-            RuleType.Structuring =>
-                await CheckStructuring(rule, doc.RootElement, tx, ct),
+            StructuringParameters parameters =>
+                await CheckStructuring(rule, parameters, tx, ct),
 
             _ => null
         };
@@ -134,7 +129,7 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// The daily limit compliance rule being evaluated.
     /// </param>
     /// <param name="parameters">
-    /// The JSON parameters containing the daily limit configuration(<c>limitBaseAmount</c>).
+    /// The daily limit configuration (<c>limitBaseAmount</c>).
     /// </param>
     /// <param name="tx">
     /// The transaction being evaluated.
@@ -145,9 +140,9 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// <returns>
     /// A <see cref="ComplianceViolation"/> if the daily limit is exceeded; otherwise, <c>null</c>.
     /// </returns>
-    private async Task<ComplianceViolation?> CheckDailyLimit( ComplianceRule rule, JsonElement parameters, Transaction tx, CancellationToken ct)
+    private async Task<ComplianceViolation?> CheckDailyLimit(ActiveComplianceRule rule, DailyLimitParameters parameters, Transaction tx, CancellationToken ct)
     {
-        var limit = parameters.GetProperty("limitBaseAmount").GetDecimal();
+        var limit = parameters.LimitBaseAmount;
         var date = DateOnly.FromDateTime(tx.OccurredAtUtc.UtcDateTime);
 
         var total = rule.Scope == "PerAccount"
@@ -175,7 +170,7 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// The banned countries compliance rule being evaluated.
     /// </param>
     /// <param name="parameters">
-    /// The JSON parameters containing the list of banned country codes.
+    /// The set of banned country codes.
     /// </param>
     /// <param name="tx">
     /// The transaction being evaluated.
@@ -183,24 +178,18 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// <returns>
     /// A <see cref="ComplianceViolation"/> if the transaction involves a banned country; otherwise, <c>null</c>.
     /// </returns>
-    private ComplianceViolation? CheckBannedCountries(ComplianceRule rule,JsonElement parameters,Transaction tx)
+    private ComplianceViolation? CheckBannedCountries(ActiveComplianceRule rule, BannedCountriesParameters parameters, Transaction tx)
     {
+        if (tx.CpCountryCode is null || !parameters.Countries.Contains(tx.CpCountryCode))
+            return null;
 
-        foreach (var c in parameters.GetProperty("countries").EnumerateArray())
-        {
-            if (string.Equals(c.GetString(), tx.CpCountryCode, StringComparison.OrdinalIgnoreCase))
-            {
-                return new ComplianceViolation(
-                    rule.Id,
-                    rule.Code,
-                    rule.RuleType,
-                    rule.Severity,
-                    $"Transaction involves banned country {tx.CpCountryCode}"
-                );
-            }
-        }
-
-        return null;
+        return new ComplianceViolation(
+            rule.Id,
+            rule.Code,
+            rule.RuleType,
+            rule.Severity,
+            $"Transaction involves banned country {tx.CpCountryCode}"
+        );
     }
     /// <summary>
     /// Evaluates a structuring compliance rule against the given transaction.
@@ -213,7 +202,7 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// The structuring compliance rule being evaluated.
     /// </param>
     /// <param name="parameters">
-    /// The JSON parameters defining the structuring thresholds (<c>n</c> and <c>xBaseAmount</c>).
+    /// The structuring thresholds (<c>n</c> and <c>xBaseAmount</c>).
     /// </param>
     /// <param name="tx">
     /// The transaction being evaluated.
@@ -224,10 +213,10 @@ public sealed class TransactionComplianceChecker : ITransactionComplianceChecker
     /// <returns>
     /// A <see cref="ComplianceViolation"/> if structuring behavior is detected; otherwise, <c>null</c>.
     /// </returns>
-    private async Task<ComplianceViolation?> CheckStructuring(ComplianceRule rule,JsonElement parameters,Transaction tx,CancellationToken ct)
+    private async Task<ComplianceViolation?> CheckStructuring(ActiveComplianceRule rule, StructuringParameters parameters, Transaction tx, CancellationToken ct)
     {
-        var n = parameters.GetProperty("n").GetInt32();
-        var max = parameters.GetProperty("xBaseAmount").GetDecimal();
+        var n = parameters.N;
+        var max = parameters.XBaseAmount;
         var date = DateOnly.FromDateTime(tx.OccurredAtUtc.UtcDateTime);
 
         var count = rule.Scope == "PerAccount"
@@ -51,13 +51,13 @@ public interface ITransactionRepository
 
     // <summary>
     /// Gets the total base amount of transactions for a client on a specific date (UTC).
-    /// Intended for compliance rule evaluation.
+    /// Read from the daily transaction rollups. Intended for compliance rule evaluation.
     /// </summary>
     Task<decimal> GetDailyTotalByClientAsync(Guid clientId, DateOnly date, CancellationToken ct);
 
     /// <summary>
     /// Gets the total base amount of transactions for an account on a specific date (UTC).
-    /// Intended for compliance rule evaluation.
+    /// Read from the daily transaction rollups. Intended for compliance rule evaluation.
     /// </summary>
     Task<decimal> GetDailyTotalByAccountAsync(Guid accountId, DateOnly date, CancellationToken ct);
 
@@ -95,6 +95,8 @@ public interface ITransactionRepository
 
     /// <summary>
     /// Persists all pending changes to the database.
+    /// Newly added transactions are folded into the daily transaction rollups in the same database transaction
+    /// (as on any other save of the underlying context).
     /// </summary>
     /// <param name="ct">Cancellation token.</param>
     Task SaveChangesAsync(CancellationToken ct);
@@ -0,0 +1,24 @@
+using Ubs.Monitoring.Domain.Enums;
+
+namespace Ubs.Monitoring.Domain.Entities;
+
+/// <summary>
+/// Pre-aggregated transaction totals for one UTC day, account, transaction type and currency.
+/// Rows are maintained by the persistence layer whenever transactions are saved and are read-only for the application.
+/// </summary>
+public class TransactionDailyRollup
+{
+    private TransactionDailyRollup() { }
+
+    public DateOnly Day { get; private set; }
+
+    public Guid ClientId { get; private set; }
+    public Guid AccountId { get; private set; }
+
+    public TransactionType Type { get; private set; }
+    public string CurrencyCode { get; private set; } = null!;
+
+    public int TransactionCount { get; private set; }
+    public decimal TotalAmount { get; private set; }
+    public decimal TotalBaseAmount { get; private set; }
+}
@@ -25,6 +25,7 @@ namespace Ubs.Monitoring.Infrastructure;
 using Ubs.Monitoring.Application.AuditLogs;
 using Ubs.Monitoring.Infrastructure.Persistence.Repositories;
 using Ubs.Monitoring.Infrastructure.Persistence.Auditing;
+using Ubs.Monitoring.Infrastructure.Persistence.Rollups;
 
 public static class DependencyInjection
 {   
@@ -38,6 +39,7 @@ public static class DependencyInjection
             throw new InvalidOperationException("ConnectionStrings:Default is missing.");
 
         services.AddScoped<AuditSaveChangesInterceptor>();
+        services.AddScoped<TransactionRollupSaveChangesInterceptor>();
 
         services.AddDbContext<AppDbContext>((sp,options) =>
         {
@@ -46,7 +48,9 @@ public static class DependencyInjection
                 npgsql.MigrationsAssembly(typeof(AppDbContext).Assembly.FullName);
             });
 
-            options.AddInterceptors(sp.GetRequiredService<AuditSaveChangesInterceptor>());
+            options.AddInterceptors(
+                sp.GetRequiredService<AuditSaveChangesInterceptor>(),
+                sp.GetRequiredService<TransactionRollupSaveChangesInterceptor>());
         });
         // Seed
         services.Configure<SeedOptions>(config.GetSection("Seed"));
@@ -65,6 +69,7 @@ public static class DependencyInjection
         services.AddScoped<IComplianceRuleRepository, ComplianceRuleRepository>();
         services.AddScoped<IComplianceRuleParametersValidator, ComplianceRuleParametersValidator>();
         services.AddScoped<IComplianceRuleService, ComplianceRuleService>();
+        services.AddSingleton<IActiveComplianceRuleCache, ActiveComplianceRuleCache>();
         services.AddScoped<ITransactionComplianceChecker, TransactionComplianceChecker>();
         // Clients
         services.AddScoped<IClientRepository, ClientRepository>();
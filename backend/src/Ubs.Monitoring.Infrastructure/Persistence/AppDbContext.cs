@@ -16,6 +16,7 @@ public class AppDbContext : DbContext
     public DbSet<AccountIdentifier> AccountIdentifiers => Set<AccountIdentifier>();
     public DbSet<FxRate> FxRates => Set<FxRate>();
     public DbSet<Transaction> Transactions => Set<Transaction>();
+    public DbSet<TransactionDailyRollup> TransactionDailyRollups => Set<TransactionDailyRollup>();
     public DbSet<ComplianceRule> ComplianceRules => Set<ComplianceRule>();
     public DbSet<Case> Cases => Set<Case>();
     public DbSet<CaseFinding> CaseFindings => Set<CaseFinding>();
@@ -229,6 +230,31 @@ public class AppDbContext : DbContext
 
         });
 
+        // transaction_daily_rollups (maintained by TransactionRollupSaveChangesInterceptor)
+        modelBuilder.Entity<TransactionDailyRollup>(b =>
+        {
+            b.ToTable("transaction_daily_rollups");
+            b.HasKey(x => new { x.Day, x.AccountId, x.Type, x.CurrencyCode });
+
+            b.Property(x => x.CurrencyCode).HasColumnType("char(3)").IsRequired();
+            b.Property(x => x.TransactionCount).IsRequired();
+            b.Property(x => x.TotalAmount).HasPrecision(20, 2).IsRequired();
+            b.Property(x => x.TotalBaseAmount).HasPrecision(20, 2).IsRequired();
+
+            b.HasOne<Account>()
+                .WithMany()
+                .HasForeignKey(x => x.AccountId)
+                .OnDelete(DeleteBehavior.Restrict);
+
+            b.HasOne<Client>()
+                .WithMany()
+                .HasForeignKey(x => x.ClientId)
+                .OnDelete(DeleteBehavior.Restrict);
+
+            b.HasIndex(x => new { x.ClientId, x.Day })
+                .HasDatabaseName("ix_rollups_client_day");
+        });
+
         // compliance_rules
         modelBuilder.Entity<ComplianceRule>(b =>
         {
@@ -0,0 +1,74 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Ubs.Monitoring.Infrastructure.Persistence.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddTransactionDailyRollups : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateTable(
+                name: "transaction_daily_rollups",
+                columns: table => new
+                {
+                    Day = table.Column<DateOnly>(type: "date", nullable: false),
+                    AccountId = table.Column<Guid>(type: "uuid", nullable: false),
+                    Type = table.Column<int>(type: "integer", nullable: false),
+                    CurrencyCode = table.Column<string>(type: "char(3)", nullable: false),
+                    ClientId = table.Column<Guid>(type: "uuid", nullable: false),
+                    TransactionCount = table.Column<int>(type: "integer", nullable: false),
+                    TotalAmount = table.Column<decimal>(type: "numeric(20,2)", precision: 20, scale: 2, nullable: false),
+                    TotalBaseAmount = table.Column<decimal>(type: "numeric(20,2)", precision: 20, scale: 2, nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_transaction_daily_rollups", x => new { x.Day, x.AccountId, x.Type, x.CurrencyCode });
+                    table.ForeignKey(
+                        name: "FK_transaction_daily_rollups_accounts_AccountId",
+                        column: x => x.AccountId,
+                        principalTable: "accounts",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Restrict);
+                    table.ForeignKey(
+                        name: "FK_transaction_daily_rollups_clients_ClientId",
+                        column: x => x.ClientId,
+                        principalTable: "clients",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Restrict);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_transaction_daily_rollups_AccountId",
+                table: "transaction_daily_rollups",
+                column: "AccountId");
+
+            migrationBuilder.CreateIndex(
+                name: "ix_rollups_client_day",
+                table: "transaction_daily_rollups",
+                columns: new[] { "ClientId", "Day" });
+
+            // Backfill from the existing transactions (UTC calendar days)
+            migrationBuilder.Sql(@"
+                INSERT INTO transaction_daily_rollups
+                    (""Day"", ""AccountId"", ""Type"", ""CurrencyCode"", ""ClientId"",
+                     ""TransactionCount"", ""TotalAmount"", ""TotalBaseAmount"")
+                SELECT (t.""OccurredAtUtc"" AT TIME ZONE 'UTC')::date,
+                       t.""AccountId"", t.""Type"", t.""CurrencyCode"", t.""ClientId"",
+                       COUNT(*), SUM(t.""Amount""), SUM(t.""BaseAmount"")
+                FROM transactions t
+                GROUP BY 1, t.""AccountId"", t.""Type"", t.""CurrencyCode"", t.""ClientId"";
+            ");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "transaction_daily_rollups");
+        }
+    }
+}
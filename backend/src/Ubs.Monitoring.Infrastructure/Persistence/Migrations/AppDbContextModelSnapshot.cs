@@ -917,6 +917,44 @@ namespace Ubs.Monitoring.Infrastructure.Persistence.Migrations
                         });
                 });
 
+            modelBuilder.Entity("Ubs.Monitoring.Domain.Entities.TransactionDailyRollup", b =>
+                {
+                    b.Property<DateOnly>("Day")
+                        .HasColumnType("date");
+
+                    b.Property<Guid>("AccountId")
+                        .HasColumnType("uuid");
+
+                    b.Property<int>("Type")
+                        .HasColumnType("integer");
+
+                    b.Property<string>("CurrencyCode")
+                        .HasColumnType("char(3)");
+
+                    b.Property<Guid>("ClientId")
+                        .HasColumnType("uuid");
+
+                    b.Property<decimal>("TotalAmount")
+                        .HasPrecision(20, 2)
+                        .HasColumnType("numeric(20,2)");
+
+                    b.Property<decimal>("TotalBaseAmount")
+                        .HasPrecision(20, 2)
+                        .HasColumnType("numeric(20,2)");
+
+                    b.Property<int>("TransactionCount")
+                        .HasColumnType("integer");
+
+                    b.HasKey("Day", "AccountId", "Type", "CurrencyCode");
+
+                    b.HasIndex("AccountId");
+
+                    b.HasIndex("ClientId", "Day")
+                        .HasDatabaseName("ix_rollups_client_day");
+
+                    b.ToTable("transaction_daily_rollups", (string)null);
+                });
+
             modelBuilder.Entity("Ubs.Monitoring.Domain.Entities.Account", b =>
                 {
                     b.HasOne("Ubs.Monitoring.Domain.Entities.Client", "Client")
@@ -1038,6 +1076,21 @@ namespace Ubs.Monitoring.Infrastructure.Persistence.Migrations
                     b.Navigation("FxRate");
                 });
 
+            modelBuilder.Entity("Ubs.Monitoring.Domain.Entities.TransactionDailyRollup", b =>
+                {
+                    b.HasOne("Ubs.Monitoring.Domain.Entities.Account", null)
+                        .WithMany()
+                        .HasForeignKey("AccountId")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Ubs.Monitoring.Domain.Entities.Client", null)
+                        .WithMany()
+                        .HasForeignKey("ClientId")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+                });
+
             modelBuilder.Entity("Ubs.Monitoring.Domain.Entities.Account", b =>
                 {
                     b.Navigation("Cases");
@@ -0,0 +1,180 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Diagnostics;
+using Microsoft.EntityFrameworkCore.Storage;
+using Microsoft.Extensions.Logging;
+using Ubs.Monitoring.Domain.Entities;
+
+namespace Ubs.Monitoring.Infrastructure.Persistence.Rollups;
+
+/// <summary>
+/// Entity Framework Core interceptor that folds newly inserted transactions into <c>transaction_daily_rollups</c>
+/// during every <c>SaveChanges</c> operation.
+/// </summary>
+/// <remarks>
+/// Running on the context rather than in a repository keeps the rollups complete whichever service saves the
+/// pending transactions (e.g. an FX rate save during an import flushes the rows added before it).
+/// The inserts and their rollup updates commit (or roll back) in the same database transaction.
+/// </remarks>
+public sealed class TransactionRollupSaveChangesInterceptor : SaveChangesInterceptor
+{
+    private readonly ILogger<TransactionRollupSaveChangesInterceptor> _logger;
+
+    private Guid[] _addedIds = Array.Empty<Guid>();
+    private IDbContextTransaction? _ownedTransaction;
+
+    public TransactionRollupSaveChangesInterceptor(ILogger<TransactionRollupSaveChangesInterceptor> logger)
+    {
+        _logger = logger;
+    }
+    /// <summary>
+    /// Collects the transactions about to be inserted and opens a database transaction if none is active.
+    /// </summary>
+    public override InterceptionResult<int> SavingChanges(
+        DbContextEventData eventData,
+        InterceptionResult<int> result)
+    {
+        var db = eventData.Context;
+        if (db is null) return result;
+
+        if (CollectAddedTransactions(db) && db.Database.CurrentTransaction is null)
+            _ownedTransaction = db.Database.BeginTransaction();
+
+        return result;
+    }
+    /// <summary>
+    /// Collects the transactions about to be inserted and opens a database transaction if none is active.
+    /// </summary>
+    public override async ValueTask<InterceptionResult<int>> SavingChangesAsync(
+        DbContextEventData eventData,
+        InterceptionResult<int> result,
+        CancellationToken cancellationToken = default)
+    {
+        var db = eventData.Context;
+        if (db is null) return result;
+
+        if (CollectAddedTransactions(db) && db.Database.CurrentTransaction is null)
+            _ownedTransaction = await db.Database.BeginTransactionAsync(cancellationToken);
+
+        return result;
+    }
+    /// <summary>
+    /// Upserts the rollups of the inserted transactions and commits the transaction opened by this interceptor.
+    /// </summary>
+    public override int SavedChanges(SaveChangesCompletedEventData eventData, int result)
+    {
+        var db = eventData.Context;
+        if (db is null || _addedIds.Length == 0) return result;
+
+        try
+        {
+            db.Database.ExecuteSqlInterpolated(UpsertSql(_addedIds));
+            _ownedTransaction?.Commit();
+            _logger.LogDebug("Daily rollups updated for {Count} new transactions", _addedIds.Length);
+        }
+        finally
+        {
+            Reset();
+        }
+
+        return result;
+    }
+    /// <summary>
+    /// Upserts the rollups of the inserted transactions and commits the transaction opened by this interceptor.
+    /// </summary>
+    public override async ValueTask<int> SavedChangesAsync(
+        SaveChangesCompletedEventData eventData,
+        int result,
+        CancellationToken cancellationToken = default)
+    {
+        var db = eventData.Context;
+        if (db is null || _addedIds.Length == 0) return result;
+
+        try
+        {
+            await db.Database.ExecuteSqlInterpolatedAsync(UpsertSql(_addedIds), cancellationToken);
+            if (_ownedTransaction is not null)
+                await _ownedTransaction.CommitAsync(cancellationToken);
+            _logger.LogDebug("Daily rollups updated for {Count} new transactions", _addedIds.Length);
+        }
+        finally
+        {
+            await ResetAsync();
+        }
+
+        return result;
+    }
+    /// <summary>
+    /// Rolls back the transaction opened by this interceptor when the save fails.
+    /// </summary>
+    public override void SaveChangesFailed(DbContextErrorEventData eventData)
+    {
+        Reset();
+    }
+    /// <summary>
+    /// Rolls back the transaction opened by this interceptor when the save fails.
+    /// </summary>
+    public override async Task SaveChangesFailedAsync(
+        DbContextErrorEventData eventData,
+        CancellationToken cancellationToken = default)
+    {
+        await ResetAsync();
+    }
+    /// <summary>
+    /// Records the ids of the <see cref="Transaction"/> entities in the Added state.
+    /// </summary>
+    /// <remarks>
+    /// Collected before saving: persisted entries are no longer in the Added state afterwards.
+    /// </remarks>
+    /// <returns><c>true</c> if at least one transaction is about to be inserted.</returns>
+    private bool CollectAddedTransactions(DbContext db)
+    {
+        _addedIds = db.ChangeTracker.Entries<Transaction>()
+            .Where(e => e.State == EntityState.Added)
+            .Select(e => e.Entity.Id)
+            .ToArray();
+
+        return _addedIds.Length > 0;
+    }
+    /// <summary>
+    /// Adds the given (already inserted) transactions to their daily rollup rows, creating missing rows.
+    /// </summary>
+    /// <remarks>
+    /// Aggregation runs in the database from the stored rows, so the rollups use exactly the values the
+    /// raw queries would. Rows are upserted in key order to keep concurrent batches from deadlocking.
+    /// </remarks>
+    private static FormattableString UpsertSql(Guid[] transactionIds)
+    {
+        return $@"
+            INSERT INTO transaction_daily_rollups AS r
+                (""Day"", ""AccountId"", ""Type"", ""CurrencyCode"", ""ClientId"",
+                 ""TransactionCount"", ""TotalAmount"", ""TotalBaseAmount"")
+            SELECT (t.""OccurredAtUtc"" AT TIME ZONE 'UTC')::date,
+                   t.""AccountId"", t.""Type"", t.""CurrencyCode"", t.""ClientId"",
+                   COUNT(*), SUM(t.""Amount""), SUM(t.""BaseAmount"")
+            FROM transactions t
+            WHERE t.""Id"" = ANY({transactionIds})
+            GROUP BY 1, t.""AccountId"", t.""Type"", t.""CurrencyCode"", t.""ClientId""
+            ORDER BY 1, 2, 3, 4
+            ON CONFLICT (""Day"", ""AccountId"", ""Type"", ""CurrencyCode"") DO UPDATE SET
+                ""TransactionCount"" = r.""TransactionCount"" + EXCLUDED.""TransactionCount"",
+                ""TotalAmount"" = r.""TotalAmount"" + EXCLUDED.""TotalAmount"",
+                ""TotalBaseAmount"" = r.""TotalBaseAmount"" + EXCLUDED.""TotalBaseAmount""";
+    }
+    /// <summary>
+    /// Clears the collected ids and disposes the owned transaction (rolling it back if it was not committed).
+    /// </summary>
+    private void Reset()
+    {
+        _addedIds = Array.Empty<Guid>();
+        _ownedTransaction?.Dispose();
+        _ownedTransaction = null;
+    }
+
+    private async ValueTask ResetAsync()
+    {
+        _addedIds = Array.Empty<Guid>();
+        if (_ownedTransaction is not null)
+            await _ownedTransaction.DisposeAsync();
+        _ownedTransaction = null;
+    }
+}
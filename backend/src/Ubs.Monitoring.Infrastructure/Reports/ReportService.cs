@@ -4,6 +4,7 @@ using Microsoft.Extensions.Logging;
 using Ubs.Monitoring.Application.Clients;
 using Ubs.Monitoring.Application.Common.FileExport;
 using Ubs.Monitoring.Application.Reports;
+using Ubs.Monitoring.Domain.Entities;
 using Ubs.Monitoring.Domain.Enums;
 using Ubs.Monitoring.Infrastructure.Persistence;
 
@@ -39,94 +40,42 @@ public sealed class ReportService : IReportService
         }
 
         var (start, end) = NormalizeDateRange(startDate, endDate);
+        var (from, to) = UtcPeriod(start, end);
 
         _logger.LogInformation("Generating client report for {ClientId} from {Start} to {End}",
             clientId, start, end);
 
-        // Get transactions for the period
-        var transactions = await _db.Transactions
-            .AsNoTracking()
-            .Include(t => t.Account)
-            .Where(t => t.ClientId == clientId
-                && DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime) >= start
-                && DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime) <= end)
-            .ToListAsync(ct);
-
-        // Get cases for the period
-        var cases = await _db.Cases
-            .AsNoTracking()
-            .Where(c => c.ClientId == clientId
-                && DateOnly.FromDateTime(c.OpenedAtUtc.UtcDateTime) >= start
-                && DateOnly.FromDateTime(c.OpenedAtUtc.UtcDateTime) <= end)
-            .ToListAsync(ct);
-
-        // Calculate metrics
-        var transactionMetrics = new TransactionMetricsDto(
-            TotalTransactions: transactions.Count,
-            TotalVolumeUSD: transactions.Sum(t => t.BaseAmount),
-            AverageTransactionUSD: transactions.Count > 0 ? transactions.Average(t => t.BaseAmount) : 0,
-            DepositCount: transactions.Count(t => t.Type == TransactionType.Deposit),
-            WithdrawalCount: transactions.Count(t => t.Type == TransactionType.Withdrawal),
-            TransferCount: transactions.Count(t => t.Type == TransactionType.Transfer)
-        );
+        // All aggregates are computed by the database; only grouped rows reach the API.
+        // Transaction figures come from the daily rollups (the period is whole UTC days).
+        var rollups = RollupsInPeriod(start, end).Where(r => r.ClientId == clientId);
+        var cases = CasesInPeriod(from, to).Where(c => c.ClientId == clientId);
 
-        var caseMetrics = new CaseMetricsDto(
-            TotalCases: cases.Count,
-            NewCases: cases.Count(c => c.Status == CaseStatus.New),
-            UnderReviewCases: cases.Count(c => c.Status == CaseStatus.UnderReview),
-            ResolvedCases: cases.Count(c => c.Status == CaseStatus.Resolved),
-            FraudulentCases: cases.Count(c => c.Decision == CaseDecision.Fraudulent),
-            NotFraudulentCases: cases.Count(c => c.Decision == CaseDecision.NotFraudulent),
-            InconclusiveCases: cases.Count(c => c.Decision == CaseDecision.Inconclusive),
-            LowSeverityCases: cases.Count(c => c.Severity == Severity.Low),
-            MediumSeverityCases: cases.Count(c => c.Severity == Severity.Medium),
-            HighSeverityCases: cases.Count(c => c.Severity == Severity.High),
-            CriticalSeverityCases: cases.Count(c => c.Severity == Severity.Critical)
-        );
+        var transactionsByType = await GetTransactionsByTypeAsync(rollups, ct);
+        var transactionTrend = await GetTransactionTrendAsync(rollups, ct);
+        var caseCounts = await GetCaseCountsAsync(cases, ct);
 
-        // Transaction trend (line chart data)
-        var transactionTrend = transactions
-            .GroupBy(t => DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime))
-            .Select(g => new TransactionTrendDto(
-                Date: g.Key,
-                Count: g.Count(),
-                VolumeUSD: g.Sum(t => t.BaseAmount)
-            ))
-            .OrderBy(t => t.Date)
-            .ToList();
-
-        // Cases by severity (pie/bar chart data)
-        var casesBySeverity = cases
-            .GroupBy(c => c.Severity)
-            .Select(g => new CaseBySeverityDto(
-                Severity: g.Key,
-                Count: g.Count()
-            ))
-            .OrderBy(c => c.Severity)
-            .ToList();
+        // Top accounts by volume
+        var topAccountVolumes = await rollups
+            .GroupBy(r => r.AccountId)
+            .Select(g => new
+            {
+                AccountId = g.Key,
+                Count = g.Sum(r => r.TransactionCount),
+                Volume = g.Sum(r => r.TotalBaseAmount)
+            })
+            .OrderByDescending(a => a.Volume)
+            .ThenBy(a => a.AccountId)
+            .Take(10)
+            .ToListAsync(ct);
 
-        // Transactions by type (pie/bar chart data)
-        var transactionsByType = transactions
-            .GroupBy(t => t.Type)
-            .Select(g => new TransactionByTypeDto(
-                Type: g.Key,
-                Count: g.Count(),
-                VolumeUSD: g.Sum(t => t.BaseAmount)
-            ))
-            .OrderBy(t => t.Type)
-            .ToList();
+        var topAccountIds = topAccountVolumes.Select(a => a.AccountId).ToList();
+        var accountIdentifiers = await _db.Accounts
+            .AsNoTracking()
+            .Where(a => topAccountIds.Contains(a.Id))
+            .ToDictionaryAsync(a => a.Id, a => a.AccountIdentifier, ct);
 
-        // Top accounts by volume (grouping in-memory)
-        var topAccounts = transactions
-            .GroupBy(t => new { t.AccountId, t.Account.AccountIdentifier })
-            .Select(g => new TopAccountDto(
-                g.Key.AccountId,
-                g.Key.AccountIdentifier,
-                g.Count(),
-                g.Sum(t => t.BaseAmount)
-            ))
-            .OrderByDescending(a => a.TotalVolumeUSD)
-            .Take(10)
+        var topAccounts = topAccountVolumes
+            .Select(a => new TopAccountDto(a.AccountId, accountIdentifiers[a.AccountId], a.Count, a.Volume))
             .ToList();
 
         return new ClientReportDto(
@@ -136,10 +85,10 @@ public sealed class ReportService : IReportService
             RiskLevel: client.RiskLevel,
             PeriodStart: start,
             PeriodEnd: end,
-            TransactionMetrics: transactionMetrics,
-            CaseMetrics: caseMetrics,
+            TransactionMetrics: BuildTransactionMetrics(transactionsByType),
+            CaseMetrics: BuildCaseMetrics(caseCounts),
             TransactionTrend: transactionTrend,
-            CasesBySeverity: casesBySeverity,
+            CasesBySeverity: BuildCasesBySeverity(caseCounts),
             TransactionsByType: transactionsByType,
             TopAccounts: topAccounts
         );
@@ -151,102 +100,60 @@ public sealed class ReportService : IReportService
         CancellationToken ct)
     {
         var (start, end) = NormalizeDateRange(startDate, endDate);
+        var (from, to) = UtcPeriod(start, end);
 
         _logger.LogInformation("Generating system report from {Start} to {End}", start, end);
 
-        // Get all transactions for the period
-        var transactions = await _db.Transactions
-            .AsNoTracking()
-            .Include(t => t.Client)
-            .Where(t => DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime) >= start
-                && DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime) <= end)
-            .ToListAsync(ct);
-
-        // Get all cases for the period
-        var cases = await _db.Cases
-            .AsNoTracking()
-            .Include(c => c.Client)
-            .Where(c => DateOnly.FromDateTime(c.OpenedAtUtc.UtcDateTime) >= start
-                && DateOnly.FromDateTime(c.OpenedAtUtc.UtcDateTime) <= end)
-            .ToListAsync(ct);
+        // All aggregates are computed by the database; only grouped rows reach the API.
+        // Transaction figures come from the daily rollups (the period is whole UTC days).
+        var rollups = RollupsInPeriod(start, end);
+        var cases = CasesInPeriod(from, to);
 
         // Count total and active clients
         var totalClients = await _db.Clients.CountAsync(ct);
-        var activeClientIds = transactions.Select(t => t.ClientId).Distinct().ToList();
-        var activeClients = activeClientIds.Count;
-
-        // Calculate metrics
-        var transactionMetrics = new TransactionMetricsDto(
-            TotalTransactions: transactions.Count,
-            TotalVolumeUSD: transactions.Sum(t => t.BaseAmount),
-            AverageTransactionUSD: transactions.Count > 0 ? transactions.Average(t => t.BaseAmount) : 0,
-            DepositCount: transactions.Count(t => t.Type == TransactionType.Deposit),
-            WithdrawalCount: transactions.Count(t => t.Type == TransactionType.Withdrawal),
-            TransferCount: transactions.Count(t => t.Type == TransactionType.Transfer)
-        );
+        var activeClients = await rollups.Select(r => r.ClientId).Distinct().CountAsync(ct);
 
-        var caseMetrics = new CaseMetricsDto(
-            TotalCases: cases.Count,
-            NewCases: cases.Count(c => c.Status == CaseStatus.New),
-            UnderReviewCases: cases.Count(c => c.Status == CaseStatus.UnderReview),
-            ResolvedCases: cases.Count(c => c.Status == CaseStatus.Resolved),
-            FraudulentCases: cases.Count(c => c.Decision == CaseDecision.Fraudulent),
-            NotFraudulentCases: cases.Count(c => c.Decision == CaseDecision.NotFraudulent),
-            InconclusiveCases: cases.Count(c => c.Decision == CaseDecision.Inconclusive),
-            LowSeverityCases: cases.Count(c => c.Severity == Severity.Low),
-            MediumSeverityCases: cases.Count(c => c.Severity == Severity.Medium),
-            HighSeverityCases: cases.Count(c => c.Severity == Severity.High),
-            CriticalSeverityCases: cases.Count(c => c.Severity == Severity.Critical)
-        );
+        var transactionsByType = await GetTransactionsByTypeAsync(rollups, ct);
+        var transactionTrend = await GetTransactionTrendAsync(rollups, ct);
+        var caseCounts = await GetCaseCountsAsync(cases, ct);
 
-        // Transaction trend (line chart data)
-        var transactionTrend = transactions
-            .GroupBy(t => DateOnly.FromDateTime(t.OccurredAtUtc.UtcDateTime))
-            .Select(g => new TransactionTrendDto(
-                Date: g.Key,
-                Count: g.Count(),
-                VolumeUSD: g.Sum(t => t.BaseAmount)
-            ))
-            .OrderBy(t => t.Date)
-            .ToList();
-
-        // Cases by severity (pie/bar chart data)
-        var casesBySeverity = cases
-            .GroupBy(c => c.Severity)
-            .Select(g => new CaseBySeverityDto(
-                Severity: g.Key,
-                Count: g.Count()
-            ))
-            .OrderBy(c => c.Severity)
-            .ToList();
+        // Top clients by transaction volume, with their case count in the period
+        var topClientsByVolume = await rollups
+            .GroupBy(r => r.ClientId)
+            .Select(g => new
+            {
+                ClientId = g.Key,
+                Count = g.Sum(r => r.TransactionCount),
+                Volume = g.Sum(r => r.TotalBaseAmount)
+            })
+            .OrderByDescending(c => c.Volume)
+            .ThenBy(c => c.ClientId)
+            .Take(10)
+            .ToListAsync(ct);
 
-        // Transactions by type (pie/bar chart data)
-        var transactionsByType = transactions
-            .GroupBy(t => t.Type)
-            .Select(g => new TransactionByTypeDto(
-                Type: g.Key,
-                Count: g.Count(),
-                VolumeUSD: g.Sum(t => t.BaseAmount)
+        var volumeClientIds = topClientsByVolume.Select(c => c.ClientId).ToList();
+        var volumeClientNames = await _db.Clients
+            .AsNoTracking()
+            .Where(c => volumeClientIds.Contains(c.Id))
+            .ToDictionaryAsync(c => c.Id, c => c.Name, ct);
+        var caseCountByClient = await cases
+            .Where(c => volumeClientIds.Contains(c.ClientId))
+            .GroupBy(c => c.ClientId)
+            .Select(g => new { ClientId = g.Key, Count = g.Count() })
+            .ToDictionaryAsync(x => x.ClientId, x => x.Count, ct);
+
+        var topClientsByVolumeWithCases = topClientsByVolume
+            .Select(c => new ClientRankingDto(
+                ClientId: c.ClientId,
+                ClientName: volumeClientNames[c.ClientId],
+                TransactionCount: c.Count,
+                TotalVolumeUSD: c.Volume,
+                CaseCount: caseCountByClient.GetValueOrDefault(c.ClientId)
             ))
-            .OrderBy(t => t.Type)
             .ToList();
 
-        // Top clients by transaction volume (grouping in-memory)
-        var topClientsByVolume = transactions
-            .GroupBy(t => new { t.ClientId, t.Client.Name })
-            .Select(g => new ClientRankingDto(
-                g.Key.ClientId,
-                g.Key.Name,
-                g.Count(),
-                g.Sum(t => t.BaseAmount),
-                0 // Will be filled separately
-            ))
-            .OrderByDescending(c => c.TotalVolumeUSD)
-            .Take(10)
-            .ToList();
-
-        // Top clients by case count (grouping in-memory)
-        var topClientsByCases = cases
+        // Top clients by case count, with their transaction data in the period
+        var topClientsByCases = await cases
             .GroupBy(c => new { c.ClientId, c.Client.Name })
             .Select(g => new
             {
@@ -255,39 +162,40 @@ public sealed class ReportService : IReportService
                 CaseCount = g.Count()
             })
             .OrderByDescending(c => c.CaseCount)
+            .ThenBy(c => c.ClientId)
             .Take(10)
-            .ToList();
+            .ToListAsync(ct);
 
-        // Fill case counts for top clients by volume
-        var topClientsByVolumeWithCases = topClientsByVolume.Select(c =>
-        {
-            var caseCount = cases.Count(cs => cs.ClientId == c.ClientId);
-            return c with { CaseCount = caseCount };
-        }).ToList();
+        var caseClientIds = topClientsByCases.Select(c => c.ClientId).ToList();
+        var transactionsByClient = await rollups
+            .Where(r => caseClientIds.Contains(r.ClientId))
+            .GroupBy(r => r.ClientId)
+            .Select(g => new { ClientId = g.Key, Count = g.Sum(r => r.TransactionCount), Volume = g.Sum(r => r.TotalBaseAmount) })
+            .ToDictionaryAsync(x => x.ClientId, ct);
 
-        // Build top clients by cases with transaction data
-        var topClientsByCasesWithData = new List<ClientRankingDto>();
-        foreach (var client in topClientsByCases)
-        {
-            var txData = transactions.Where(t => t.ClientId == client.ClientId).ToList();
-            topClientsByCasesWithData.Add(new ClientRankingDto(
-                ClientId: client.ClientId,
-                ClientName: client.Name,
-                TransactionCount: txData.Count,
-                TotalVolumeUSD: txData.Sum(t => t.BaseAmount),
-                CaseCount: client.CaseCount
-            ));
-        }
+        var topClientsByCasesWithData = topClientsByCases
+            .Select(c =>
+            {
+                transactionsByClient.TryGetValue(c.ClientId, out var txData);
+                return new ClientRankingDto(
+                    ClientId: c.ClientId,
+                    ClientName: c.Name,
+                    TransactionCount: txData?.Count ?? 0,
+                    TotalVolumeUSD: txData?.Volume ?? 0m,
+                    CaseCount: c.CaseCount
+                );
+            })
+            .ToList();
 
         return new SystemReportDto(
             PeriodStart: start,
             PeriodEnd: end,
             TotalClients: totalClients,
             ActiveClients: activeClients,
-            TransactionMetrics: transactionMetrics,
-            CaseMetrics: caseMetrics,
+            TransactionMetrics: BuildTransactionMetrics(transactionsByType),
+            CaseMetrics: BuildCaseMetrics(caseCounts),
             TransactionTrend: transactionTrend,
-            CasesBySeverity: casesBySeverity,
+            CasesBySeverity: BuildCasesBySeverity(caseCounts),
             TransactionsByType: transactionsByType,
             TopClientsByVolume: topClientsByVolumeWithCases,
             TopClientsByCases: topClientsByCasesWithData
@@ -468,6 +376,118 @@ public sealed class ReportService : IReportService
 
     #region Private Helpers
 
+    /// <summary>
+    /// Case count for one (status, decision, severity) combination.
+    /// </summary>
+    private sealed record CaseCount(CaseStatus Status, CaseDecision? Decision, Severity Severity, int Count);
+
+    private IQueryable<TransactionDailyRollup> RollupsInPeriod(DateOnly start, DateOnly end)
+    {
+        // Day leads the primary key; (ClientId, Day) serves the client report
+        return _db.TransactionDailyRollups
+            .AsNoTracking()
+            .Where(r => r.Day >= start && r.Day <= end);
+    }
+
+    private IQueryable<Case> CasesInPeriod(DateTimeOffset from, DateTimeOffset to)
+    {
+        return _db.Cases
+            .AsNoTracking()
+            .Where(c => c.OpenedAtUtc >= from && c.OpenedAtUtc < to);
+    }
+
+    private static async Task<List<TransactionByTypeDto>> GetTransactionsByTypeAsync(
+        IQueryable<TransactionDailyRollup> rollups,
+        CancellationToken ct)
+    {
+        var rows = await rollups
+            .GroupBy(r => r.Type)
+            .Select(g => new { Type = g.Key, Count = g.Sum(r => r.TransactionCount), Volume = g.Sum(r => r.TotalBaseAmount) })
+            .OrderBy(t => t.Type)
+            .ToListAsync(ct);
+
+        return rows.Select(t => new TransactionByTypeDto(t.Type, t.Count, t.Volume)).ToList();
+    }
+
+    private static async Task<List<TransactionTrendDto>> GetTransactionTrendAsync(
+        IQueryable<TransactionDailyRollup> rollups,
+        CancellationToken ct)
+    {
+        var rows = await rollups
+            .GroupBy(r => r.Day)
+            .Select(g => new { Date = g.Key, Count = g.Sum(r => r.TransactionCount), Volume = g.Sum(r => r.TotalBaseAmount) })
+            .OrderBy(t => t.Date)
+            .ToListAsync(ct);
+
+        return rows.Select(t => new TransactionTrendDto(t.Date, t.Count, t.Volume)).ToList();
+    }
+
+    private static async Task<List<CaseCount>> GetCaseCountsAsync(IQueryable<Case> cases, CancellationToken ct)
+    {
+        var rows = await cases
+            .GroupBy(c => new { c.Status, c.Decision, c.Severity })
+            .Select(g => new { g.Key.Status, g.Key.Decision, g.Key.Severity, Count = g.Count() })
+            .ToListAsync(ct);
+
+        return rows.Select(c => new CaseCount(c.Status, c.Decision, c.Severity, c.Count)).ToList();
+    }
+
+    private static TransactionMetricsDto BuildTransactionMetrics(IReadOnlyList<TransactionByTypeDto> byType)
+    {
+        var total = byType.Sum(t => t.Count);
+        var volume = byType.Sum(t => t.VolumeUSD);
+
+        int CountOf(TransactionType type) => byType.Where(t => t.Type == type).Sum(t => t.Count);
+
+        return new TransactionMetricsDto(
+            TotalTransactions: total,
+            TotalVolumeUSD: volume,
+            AverageTransactionUSD: total > 0 ? volume / total : 0,
+            DepositCount: CountOf(TransactionType.Deposit),
+            WithdrawalCount: CountOf(TransactionType.Withdrawal),
+            TransferCount: CountOf(TransactionType.Transfer)
+        );
+    }
+
+    private static CaseMetricsDto BuildCaseMetrics(IReadOnlyList<CaseCount> counts)
+    {
+        int CountWhere(Func<CaseCount, bool> predicate) => counts.Where(predicate).Sum(c => c.Count);
+
+        return new CaseMetricsDto(
+            TotalCases: CountWhere(_ => true),
+            NewCases: CountWhere(c => c.Status == CaseStatus.New),
+            UnderReviewCases: CountWhere(c => c.Status == CaseStatus.UnderReview),
+            ResolvedCases: CountWhere(c => c.Status == CaseStatus.Resolved),
+            FraudulentCases: CountWhere(c => c.Decision == CaseDecision.Fraudulent),
+            NotFraudulentCases: CountWhere(c => c.Decision == CaseDecision.NotFraudulent),
+            InconclusiveCases: CountWhere(c => c.Decision == CaseDecision.Inconclusive),
+            LowSeverityCases: CountWhere(c => c.Severity == Severity.Low),
+            MediumSeverityCases: CountWhere(c => c.Severity == Severity.Medium),
+            HighSeverityCases: CountWhere(c => c.Severity == Severity.High),
+            CriticalSeverityCases: CountWhere(c => c.Severity == Severity.Critical)
+        );
+    }
+
+    private static List<CaseBySeverityDto> BuildCasesBySeverity(IReadOnlyList<CaseCount> counts)
+    {
+        return counts
+            .GroupBy(c => c.Severity)
+            .Select(g => new CaseBySeverityDto(
+                Severity: g.Key,
+                Count: g.Sum(c => c.Count)
+            ))
+            .OrderBy(c => c.Severity)
+            .ToList();
+    }
+
+    private static (DateTimeOffset From, DateTimeOffset To) UtcPeriod(DateOnly start, DateOnly end)
+    {
+        // UTC midnight of the first day; end is exclusive (midnight after the last day)
+        var from = new DateTimeOffset(start.ToDateTime(TimeOnly.MinValue, DateTimeKind.Utc));
+        var to = new DateTimeOffset(end.AddDays(1).ToDateTime(TimeOnly.MinValue, DateTimeKind.Utc));
+        return (from, to);
+    }
+
     private static (DateOnly Start, DateOnly End) NormalizeDateRange(DateOnly? startDate, DateOnly? endDate)
     {
         var end = endDate ?? DateOnly.FromDateTime(DateTime.UtcNow);
@@ -129,15 +129,12 @@ public sealed class TransactionRepository : ITransactionRepository
     {
         _logger.LogDebug("Calculating daily total by client {ClientId} on {Date}", clientId, date);
 
-        var (from, to) = UtcDayRange(date);
-
+        // Read from the daily rollups: one row per account/type/currency instead of one per transaction.
         // SumAsync on decimal returns 0 for empty sets in EF Core. If provider differs, wrap with DefaultIfEmpty(0m).
-        var total = await _db.Transactions
+        var total = await _db.TransactionDailyRollups
             .AsNoTracking()
-            .Where(t => t.ClientId == clientId &&
-                        t.OccurredAtUtc >= from &&
-                        t.OccurredAtUtc < to)
-            .SumAsync(t => t.BaseAmount, ct);
+            .Where(r => r.ClientId == clientId && r.Day == date)
+            .SumAsync(r => r.TotalBaseAmount, ct);
 
         _logger.LogDebug("Daily total by client {ClientId} on {Date}: {Total}", clientId, date, total);
 
@@ -148,14 +145,10 @@ public sealed class TransactionRepository : ITransactionRepository
     {
         _logger.LogDebug("Calculating daily total by account {AccountId} on {Date}", accountId, date);
 
-        var (from, to) = UtcDayRange(date);
-
-        var total = await _db.Transactions
+        var total = await _db.TransactionDailyRollups
             .AsNoTracking()
-            .Where(t => t.AccountId == accountId &&
-                        t.OccurredAtUtc >= from &&
-                        t.OccurredAtUtc < to)
-            .SumAsync(t => t.BaseAmount, ct);
+            .Where(r => r.AccountId == accountId && r.Day == date)
+            .SumAsync(r => r.TotalBaseAmount, ct);
 
         _logger.LogDebug("Daily total by account {AccountId} on {Date}: {Total}", accountId, date, total);
 
@@ -245,6 +238,7 @@ public sealed class TransactionRepository : ITransactionRepository
     {
         _logger.LogDebug("Saving transaction changes to database");
 
+        // Daily rollups are updated by TransactionRollupSaveChangesInterceptor on every save of the context
         await _db.SaveChangesAsync(ct);
 
         _logger.LogDebug("Transaction changes saved successfully");
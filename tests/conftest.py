@@ -1,9 +1,18 @@
+import asyncio
 import os
 import pytest
 from requests import RequestException
 
 from tests.helpers.api_client import ApiClient
+from tests.helpers.async_api_client import AsyncApiClient
+from tests.helpers.case_notifications import CaseNotificationListener
+from tests.helpers.data_factory import DataFactory
+from tests.helpers.fx_stub import SENTINEL_CURRENCY, SENTINEL_RATE, FxStubClient, FxStubServer, fresh_base_code
+from tests.helpers.metrics import EndpointMetrics
 from tests.helpers.assertions import assert_status
+from tests.helpers.parallel import is_xdist_controller, is_xdist_worker, shared_session_value, worker_id
+
+pytest_plugins = ["tests.helpers.perf_plugin"]
 
 
 def pytest_addoption(parser):
@@ -22,6 +31,88 @@ def pytest_addoption(parser):
         default=os.getenv("API_BASE_URL", "http://localhost:8080"),
         help="API base URL (default from API_BASE_URL or http://localhost:8080)",
     )
+    parser.addoption(
+        "--latency-json",
+        action="store",
+        default=os.getenv("API_LATENCY_JSON"),
+        help="Write per-endpoint latency histograms recorded by ApiClient to this JSON file at session end",
+    )
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=os.getenv("API_RUN_PERF", "") not in ("", "0", "false"),
+        help="Run the benchmarks marked `perf` (tests/perf); they are skipped otherwise (or set API_RUN_PERF=1)",
+    )
+    parser.addoption(
+        "--fx-stub-host",
+        action="store",
+        default=os.getenv("FX_STUB_HOST", "127.0.0.1"),
+        help=(
+            "Bind address of the local ExchangeRate-API stub (default from FX_STUB_HOST or 127.0.0.1). "
+            "Use 0.0.0.0 only when the API runs in a container: the stub's control endpoints are unauthenticated"
+        ),
+    )
+    parser.addoption(
+        "--fx-stub-port",
+        action="store",
+        type=int,
+        default=int(os.getenv("FX_STUB_PORT", "8099")),
+        help="Port of the local ExchangeRate-API stub (default from FX_STUB_PORT or 8099)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Prepare the run for pytest-xdist.
+
+    When tests are distributed (`pytest -n auto --dist loadgroup`), the controller
+    collects the latency histograms reported by every worker so that --latency-json
+    still produces a single file.
+    """
+    if is_xdist_controller(config):
+        config._worker_latency = EndpointMetrics()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip benchmarks unless --run-perf is given, and route every test marked
+    `serial` or using `fx_stub` to one xdist group.
+
+    Serial tests mutate global state (ComplianceRule rows) that other serial tests
+    read back; with `--dist loadgroup` they all run one after another on the same
+    worker while the rest of the suite runs in parallel. Tests driving the FX stub
+    change how the API converts currencies for everyone, and sharing the group also
+    means the stub is only ever started by that one worker. Runs first so the group
+    marker is in place before xdist derives the scheduling group from it.
+    """
+    if not config.getoption("--run-perf"):
+        skip_perf = pytest.mark.skip(reason="benchmark; run with --run-perf")
+        for item in items:
+            if item.get_closest_marker("perf") is not None:
+                item.add_marker(skip_perf)
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial") is not None or "fx_stub" in item.fixturenames:
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    xdist controller hook: merge the latency histograms reported by a finished worker.
+    """
+    data = getattr(node, "workeroutput", {}).get("latency")
+    if data and hasattr(node.config, "_worker_latency"):
+        node.config._worker_latency.merge(EndpointMetrics.from_dict(data))
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--latency-json")
+    if path and hasattr(session.config, "_worker_latency"):
+        session.config._worker_latency.dump(path)
 
 
 @pytest.fixture(scope="session")
@@ -59,7 +150,35 @@ def creds():
 
 
 @pytest.fixture(scope="session")
-def api(base_url):
+def endpoint_metrics(pytestconfig):
+    """
+    Session-wide per-endpoint latency registry shared by every ApiClient fixture.
+
+    If --latency-json (or API_LATENCY_JSON) is set, the registry is dumped
+    to that path when the session ends. If --perf-report is set, every request
+    is also forwarded to the perf report collector. Under pytest-xdist each worker
+    hands its registry to the controller, which writes the merged file.
+
+    Returns:
+        EndpointMetrics instance.
+    """
+    metrics = EndpointMetrics()
+    collector = pytestconfig.pluginmanager.get_plugin("perf-collector")
+    if collector is not None and collector.path:
+        metrics.add_listener(collector.on_request)
+    yield metrics
+
+    path = pytestconfig.getoption("--latency-json")
+    if not path:
+        return
+    if is_xdist_worker(pytestconfig):
+        pytestconfig.workeroutput["latency"] = metrics.to_dict()
+    else:
+        metrics.dump(path)
+
+
+@pytest.fixture(scope="session")
+def api(base_url, endpoint_metrics):
     """
     Create a unauthenticated ApiClient instance.
 
@@ -71,7 +190,7 @@ def api(base_url):
     Returns:
         ApiClient without JWT token.
     """
-    return ApiClient(base_url)
+    return ApiClient(base_url, metrics=endpoint_metrics)
 
 
 @pytest.fixture(scope="session")
@@ -103,7 +222,7 @@ def api_up(api):
 
 
 @pytest.fixture(scope="session")
-def token(api, api_up, creds):
+def token(api, api_up, creds, tmp_path_factory):
     """
     Authenticate using the test analyst credentials and obtain a JWT token.
 
@@ -111,21 +230,26 @@ def token(api, api_up, creds):
         - api_up: ensures the API is alive
         - creds: provides login credentials
 
+    Under pytest-xdist the login happens once per run and the token is shared
+    by every worker.
+
     Returns:
         JWT token string.
 
     Raises:
         AssertionError: If login fails or no token is returned.
     """
-    r = api.auth_login(creds["email"], creds["password"])
-    assert_status(r, 200)
+    def login():
+        r = api.auth_login(creds["email"], creds["password"])
+        assert_status(r, 200)
 
-    data = r.json()
-    t = data.get("token")
-    if not t:
-        raise AssertionError(f"Login did not return token. Body={data}")
+        data = r.json()
+        t = data.get("token")
+        if not t:
+            raise AssertionError(f"Login did not return token. Body={data}")
+        return t
 
-    return t
+    return shared_session_value(tmp_path_factory, f"token-{creds['email']}", login)
 
 
 @pytest.fixture(scope="session")
@@ -141,6 +265,104 @@ def authed(api, token):
     return api.with_token(token)
 
 
+@pytest.fixture(scope="session")
+def data_factory(authed, api_up):
+    """
+    Session-wide pool of fresh clients and accounts.
+
+    The first batch is created in bulk (POST /api/clients/import + concurrent
+    account creation) when the fixture is set up; further batches are created
+    on demand. Each (client, account) pair is handed out to a single test.
+    Generated names are prefixed with the xdist worker id so that workers
+    never pick up each other's data.
+
+    Returns:
+        DataFactory instance.
+    """
+    factory = DataFactory(authed, namespace=f"Factory-{worker_id()}")
+    factory.prefill(factory.batch_size)
+    return factory
+
+
+@pytest.fixture(scope="session")
+def fx_stub(pytestconfig):
+    """
+    Local stand-in for ExchangeRate-API, serving deterministic rate tables.
+
+    The API under test only uses it when started with
+        ExchangeRateApi__BaseUrl=http://<this host>:<--fx-stub-port>/v6
+    (see docker-compose.yml). The stub is started the first time a test asks for it;
+    under pytest-xdist every such test runs on the worker owning the `serial` group
+    (see pytest_collection_modifyitems), so only that worker binds the port.
+
+    Returns:
+        FxStubClient used to inject latency, jitter and failures.
+    """
+    server = FxStubServer(pytestconfig.getoption("--fx-stub-host"), pytestconfig.getoption("--fx-stub-port"))
+    try:
+        server.start()
+    except OSError as ex:
+        pytest.skip(f"Could not start FX stub on {server.host}:{server.port}: {ex}")
+    try:
+        yield FxStubClient(server.url)
+    finally:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def fx_upstream(authed, api_up, fx_stub):
+    """
+    The FX stub, provided the API under test is configured to call it.
+
+    The stub quotes the ISO test currency XTS at a fixed rate; any other upstream
+    would not, so this tells whether ExchangeRateApi:BaseUrl points here. The probe
+    uses a never-seen base currency so it leaves the API's base-currency (USD) rate
+    cache untouched.
+
+    Returns:
+        FxStubClient.
+    """
+    r = authed.exchange_rate_get(fresh_base_code(), SENTINEL_CURRENCY)
+    if r.status_code != 200 or float(r.json().get("rate", 0)) != SENTINEL_RATE:
+        pytest.skip(
+            "API is not using the local FX stub. Start it with "
+            f"ExchangeRateApi__BaseUrl={fx_stub.api_base_url.replace('127.0.0.1', 'host.docker.internal')}"
+        )
+    return fx_stub
+
+
+@pytest.fixture(scope="session")
+def case_notifications(base_url, token, api_up):
+    """
+    Session-wide SignalR listener on /hubs/cases.
+
+    The connection is opened once; tests wait for their own `caseOpened`
+    notification with `expect_client(client_id)` / `expect_case(case_id)`.
+
+    Returns:
+        Started CaseNotificationListener.
+    """
+    pytest.importorskip("signalrcore")
+    listener = CaseNotificationListener(f"{base_url}/hubs/cases", token)
+    try:
+        listener.start()
+    except ConnectionError as ex:
+        pytest.fail(f"{ex} Check hub mapping and auth/JWT on the hub.")
+    yield listener
+    listener.stop()
+
+
+@pytest.fixture(scope="session")
+def record_benchmark(pytestconfig):
+    """
+    Record a benchmark result in the perf report and the terminal summary.
+
+    Returns:
+        Callable (name, result dict); see PerfCollector.record_benchmark.
+    """
+    return pytestconfig.pluginmanager.get_plugin("perf-collector").record_benchmark
+
+
 @pytest.fixture(scope="session")
 def me(authed, api_up):
     """
@@ -157,3 +379,34 @@ def me(authed, api_up):
     r = authed.auth_me()
     assert_status(r, 200)
     return r.json()
+
+
+@pytest.fixture(scope="session")
+def async_api(base_url):
+    """
+    Create an unauthenticated AsyncApiClient instance.
+
+    asyncio counterpart of the `api` fixture, used to keep many requests in flight
+    from a single process (e.g. load tests against /api/transactions).
+
+    The connection pool it shares with `async_authed` is closed at session end.
+
+    Returns:
+        AsyncApiClient without JWT token.
+    """
+    client = AsyncApiClient(base_url)
+    yield client
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture(scope="session")
+def async_authed(async_api, token):
+    """
+    Create an authenticated AsyncApiClient using the session JWT token.
+
+    Shares the connection pool of `async_api`.
+
+    Returns:
+        AsyncApiClient instance with Authorization header configured.
+    """
+    return async_api.with_token(token)
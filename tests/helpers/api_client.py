@@ -1,5 +1,27 @@
-import requests
-import io
+import time
+from collections.abc import Callable
+
+from tests.helpers.downloads import CHUNK_SIZE, StreamedDownload
+from tests.helpers.metrics import EndpointMetrics, route_template
+from tests.helpers.multipart import StreamingMultipart, UploadProgress, UploadSource
+from tests.helpers.paging import MAX_PAGE_SIZE, iter_items, paged_items, scan_pages
+from tests.helpers.transport import HttpTransport
+
+
+def _body_size(body) -> int:
+    """
+    Best-effort size in bytes of a prepared request body.
+    """
+    if body is None:
+        return 0
+    if isinstance(body, StreamingMultipart):
+        return body.bytes_sent
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        return 0
 
 
 class ApiClient:
@@ -7,7 +29,14 @@ class ApiClient:
     HTTP client wrapper used by pytest integration tests to interact with the UBS Monitoring API.
     """
 
-    def __init__(self, base_url: str, token: str | None = None, timeout: int = 15):
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: int = 15,
+        transport: HttpTransport | None = None,
+        metrics: EndpointMetrics | None = None,
+    ):
         """
         Initialize the API client.
 
@@ -15,17 +44,23 @@ class ApiClient:
             base_url: Root URL of the API (e.g. "http://localhost:8080").
             token: Optional JWT bearer token used for authenticated requests.
             timeout: Default timeout (in seconds) applied to all HTTP requests.
+            transport: Optional shared connection pool. A new default HttpTransport is created when omitted.
+            metrics: Optional per-endpoint measurement registry. A new EndpointMetrics is created when omitted.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
+        self.transport = transport or HttpTransport()
+        self.session = self.transport.session
+        self.metrics = metrics if metrics is not None else EndpointMetrics()
         self.token = token
 
     def with_token(self, token: str) -> "ApiClient":
         """
         New ApiClient instance sharing the same base configuration but authenticated with a different JWT token.
 
-        Useful to keep the original client immutable.
+        Useful to keep the original client immutable. The derived client shares the connection
+        pool (HttpTransport) and the EndpointMetrics registry of this instance, so no new TCP/TLS
+        connections are opened for it and its requests land in the same latency survey.
 
         Args:
             token: JWT bearer token.
@@ -33,7 +68,22 @@ class ApiClient:
         Returns:
             New ApiClient instance with the given token.
         """
-        return ApiClient(self.base_url, token=token, timeout=self.timeout)
+        return ApiClient(
+            self.base_url,
+            token=token,
+            timeout=self.timeout,
+            transport=self.transport,
+            metrics=self.metrics,
+        )
+
+    def pool_stats(self) -> dict:
+        """
+        Connection pool counters of the shared transport (opened, reused, waited, ...).
+
+        Returns:
+            Dictionary snapshot of PoolStats.
+        """
+        return self.transport.stats.snapshot()
 
     def _headers(self, extra: dict | None = None) -> dict:
         """
@@ -66,58 +116,62 @@ class ApiClient:
 
         This is used internally for negative test cases
         (e.g. invalid JSON, missing body, wrong content-type).
-        """
-        return self.session.request(
-            method=method,
-            url=f"{self.base_url}{path}",
-            headers=self._headers(kwargs.pop("headers", None)),
-            timeout=kwargs.pop("timeout", self.timeout),
-            **kwargs,
+
+        Every call is recorded in `self.metrics` under its route template with
+        status, bytes in/out and wall-clock latency.
+        """
+        stream = kwargs.get("stream", False)
+        started = time.perf_counter()
+        try:
+            resp = self.session.request(
+                method=method,
+                url=f"{self.base_url}{path}",
+                headers=self._headers(kwargs.pop("headers", None)),
+                timeout=kwargs.pop("timeout", self.timeout),
+                **kwargs,
+            )
+        except Exception:
+            self.metrics.record(method, route_template(path), 0, 0, 0, time.perf_counter() - started)
+            raise
+
+        elapsed = time.perf_counter() - started
+        if stream:
+            bytes_in = int(resp.headers.get("Content-Length") or 0)
+        else:
+            bytes_in = len(resp.content)
+        self.metrics.record(
+            method,
+            route_template(path),
+            resp.status_code,
+            _body_size(resp.request.body),
+            bytes_in,
+            elapsed,
         )
+        return resp
 
     def get(self, path: str, **kwargs):
         """
         Execute a HTTP GET request.
         """
-        return self.session.get(
-            f"{self.base_url}{path}",
-            headers=self._headers(kwargs.pop("headers", None)),
-            timeout=kwargs.pop("timeout", self.timeout),
-            **kwargs,
-        )
+        return self.request("GET", path, **kwargs)
 
     def post(self, path: str, **kwargs):
         """
         Execute a HTTP POST request.
         """
-        return self.session.post(
-            f"{self.base_url}{path}",
-            headers=self._headers(kwargs.pop("headers", None)),
-            timeout=kwargs.pop("timeout", self.timeout),
-            **kwargs,
-        )
+        return self.request("POST", path, **kwargs)
 
     def put(self, path: str, **kwargs):
         """
         Execute an HTTP PUT request.
         """
-        return self.session.put(
-            f"{self.base_url}{path}",
-            headers=self._headers(kwargs.pop("headers", None)),
-            timeout=kwargs.pop("timeout", self.timeout),
-            **kwargs,
-        )
+        return self.request("PUT", path, **kwargs)
 
     def patch(self, path: str, **kwargs):
         """
         Execute an HTTP PATCH request.
         """
-        return self.session.patch(
-            f"{self.base_url}{path}",
-            headers=self._headers(kwargs.pop("headers", None)),
-            timeout=kwargs.pop("timeout", self.timeout),
-            **kwargs,
-        )
+        return self.request("PATCH", path, **kwargs)
 
     def post_raw(self, path: str, data: bytes, content_type: str, headers=None):
         """
@@ -132,6 +186,49 @@ class ApiClient:
 
         return self.request("POST", path, data=data, headers=h)
 
+    def upload(
+        self,
+        path: str,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
+        """
+        POST a multipart/form-data request with a single "file" field, streamed in chunks.
+
+        Args:
+            path: Endpoint path.
+            file_name: File name sent in the form part (its extension selects the server parser).
+            source: File contents as bytes, a file path, a binary file object or an iterable of
+                byte chunks (e.g. import_files.csv_chunks); never read fully into memory.
+            content_type: Content type of the file part.
+            timeout: Request timeout in seconds (defaults to the client timeout).
+            on_progress: Called with UploadProgress snapshots while the body is sent, and
+                once more with the final bytes sent and send rate.
+        """
+        body = StreamingMultipart(file_name, source, content_type, on_progress=on_progress)
+        return self.post(path, data=body, headers={"Content-Type": body.content_type}, timeout=timeout or self.timeout)
+
+    def download(
+        self,
+        path: str,
+        params: dict | None = None,
+        timeout: float | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> StreamedDownload:
+        """
+        GET a file without buffering its body.
+
+        The returned StreamedDownload reads the body chunk by chunk (to disk or as CSV rows)
+        and measures time-to-first-byte, total time and throughput from the moment the
+        request was sent.
+        """
+        started = time.perf_counter()
+        resp = self.get(path, params=params or {}, stream=True, timeout=timeout or self.timeout)
+        return StreamedDownload(resp, started, chunk_size)
+
     # -------------------------------------------------
     # Convenience API calls
     # -------------------------------------------------
@@ -241,15 +338,19 @@ class ApiClient:
         """
         return self.get(f"/api/clients/{client_id}")
 
-    def clients_import(self, file_name: str, file_bytes: bytes, content_type: str = "text/csv"):
+    def clients_import(
+        self,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
         """
         Endpoint:
-            POST /api/clients/import (multipart form-data)
+            POST /api/clients/import (multipart form-data, streamed; see upload())
         """
-        files = {
-            "file": (file_name, io.BytesIO(file_bytes), content_type),
-        }
-        return self.post("/api/clients/import", files=files)
+        return self.upload("/api/clients/import", file_name, source, content_type, timeout, on_progress)
 
     # -------- Accounts --------
 
@@ -274,15 +375,22 @@ class ApiClient:
         """
         return self.get(f"/api/accounts/{account_id}")
 
-    def accounts_import(self, client_id: str, file_name: str, file_bytes: bytes):
+    def accounts_import(
+        self,
+        client_id: str,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
         """
         Endpoint:
-            POST /api/clients/{clientId}/accounts/import (multipart form-data)
+            POST /api/clients/{clientId}/accounts/import (multipart form-data, streamed; see upload())
         """
-        files = {
-            "file": (file_name, io.BytesIO(file_bytes), "text/csv"),
-        }
-        return self.post(f"/api/clients/{client_id}/accounts/import", files=files)
+        return self.upload(
+            f"/api/clients/{client_id}/accounts/import", file_name, source, content_type, timeout, on_progress
+        )
     
     # -------- Account Identifiers --------
     def account_identifiers_get_by_account(self, account_id: str):
@@ -310,10 +418,17 @@ class ApiClient:
         # GET /api/transactions/{transactionId}
         return self.get(f"/api/transactions/{transaction_id}")
 
-    def transactions_import(self, file_name: str, file_bytes: bytes, content_type: str = "text/csv"):
-        # POST /api/transactions/import (multipart form-data)
-        files = {"file": (file_name, io.BytesIO(file_bytes), content_type)}
-        return self.post("/api/transactions/import", files=files)
+    def transactions_import(
+        self,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
+        # POST /api/transactions/import (multipart form-data, streamed; see upload()); large files may need a longer timeout
+        return self.upload("/api/transactions/import", file_name, source, content_type, timeout, on_progress)
+
     # -------- Cases --------
     def cases_search(self, params: dict | None = None):
         # GET /api/cases
@@ -327,5 +442,95 @@ class ApiClient:
         # GET /api/cases/{caseId}/findings
         return self.get(f"/api/cases/{case_id}/findings", params=params or {})
 
+    # -------- Audit Logs --------
+    def audit_logs_search(self, params: dict | None = None):
+        # GET /api/audit-logs
+        return self.get("/api/audit-logs", params=params or {})
+
+    def audit_log_get(self, audit_log_id: str):
+        # GET /api/audit-logs/{id}
+        return self.get(f"/api/audit-logs/{audit_log_id}")
+
+    # -------- Exchange Rates --------
+    def exchange_rate_get(self, base_currency: str, quote_currency: str):
+        # GET /api/exchangerates/{baseCurrency}/{quoteCurrency}
+        return self.get(f"/api/exchangerates/{base_currency}/{quote_currency}")
 
+    def exchange_rates_get(self, base_currency: str):
+        # GET /api/exchangerates/{baseCurrency}
+        return self.get(f"/api/exchangerates/{base_currency}")
 
+    def exchange_rates_convert(self, payload: dict):
+        # POST /api/exchangerates/convert
+        return self.post("/api/exchangerates/convert", json=payload)
+
+    # -------- Reports --------
+    def report_client(self, client_id: str, params: dict | None = None):
+        # GET /api/reports/client/{clientId}
+        return self.get(f"/api/reports/client/{client_id}", params=params or {})
+
+    def report_system(self, params: dict | None = None):
+        # GET /api/reports/system
+        return self.get("/api/reports/system", params=params or {})
+
+    def report_client_export_csv(
+        self, client_id: str, params: dict | None = None, timeout: float | None = None
+    ) -> StreamedDownload:
+        # GET /api/reports/client/{clientId}/export/csv (streamed; see download())
+        return self.download(f"/api/reports/client/{client_id}/export/csv", params, timeout)
+
+    def report_system_export_csv(self, params: dict | None = None, timeout: float | None = None) -> StreamedDownload:
+        # GET /api/reports/system/export/csv (streamed; see download())
+        return self.download("/api/reports/system/export/csv", params, timeout)
+
+    # -------------------------------------------------
+    # Lazy paginated iterators
+    # -------------------------------------------------
+    #
+    # Each iterator walks every page of the endpoint, fetching page N+1 in the
+    # background while the caller consumes page N (at most two pages in memory).
+
+    def iter_transactions(self, filter: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+        # GET /api/transactions (all pages)
+        return iter_items(self.transactions_search, filter, page_size=page_size, prefetch=prefetch)
+
+    def iter_cases(self, filter: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+        # GET /api/cases (all pages)
+        return iter_items(self.cases_search, filter, page_size=page_size, prefetch=prefetch)
+
+    def iter_rules(self, query: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+        # GET /api/rules (all pages)
+        return iter_items(self.rules_search, query, page_size=page_size, prefetch=prefetch)
+
+    def iter_audit_logs(self, query: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+        # GET /api/audit-logs (all pages)
+        return iter_items(self.audit_logs_search, query, page_size=page_size, prefetch=prefetch)
+
+    def scan_all(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        page_size: int = MAX_PAGE_SIZE,
+        detect_duplicates: bool = True,
+    ):
+        """
+        Full scan of a paged endpoint (e.g. "/api/transactions", "/api/audit-logs") with up to
+        `concurrency` pages fetched in parallel once the first page reports `totalPages`.
+
+        Rows are yielded in page order, or as pages arrive when `ordered=False`.
+        Raises PageDriftError if rows are inserted/removed mid-scan (see paging.scan_pages).
+        Use a transport with pool_maxsize >= concurrency to avoid discarded connections.
+        """
+        pages = scan_pages(
+            lambda p: self.get(endpoint, params=p),
+            params,
+            concurrency=concurrency,
+            ordered=ordered,
+            page_size=page_size,
+            detect_duplicates=detect_duplicates,
+        )
+        for _, body in pages:
+            yield from paged_items(body)
@@ -0,0 +1,381 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+
+from tests.helpers.multipart import StreamingMultipart, UploadProgress, UploadSource
+
+
+class _AsyncTransport:
+    """
+    Pooled httpx.AsyncClient shared by an AsyncApiClient and every client derived from it.
+
+    httpx connection pools are bound to the event loop that created them, so the underlying
+    AsyncClient is created lazily and recreated when used from a different loop
+    (e.g. one asyncio.run() per test). A pool can only be closed from its own loop: each one
+    is paired with a task that closes it when cancelled, which asyncio.run() does to leftover
+    tasks before closing the loop.
+    """
+
+    def __init__(self, timeout: float, max_connections: int, max_keepalive_connections: int):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closer: asyncio.Task | None = None
+
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            self._loop = loop
+            self._closer = loop.create_task(self._close_when_cancelled(self._client))
+        return self._client
+
+    @staticmethod
+    async def _close_when_cancelled(client: httpx.AsyncClient):
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+
+    async def aclose(self):
+        closer, loop = self._closer, self._loop
+        self._client, self._loop, self._closer = None, None, None
+        if closer is None or closer.done():
+            return
+        if loop is asyncio.get_running_loop():
+            closer.cancel()
+            await asyncio.wait({closer})
+        # Otherwise the pool belongs to another loop, which closes it when it shuts down.
+
+
+class AsyncApiClient:
+    """
+    asyncio counterpart of ApiClient used to keep many requests in flight from a single process.
+
+    Every endpoint method mirrors the ApiClient method of the same name but is a coroutine
+    returning an httpx.Response. The ApiClient helpers built on its threaded transport are
+    sync-only: the lazy iter_* iterators, scan_all, pool_stats and the streamed downloads
+    (download and the report_*_export_csv calls). Use it as an async context manager inside
+    each event loop so pooled connections are released when the loop finishes:
+
+        async with async_authed:
+            responses = await asyncio.gather(*(async_authed.transaction_create(p) for p in payloads))
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: int = 15,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        _transport: _AsyncTransport | None = None,
+    ):
+        """
+        Initialize the async API client.
+
+        Args:
+            base_url: Root URL of the API (e.g. "http://localhost:8080").
+            token: Optional JWT bearer token used for authenticated requests.
+            timeout: Default timeout (in seconds) applied to all HTTP requests.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive in the pool.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.token = token
+        self._transport = _transport or _AsyncTransport(timeout, max_connections, max_keepalive_connections)
+
+    def with_token(self, token: str) -> "AsyncApiClient":
+        """
+        New AsyncApiClient authenticated with a different JWT token.
+
+        The derived client shares the connection pool of this instance.
+
+        Args:
+            token: JWT bearer token.
+
+        Returns:
+            New AsyncApiClient instance with the given token.
+        """
+        return AsyncApiClient(self.base_url, token=token, timeout=self.timeout, _transport=self._transport)
+
+    async def aclose(self):
+        """
+        Close the pooled connections of this client (and of every client sharing its pool).
+        """
+        await self._transport.aclose()
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _headers(self, extra: dict | None = None) -> dict:
+        """
+        Build the HTTP headers for a request (same rules as ApiClient._headers).
+        """
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    # -------------------------------------------------
+    # Low-level request helpers
+    # -------------------------------------------------
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Execute a raw HTTP request.
+
+        Accepts httpx keyword arguments (params, json, content, files, ...).
+        """
+        return await self._transport.client().request(
+            method,
+            f"{self.base_url}{path}",
+            headers=self._headers(kwargs.pop("headers", None)),
+            timeout=kwargs.pop("timeout", self.timeout),
+            **kwargs,
+        )
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        """
+        Execute a HTTP GET request.
+        """
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> httpx.Response:
+        """
+        Execute a HTTP POST request.
+        """
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> httpx.Response:
+        """
+        Execute an HTTP PUT request.
+        """
+        return await self.request("PUT", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> httpx.Response:
+        """
+        Execute an HTTP PATCH request.
+        """
+        return await self.request("PATCH", path, **kwargs)
+
+    async def post_raw(self, path: str, data: bytes, content_type: str, headers=None) -> httpx.Response:
+        """
+        Send a raw POST request, used for negative cases:
+            - invalid JSON
+            - missing body
+            - wrong content type
+        """
+        h = {"Content-Type": content_type}
+        if headers:
+            h.update(headers)
+
+        return await self.request("POST", path, content=data, headers=h)
+
+    async def upload(
+        self,
+        path: str,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ) -> httpx.Response:
+        """
+        POST a streamed multipart/form-data request with a single "file" field (see ApiClient.upload).
+        """
+        body = StreamingMultipart(file_name, source, content_type, on_progress=on_progress)
+        return await self.request(
+            "POST", path, content=body.aiter(), headers=body.headers(), timeout=timeout or self.timeout
+        )
+
+    # -------------------------------------------------
+    # Convenience API calls
+    # -------------------------------------------------
+
+    async def health(self):
+        # GET /api/health
+        return await self.get("/api/health")
+
+    # -------- Auth --------
+    async def auth_login(self, email: str, password: str):
+        # POST /api/auth/login
+        return await self.post("/api/auth/login", json={"email": email, "password": password})
+
+    async def auth_me(self):
+        # GET /api/auth/me
+        return await self.get("/api/auth/me")
+
+    async def auth_logout(self):
+        # POST /api/auth/logout
+        return await self.post("/api/auth/logout")
+
+    # -------- Analysts --------
+    async def analyst_get(self, analyst_id: str):
+        # GET /api/analysts/{id}
+        return await self.get(f"/api/analysts/{analyst_id}")
+
+    async def analyst_update_profile_picture(self, base64_payload: str | None):
+        # PATCH /api/analysts/me/profile-picture
+        return await self.patch(
+            "/api/analysts/me/profile-picture",
+            json={"profilePictureBase64": base64_payload},
+        )
+
+    # -------- Rules --------
+    async def rules_search(self, params: dict | None = None):
+        # GET /api/rules
+        return await self.get("/api/rules", params=params or {})
+
+    async def rules_get(self, rule_id: str):
+        # GET /api/rules/{id}
+        return await self.get(f"/api/rules/{rule_id}")
+
+    async def rules_patch(self, rule_id: str, payload: dict | None = None):
+        # PATCH /api/rules/{id}
+        if payload is None:
+            return await self.patch(f"/api/rules/{rule_id}")
+        return await self.patch(f"/api/rules/{rule_id}", json=payload)
+
+    # -------- Clients --------
+    async def client_create(self, payload: dict):
+        # POST /api/clients
+        return await self.post("/api/clients", json=payload)
+
+    async def clients_search(self, params: dict | None = None):
+        # GET /api/clients
+        return await self.get("/api/clients", params=params or {})
+
+    async def client_get(self, client_id: str):
+        # GET /api/clients/{id}
+        return await self.get(f"/api/clients/{client_id}")
+
+    async def clients_import(
+        self,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
+        # POST /api/clients/import (multipart form-data, streamed)
+        return await self.upload("/api/clients/import", file_name, source, content_type, timeout, on_progress)
+
+    # -------- Accounts --------
+    async def account_create(self, client_id: str, payload: dict):
+        # POST /api/clients/{clientId}/accounts
+        return await self.post(f"/api/clients/{client_id}/accounts", json=payload)
+
+    async def accounts_get_by_client(self, client_id: str):
+        # GET /api/clients/{clientId}/accounts
+        return await self.get(f"/api/clients/{client_id}/accounts")
+
+    async def account_get(self, account_id: str):
+        # GET /api/accounts/{accountId}
+        return await self.get(f"/api/accounts/{account_id}")
+
+    async def accounts_import(
+        self,
+        client_id: str,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
+        # POST /api/clients/{clientId}/accounts/import (multipart form-data, streamed)
+        return await self.upload(
+            f"/api/clients/{client_id}/accounts/import", file_name, source, content_type, timeout, on_progress
+        )
+
+    # -------- Account Identifiers --------
+    async def account_identifiers_get_by_account(self, account_id: str):
+        # GET /api/accounts/{accountId}/identifiers
+        return await self.get(f"/api/accounts/{account_id}/identifiers")
+
+    async def account_identifier_create(self, account_id: str, payload: dict):
+        # POST /api/accounts/{accountId}/identifiers
+        return await self.post(f"/api/accounts/{account_id}/identifiers", json=payload)
+
+    async def account_identifier_delete(self, identifier_id: str):
+        # DELETE /api/account-identifiers/{identifierId}
+        return await self.request("DELETE", f"/api/account-identifiers/{identifier_id}")
+
+    # -------- Transactions --------
+    async def transaction_create(self, payload: dict):
+        # POST /api/transactions
+        return await self.post("/api/transactions", json=payload)
+
+    async def transactions_search(self, params: dict | None = None):
+        # GET /api/transactions
+        return await self.get("/api/transactions", params=params or {})
+
+    async def transaction_get(self, transaction_id: str):
+        # GET /api/transactions/{transactionId}
+        return await self.get(f"/api/transactions/{transaction_id}")
+
+    async def transactions_import(
+        self,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        timeout: float | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ):
+        # POST /api/transactions/import (multipart form-data, streamed); large files may need a longer timeout
+        return await self.upload("/api/transactions/import", file_name, source, content_type, timeout, on_progress)
+
+    # -------- Cases --------
+    async def cases_search(self, params: dict | None = None):
+        # GET /api/cases
+        return await self.get("/api/cases", params=params or {})
+
+    async def case_get(self, case_id: str):
+        # GET /api/cases/{id}
+        return await self.get(f"/api/cases/{case_id}")
+
+    async def case_findings(self, case_id: str, params: dict | None = None):
+        # GET /api/cases/{caseId}/findings
+        return await self.get(f"/api/cases/{case_id}/findings", params=params or {})
+
+    # -------- Audit Logs --------
+    async def audit_logs_search(self, params: dict | None = None):
+        # GET /api/audit-logs
+        return await self.get("/api/audit-logs", params=params or {})
+
+    async def audit_log_get(self, audit_log_id: str):
+        # GET /api/audit-logs/{id}
+        return await self.get(f"/api/audit-logs/{audit_log_id}")
+
+    # -------- Exchange Rates --------
+    async def exchange_rate_get(self, base_currency: str, quote_currency: str):
+        # GET /api/exchangerates/{baseCurrency}/{quoteCurrency}
+        return await self.get(f"/api/exchangerates/{base_currency}/{quote_currency}")
+
+    async def exchange_rates_get(self, base_currency: str):
+        # GET /api/exchangerates/{baseCurrency}
+        return await self.get(f"/api/exchangerates/{base_currency}")
+
+    async def exchange_rates_convert(self, payload: dict):
+        # POST /api/exchangerates/convert
+        return await self.post("/api/exchangerates/convert", json=payload)
+
+    # -------- Reports --------
+    async def report_client(self, client_id: str, params: dict | None = None):
+        # GET /api/reports/client/{clientId}
+        return await self.get(f"/api/reports/client/{client_id}", params=params or {})
+
+    async def report_system(self, params: dict | None = None):
+        # GET /api/reports/system
+        return await self.get("/api/reports/system", params=params or {})
@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from tests.helpers.waiting import WaitTimeoutError, wait_until
+
+# Unclaimed notifications kept per key (cases opened by other tests, other users, ...).
+MAX_BUFFERED = 10_000
+
+
+def _get_case_insensitive(d: dict, key: str):
+    if not isinstance(d, dict):
+        return None
+    lk = key.lower()
+    for k, v in d.items():
+        if isinstance(k, str) and k.lower() == lk:
+            return v
+    return None
+
+
+class _FutureIndex:
+    """
+    key -> Future of the first notification seen for that key.
+
+    A future is created by whichever side comes first: the test asking for it, or the
+    notification arriving. Either way the test gets the event, even if the push raced
+    ahead of the subscription.
+    """
+
+    def __init__(self, max_size: int = MAX_BUFFERED):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._futures: OrderedDict[str, Future] = OrderedDict()
+
+    def get(self, key: str) -> Future:
+        key = str(key).lower()
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                while len(self._futures) > self.max_size:
+                    self._futures.popitem(last=False)
+            return future
+
+    def resolve(self, key, payload: dict):
+        if not key:
+            return
+        future = self.get(key)
+        if not future.done():
+            future.set_result(payload)
+
+
+class CaseNotificationListener:
+    """
+    One authenticated SignalR connection to /hubs/cases, shared by the whole session.
+
+    `caseOpened` events are routed by caseId and clientId into futures, so a test can
+    wait for the notification of its own case without opening a connection or polling
+    GET /api/cases. Futures are concurrent.futures.Future objects: block with
+    `.result(timeout)` or await them with `asyncio.wrap_future`.
+    """
+
+    def __init__(self, hub_url: str, token: str, *, connect_timeout: float = 10.0):
+        """
+        Args:
+            hub_url: Hub URL (e.g. http://localhost:8080/hubs/cases).
+            token: JWT sent as access_token.
+            connect_timeout: Seconds to wait for the connection to open.
+        """
+        self.hub_url = hub_url
+        self.token = token
+        self.connect_timeout = connect_timeout
+        self.received = 0
+        self._received_at: OrderedDict[str, float] = OrderedDict()
+        self._by_case = _FutureIndex()
+        self._by_client = _FutureIndex()
+        self._opened = threading.Event()
+        self._error = None
+        self._hub = None
+
+    # -------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------
+
+    def start(self) -> "CaseNotificationListener":
+        """
+        Open the connection and wait until the hub has accepted it.
+
+        Raises:
+            ConnectionError: If the connection fails or does not open within connect_timeout.
+        """
+        from signalrcore.hub_connection_builder import HubConnectionBuilder
+
+        self._hub = (
+            HubConnectionBuilder()
+            .with_url(self.hub_url, options={"access_token_factory": (lambda: self.token)})
+            .with_automatic_reconnect({"type": "raw", "keep_alive_interval": 10, "reconnect_interval": 2})
+            .build()
+        )
+        self._hub.on("caseOpened", self._on_case_opened)
+        self._hub.on_open(self._opened.set)
+        self._hub.on_error(self._on_error)
+        try:
+            self._hub.start()
+        except Exception as ex:
+            self._hub = None
+            raise ConnectionError(f"SignalR connection to {self.hub_url} failed: {ex}") from ex
+
+        try:
+            wait_until(lambda: self._opened.is_set() or self._error is not None, timeout=self.connect_timeout)
+        except WaitTimeoutError:
+            self.stop()
+            raise ConnectionError(f"SignalR connection to {self.hub_url} did not open within {self.connect_timeout}s.")
+        if self._error is not None:
+            self.stop()
+            raise ConnectionError(f"SignalR connection error: {self._error}")
+        return self
+
+    def stop(self):
+        if self._hub is not None:
+            try:
+                self._hub.stop()
+            except Exception:
+                pass
+            self._hub = None
+
+    def _on_error(self, err):
+        self._error = err
+
+    def _on_case_opened(self, args):
+        received_at = time.perf_counter()
+        # signalrcore passes the hub method arguments as a list
+        payload = args[0] if isinstance(args, list) and args else args
+        if not isinstance(payload, dict):
+            return
+        self.received += 1
+        case_id = _get_case_insensitive(payload, "caseId")
+        if case_id:
+            self._received_at[str(case_id).lower()] = received_at
+            while len(self._received_at) > MAX_BUFFERED:
+                self._received_at.popitem(last=False)
+        self._by_case.resolve(_get_case_insensitive(payload, "caseId"), payload)
+        self._by_client.resolve(_get_case_insensitive(payload, "clientId"), payload)
+
+    # -------------------------------------------------
+    # Waiting for notifications
+    # -------------------------------------------------
+
+    def expect_case(self, case_id: str) -> Future:
+        """
+        Returns:
+            Future resolved with the first `caseOpened` payload for `case_id`.
+        """
+        return self._by_case.get(case_id)
+
+    def expect_client(self, client_id: str) -> Future:
+        """
+        Returns:
+            Future resolved with the first `caseOpened` payload for a case of `client_id`.
+        """
+        return self._by_client.get(client_id)
+
+    def wait_for_case(self, case_id: str, timeout: float = 10.0) -> dict:
+        """
+        Block until the `caseOpened` notification for `case_id` arrives.
+
+        Raises:
+            TimeoutError: If it does not arrive in time.
+        """
+        return self.expect_case(case_id).result(timeout)
+
+    def wait_for_client(self, client_id: str, timeout: float = 10.0) -> dict:
+        """
+        Block until a `caseOpened` notification for `client_id` arrives.
+
+        Raises:
+            TimeoutError: If it does not arrive in time.
+        """
+        return self.expect_client(client_id).result(timeout)
+
+    def received_at(self, case_id: str) -> float | None:
+        """
+        Returns:
+            time.perf_counter() value at which the notification for `case_id` was
+            received by the listener (not when a test picked it up), or None.
+        """
+        return self._received_at.get(str(case_id).lower())
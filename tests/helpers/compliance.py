@@ -0,0 +1,28 @@
+"""
+Lookups shared by the compliance-rule tests and benchmarks: seeded rules by their stable
+code, and the case (if any) a transaction opened.
+"""
+import pytest
+
+from tests.helpers.assertions import assert_status
+
+
+def rule_by_code(authed, code: str) -> dict:
+    """
+    Find a rule by its stable code (reading every page of GET /api/rules), skipping the
+    test if the seed does not define it.
+    """
+    rule = next((x for x in authed.iter_rules() if x.get("code") == code), None)
+    if rule is None:
+        pytest.skip(f"Seeded rule not found by code='{code}'.")
+    return rule
+
+
+def case_for_transaction(authed, tx_id: str) -> dict | None:
+    """
+    The case opened for a transaction, or None if its compliance check opened none.
+    """
+    r = authed.cases_search({"transactionId": tx_id, "page": 1, "pageSize": 1})
+    assert_status(r, 200)
+    items = r.json().get("items", [])
+    return items[0] if items else None
@@ -0,0 +1,228 @@
+import csv
+import itertools
+import json
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.helpers.assertions import assert_status
+from tests.helpers.import_files import csv_chunks
+from tests.helpers.payloads import (
+    ACCOUNT_IMPORT_HEADER,
+    CLIENT_IMPORT_HEADER,
+    TRANSACTION_IMPORT_HEADER,
+    account_import_row,
+    client_import_row,
+    valid_account_payload,
+)
+
+
+class DataFactory:
+    """
+    Session-wide pool of fresh clients/accounts created in bulk for integration tests.
+
+    Instead of every test paying a POST /api/clients + POST /api/clients/{id}/accounts
+    round trip, clients are created a batch at a time through POST /api/clients/import,
+    resolved back to their ids with a single name-tag search, and their accounts are
+    created concurrently. Tests then take an unused (client, account) pair with no
+    network cost.
+
+    Every entry is handed out once, so per-client state (daily totals, structuring
+    counts) is never shared between tests.
+    """
+
+    def __init__(
+        self,
+        api,
+        *,
+        namespace: str = "Factory",
+        batch_size: int = 50,
+        accounts_per_client: int = 1,
+        concurrency: int = 8,
+    ):
+        """
+        Args:
+            api: Authenticated ApiClient.
+            namespace: Prefix of every generated client name / account identifier.
+            batch_size: Number of clients created per import request.
+            accounts_per_client: Accounts pre-created for each client.
+            concurrency: Parallel requests used to create accounts.
+        """
+        self.api = api
+        self.namespace = f"{namespace}-{uuid.uuid4().hex[:8]}"
+        self.batch_size = batch_size
+        self.accounts_per_client = accounts_per_client
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._pool: list[tuple[dict, list[dict]]] = []
+        self._batches = 0
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+
+    def client_with_accounts(self) -> tuple[dict, list[dict]]:
+        """
+        Returns:
+            (client, accounts) pair never handed out before. Skips the test if the
+            environment cannot create clients/accounts (e.g. missing countries seed).
+        """
+        with self._lock:
+            if not self._pool:
+                self._pool.extend(self._create_batch(self.batch_size))
+            if not self._pool:
+                raise AssertionError("Data factory batch created no clients.")
+            return self._pool.pop(0)
+
+    def client_with_account(self) -> tuple[dict, dict]:
+        """
+        Returns:
+            (client, account) pair never handed out before.
+        """
+        client, accounts = self.client_with_accounts()
+        return client, accounts[0]
+
+    def client(self) -> dict:
+        """
+        Returns:
+            Client never handed out before (its pre-created accounts are left unused).
+        """
+        return self.client_with_accounts()[0]
+
+    def prefill(self, count: int):
+        """
+        Make sure at least `count` entries are ready before tests start consuming them.
+        """
+        with self._lock:
+            missing = count - len(self._pool)
+            while missing > 0:
+                batch = self._create_batch(min(missing, self.batch_size))
+                if not batch:
+                    # No progress: retrying would loop forever while holding the lock.
+                    break
+                self._pool.extend(batch)
+                missing -= len(batch)
+
+    def seed_transactions(
+        self,
+        rows: Iterable[str | Sequence[str]],
+        *,
+        chunk_size: int = 1000,
+        timeout: float = 600,
+    ) -> int:
+        """
+        Bulk-insert transaction history through POST /api/transactions/import.
+
+        Args:
+            rows: Rows matching TRANSACTION_IMPORT_HEADER, either CSV lines (see
+                transaction_import_row) or column lists (see import_files.transaction_rows).
+                Consumed lazily, one chunk at a time.
+            chunk_size: Rows per import request.
+            timeout: Per-request timeout in seconds (imports run compliance on every row).
+
+        Returns:
+            Number of rows imported. Fails the test if any row is rejected.
+        """
+        imported = 0
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            body = csv_chunks(
+                TRANSACTION_IMPORT_HEADER,
+                (next(csv.reader([row])) if isinstance(row, str) else row for row in chunk),
+            )
+            r = self.api.transactions_import("history.csv", body, timeout=timeout)
+            assert_status(r, 200)
+            result = r.json()
+            assert result.get("errorCount", 0) == 0, (
+                f"Transaction import rejected rows: {json.dumps(result.get('errors', [])[:5], ensure_ascii=False)}"
+            )
+            imported += result["successCount"]
+        return imported
+
+    # -------------------------------------------------
+    # Bulk creation
+    # -------------------------------------------------
+
+    def _create_batch(self, size: int) -> list[tuple[dict, list[dict]]]:
+        self._batches += 1
+        tag = f"{self.namespace}-B{self._batches:04d}"
+        clients = self._import_clients(tag, size)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="data-factory") as pool:
+            accounts = list(pool.map(self._create_accounts, clients))
+
+        return list(zip(clients, accounts))
+
+    def _import_clients(self, tag: str, size: int) -> list[dict]:
+        """
+        Import `size` clients named after `tag` and resolve them back by name.
+
+        Raises:
+            AssertionError: If the import succeeded but none of the new clients is found,
+                with the import and search responses.
+        """
+        names = [f"{tag}-{i:05d}" for i in range(size)]
+        csv_text = "\n".join([CLIENT_IMPORT_HEADER, *(client_import_row(name=n) for n in names)]) + "\n"
+
+        r = self.api.clients_import(f"{tag}.csv", csv_text.encode("utf-8"))
+        assert_status(r, 200)
+        result = r.json()
+        if result.get("successCount", 0) == 0:
+            pytest.skip(
+                "Could not bulk-import clients (likely missing countries seed). "
+                f"Response: {json.dumps(result, ensure_ascii=False)}"
+            )
+
+        by_name = {}
+        page = 1
+        while True:
+            r = self.api.clients_search({"SearchTerm": tag, "Page.Page": page, "Page.PageSize": 100})
+            assert_status(r, 200)
+            body = r.json()
+            for c in body.get("items", []):
+                by_name[c["name"]] = c
+            if page >= body.get("totalPages", 0):
+                break
+            page += 1
+
+        clients = [by_name[n] for n in names if n in by_name]
+        if not clients:
+            raise AssertionError(
+                f"Imported clients tagged {tag!r} were not found by name search. "
+                f"Import: {json.dumps(result, ensure_ascii=False)} "
+                f"Search: {json.dumps(body, ensure_ascii=False)}"
+            )
+        return clients
+
+    def _create_accounts(self, client: dict) -> list[dict]:
+        if self.accounts_per_client == 1:
+            r = self.api.account_create(client["id"], valid_account_payload(account_identifier=self._account_identifier()))
+            self._skip_if_rejected(r)
+            assert_status(r, 201)
+            return [r.json()]
+
+        rows = [account_import_row(account_identifier=self._account_identifier()) for _ in range(self.accounts_per_client)]
+        csv_text = "\n".join([ACCOUNT_IMPORT_HEADER, *rows]) + "\n"
+        r = self.api.accounts_import(client["id"], "accounts.csv", csv_text.encode("utf-8"))
+        self._skip_if_rejected(r)
+        assert_status(r, 200)
+
+        r = self.api.accounts_get_by_client(client["id"])
+        assert_status(r, 200)
+        return r.json()
+
+    def _account_identifier(self) -> str:
+        return f"{self.namespace}-ACC-{uuid.uuid4()}"
+
+    @staticmethod
+    def _skip_if_rejected(resp):
+        if resp.status_code != 400:
+            return
+        try:
+            body = resp.json()
+        except Exception:
+            body = {"raw": resp.text}
+        pytest.skip(f"Could not create account (likely missing countries seed). Response: {json.dumps(body, ensure_ascii=False)}")
@@ -0,0 +1,147 @@
+"""
+Streaming consumption of file downloads (report CSV exports).
+
+A StreamedDownload wraps a `stream=True` response and reads its body chunk by chunk,
+either to a file on disk or as parsed CSV rows, so memory stays bounded by the chunk
+size whatever the export size. Timing is measured from the moment the request was sent:
+
+    with authed.report_system_export_csv({"startDate": "2025-01-01"}) as download:
+        stats = download.save("/tmp/system.csv")
+    print(stats.ttfb_s, stats.total_s, stats.bytes_per_sec)
+"""
+import codecs
+import csv
+import time
+from collections.abc import Iterator
+
+import requests
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadStats:
+    """
+    Timing of a streamed download, all relative to when the request was sent.
+
+    Attributes:
+        status: HTTP status code.
+        headers_s: Time until the response headers were received.
+        ttfb_s: Time until the first body byte was received (None for an empty body).
+        total_s: Time until the body was fully read.
+        bytes_received: Body size in bytes (after content decoding).
+        rows: CSV rows parsed, when consumed through rows().
+    """
+
+    def __init__(self, status: int, headers_s: float):
+        self.status = status
+        self.headers_s = headers_s
+        self.ttfb_s: float | None = None
+        self.total_s = headers_s
+        self.bytes_received = 0
+        self.rows: int | None = None
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes_received / self.total_s if self.total_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "headersSeconds": self.headers_s,
+            "ttfbSeconds": self.ttfb_s,
+            "totalSeconds": self.total_s,
+            "bytesReceived": self.bytes_received,
+            "bytesPerSec": self.bytes_per_sec,
+            "rows": self.rows,
+        }
+
+
+class StreamedDownload:
+    """
+    Body of a `stream=True` response, consumed once with save(), rows() or iter_chunks().
+
+    Use it as a context manager (or call close()) so the connection goes back to the pool
+    even when the body is not fully read. `stats` is filled in as the body is read.
+    """
+
+    def __init__(self, response: requests.Response, started: float, chunk_size: int = CHUNK_SIZE):
+        self.response = response
+        self.started = started
+        self.chunk_size = chunk_size
+        self.stats = DownloadStats(response.status_code, time.perf_counter() - started)
+        self._consumed = False
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def file_name(self) -> str | None:
+        """
+        File name from the Content-Disposition header, if any.
+        """
+        disposition = self.response.headers.get("Content-Disposition", "")
+        for part in disposition.split(";"):
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "filename":
+                return value.strip('"')
+        return None
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        if self._consumed:
+            raise RuntimeError("StreamedDownload bodies can only be read once.")
+        self._consumed = True
+        try:
+            for chunk in self.response.iter_content(chunk_size=self.chunk_size):
+                if not chunk:
+                    continue
+                if self.stats.ttfb_s is None:
+                    self.stats.ttfb_s = time.perf_counter() - self.started
+                self.stats.bytes_received += len(chunk)
+                yield chunk
+        finally:
+            self.stats.total_s = time.perf_counter() - self.started
+            self.close()
+
+    def save(self, path: str) -> DownloadStats:
+        """
+        Write the body to path chunk by chunk.
+        """
+        with open(path, "wb") as f:
+            for chunk in self.iter_chunks():
+                f.write(chunk)
+        return self.stats
+
+    def rows(self, encoding: str = "utf-8-sig") -> Iterator[list[str]]:
+        """
+        Parse the body as CSV and yield its rows as they arrive.
+
+        Only the current chunk and a partial line are held in memory; stats.rows counts
+        the rows yielded.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        self.stats.rows = 0
+
+        def lines() -> Iterator[str]:
+            pending = ""
+            for chunk in self.iter_chunks():
+                pending += decoder.decode(chunk)
+                *complete, pending = pending.split("\n")
+                for line in complete:
+                    yield line + "\n"
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+
+        for row in csv.reader(lines()):
+            self.stats.rows += 1
+            yield row
+
+    def close(self):
+        self.response.close()
+
+    def __enter__(self) -> "StreamedDownload":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
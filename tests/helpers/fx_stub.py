@@ -0,0 +1,365 @@
+"""
+Local stand-in for ExchangeRate-API (https://v6.exchangerate-api.com).
+
+Serves deterministic rate tables in the format read by ExchangeRateApiProvider:
+
+    GET {BaseUrl}/{ApiKey}/latest/{BASE}
+    -> {"result": "success", "base_code": "USD", "conversion_rates": {...}, "time_last_update_unix": ...}
+
+Latency, jitter and failures can be injected globally or for individual base currencies,
+so FxRateService.ConvertToBaseCurrencyAsync (API path, retries and DB fallback) can be
+measured under controlled upstream conditions.
+
+Point the API at the stub with
+    ExchangeRateApi__BaseUrl=http://<host running pytest>:<port>/v6
+
+The server is controlled over HTTP (see FxStubClient). It binds 127.0.0.1 unless told
+otherwise; its control endpoints are unauthenticated, so only bind 0.0.0.0 when the API
+under test runs in a container.
+"""
+import hashlib
+import json
+import random
+import re
+import string
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# ISO 4217 "code reserved for testing". The stub always quotes it at this rate, so tests can
+# tell whether the API under test is wired to the stub.
+SENTINEL_CURRENCY = "XTS"
+SENTINEL_RATE = 1.2345
+
+# Units of each currency per 1 USD.
+USD_RATES = {
+    "USD": 1.0,
+    "BRL": 5.4,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "CHF": 0.88,
+    "JPY": 149.5,
+    "CAD": 1.36,
+    "AUD": 1.52,
+    "CNY": 7.24,
+    "INR": 83.2,
+    "MXN": 17.1,
+    "ARS": 870.0,
+    "CLP": 940.0,
+    "COP": 3950.0,
+    "IRR": 42000.0,
+    "KPW": 900.0,
+    "SYP": 13000.0,
+}
+
+_LATEST_RE = re.compile(r"/latest/([A-Za-z]{3})/?$")
+_ANY = "*"
+
+
+def _usd_rate(code: str) -> float:
+    """
+    Units of `code` per 1 USD. Unknown codes get a stable synthetic rate derived from the code,
+    so tests can use never-seen base currencies to force cache misses in the API.
+    """
+    if code in USD_RATES:
+        return USD_RATES[code]
+    digest = int(hashlib.sha256(code.encode("ascii")).hexdigest()[:8], 16)
+    return round(0.5 + (digest % 10_000) / 1_000, 4)
+
+
+def fresh_base_code() -> str:
+    """
+    Random 3-letter base currency the API has (almost certainly) never cached,
+    so a rate lookup for it reaches the upstream.
+    """
+    while True:
+        code = "".join(random.choices(string.ascii_uppercase, k=3))
+        if code not in USD_RATES and code != SENTINEL_CURRENCY:
+            return code
+
+
+def rate_table(base_code: str) -> dict[str, float]:
+    """
+    Deterministic conversion rates (units of quote per 1 unit of `base_code`).
+    """
+    base_code = base_code.upper()
+    base = _usd_rate(base_code)
+    rates = {code: round(usd / base, 6) for code, usd in USD_RATES.items()}
+    rates[base_code] = 1.0
+    rates[SENTINEL_CURRENCY] = SENTINEL_RATE
+    return rates
+
+
+def latest_response(base_code: str, now: datetime | None = None) -> dict:
+    """
+    Body of a successful `latest` call, as returned by ExchangeRate-API v6.
+    """
+    now = now or datetime.now(timezone.utc)
+    last = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    nxt = last + timedelta(days=1)
+    return {
+        "result": "success",
+        "documentation": "https://www.exchangerate-api.com/docs",
+        "terms_of_use": "https://www.exchangerate-api.com/terms",
+        "time_last_update_unix": int(last.timestamp()),
+        "time_last_update_utc": last.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+        "time_next_update_unix": int(nxt.timestamp()),
+        "time_next_update_utc": nxt.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+        "base_code": base_code.upper(),
+        "conversion_rates": rate_table(base_code),
+    }
+
+
+class _Behavior:
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, failure_rate: float = 0.0, failure_status: int = 503):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+
+    def to_dict(self) -> dict:
+        return {
+            "latencyMs": self.latency_ms,
+            "jitterMs": self.jitter_ms,
+            "failureRate": self.failure_rate,
+            "failureStatus": self.failure_status,
+        }
+
+
+class FxStubServer:
+    """
+    Threaded HTTP server emulating ExchangeRate-API, with fault injection.
+
+    Control endpoints:
+        POST /__stub/config  {"base": "*"|"EUR", "latencyMs", "jitterMs", "failureRate", "failureStatus"}
+        POST /__stub/reset   back to no latency / no failures, counters cleared
+        GET  /__stub/stats   {"requests": {BASE: n}, "failures": {BASE: n}}
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, *, seed: int = 0):
+        """
+        Args:
+            host: Bind address ("0.0.0.0" to make the stub reachable from containers).
+            port: Bind port (0 picks a free port).
+            seed: Seed of the jitter/failure random generator.
+        """
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self.reset()
+
+    # -------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------
+
+    def start(self) -> "FxStubServer":
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fx-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Root URL of the stub as seen from this machine.
+        """
+        host = "127.0.0.1" if self.host in ("", "0.0.0.0") else self.host
+        return f"http://{host}:{self.port}"
+
+    # -------------------------------------------------
+    # Behaviour
+    # -------------------------------------------------
+
+    def configure(self, base: str = _ANY, **settings):
+        """
+        Set latency/jitter/failure injection for one base currency, or for all ("*").
+
+        Args:
+            base: Base currency code the settings apply to.
+            **settings: latency_ms, jitter_ms, failure_rate (0..1), failure_status.
+        """
+        with self._lock:
+            key = base.upper() if base != _ANY else _ANY
+            current = self._behaviors.get(key) or _Behavior(**vars(self._behaviors[_ANY]))
+            for name, value in settings.items():
+                if not hasattr(current, name):
+                    raise TypeError(f"Unknown stub setting: {name}")
+                setattr(current, name, value)
+            self._behaviors[key] = current
+
+    def reset(self):
+        with self._lock:
+            self._behaviors: dict[str, _Behavior] = {_ANY: _Behavior()}
+            self._random = random.Random(self.seed)
+            self._requests: dict[str, int] = {}
+            self._failures: dict[str, int] = {}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "failures": dict(self._failures),
+                "config": {k: b.to_dict() for k, b in self._behaviors.items()},
+            }
+
+    def _plan(self, base_code: str) -> tuple[float, int | None]:
+        """
+        Returns:
+            (delay in seconds, failure status or None) for one request.
+        """
+        with self._lock:
+            b = self._behaviors.get(base_code) or self._behaviors[_ANY]
+            delay_ms = b.latency_ms
+            if b.jitter_ms:
+                delay_ms += self._random.uniform(-b.jitter_ms, b.jitter_ms)
+            failed = b.failure_rate > 0 and self._random.random() < b.failure_rate
+
+            self._requests[base_code] = self._requests.get(base_code, 0) + 1
+            if failed:
+                self._failures[base_code] = self._failures.get(base_code, 0) + 1
+            return max(delay_ms, 0.0) / 1000.0, b.failure_status if failed else None
+
+    # -------------------------------------------------
+    # HTTP
+    # -------------------------------------------------
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: dict):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_json(self) -> dict:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/__stub/stats":
+                    return self._send(200, stub.stats())
+
+                m = _LATEST_RE.search(path)
+                if m is None:
+                    return self._send(404, {"result": "error", "error-type": "malformed-request"})
+
+                base_code = m.group(1).upper()
+                delay_s, failure_status = stub._plan(base_code)
+                if delay_s:
+                    time.sleep(delay_s)
+                if failure_status is not None:
+                    return self._send(failure_status, {"result": "error", "error-type": "stub-injected-failure"})
+                return self._send(200, latest_response(base_code))
+
+            def do_POST(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/__stub/reset":
+                    stub.reset()
+                    return self._send(200, stub.stats())
+                if path == "/__stub/config":
+                    body = self._read_json()
+                    settings = {
+                        name: body[key]
+                        for key, name in (
+                            ("latencyMs", "latency_ms"),
+                            ("jitterMs", "jitter_ms"),
+                            ("failureRate", "failure_rate"),
+                            ("failureStatus", "failure_status"),
+                        )
+                        if key in body
+                    }
+                    stub.configure(body.get("base", _ANY), **settings)
+                    return self._send(200, stub.stats())
+                return self._send(404, {"error": "not found"})
+
+        return Handler
+
+
+class FxStubClient:
+    """
+    Controls an FxStubServer over HTTP (works from any process, e.g. xdist workers).
+    """
+
+    def __init__(self, url: str, timeout: float = 5):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    @property
+    def api_base_url(self) -> str:
+        """
+        Value for the API's ExchangeRateApi:BaseUrl setting.
+        """
+        return f"{self.url}/v6"
+
+    def configure(
+        self,
+        base: str = _ANY,
+        *,
+        latency_ms: float | None = None,
+        jitter_ms: float | None = None,
+        failure_rate: float | None = None,
+        failure_status: int | None = None,
+    ) -> dict:
+        """
+        Inject latency/jitter/failures for one base currency, or for all ("*").
+        Unset arguments keep their current value.
+        """
+        payload = {"base": base}
+        for key, value in (
+            ("latencyMs", latency_ms),
+            ("jitterMs", jitter_ms),
+            ("failureRate", failure_rate),
+            ("failureStatus", failure_status),
+        ):
+            if value is not None:
+                payload[key] = value
+        r = requests.post(f"{self.url}/__stub/config", json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def reset(self) -> dict:
+        r = requests.post(f"{self.url}/__stub/reset", timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def stats(self) -> dict:
+        r = requests.get(f"{self.url}/__stub/stats", timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def requests_for(self, base_code: str) -> int:
+        """
+        Returns:
+            Number of `latest` calls received for `base_code`.
+        """
+        return self.stats()["requests"].get(base_code.upper(), 0)
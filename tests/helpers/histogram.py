@@ -0,0 +1,277 @@
+import base64
+import math
+import struct
+import zlib
+from array import array
+
+_MAGIC = b"HDRL"
+_VERSION = 1
+# magic, version, significant digits, highest trackable (us), count, min ms, max ms, total ms
+_HEADER = struct.Struct(">4sBBQQddd")
+
+
+def _encode_counts(counts) -> bytes:
+    """
+    Run-length + varint encoding: each count is a zigzag LEB128 varint and runs of zeros
+    are written as one negative number (-run length), as in HdrHistogram's V2 format.
+    """
+    out = bytearray()
+
+    def put(n: int):
+        z = (n << 1) ^ (n >> 63)
+        while True:
+            b = z & 0x7F
+            z >>= 7
+            if z:
+                out.append(b | 0x80)
+            else:
+                out.append(b)
+                return
+
+    zeros = 0
+    for c in counts:
+        if c == 0:
+            zeros += 1
+            continue
+        if zeros:
+            put(-zeros)
+            zeros = 0
+        put(c)
+    return bytes(out)
+
+
+def _decode_counts(data: bytes, length: int) -> array:
+    counts = array("q", bytes(8 * length))
+    i = 0
+    pos = 0
+    while pos < len(data):
+        z = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            z |= (b & 0x7F) << shift
+            shift += 7
+            if not b & 0x80:
+                break
+        n = (z >> 1) ^ -(z & 1)
+        if n < 0:
+            i += -n
+        else:
+            counts[i] = n
+            i += 1
+    return counts
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory, mergeable HDR-style latency histogram (values in milliseconds).
+
+    Values are tracked in integer microseconds from 1 us up to `highest_ms`, with
+    `significant_digits` decimal digits of precision (relative error <= 10^-digits / 2
+    at every magnitude). Memory is a fixed array of counters sized by those two settings,
+    independent of the number of samples; values above `highest_ms` are clamped into the
+    top bucket (min/max/mean stay exact).
+
+    Histograms with the same settings merge by adding counters, so results from threads,
+    worker processes, agents or separate runs can be combined. `to_bytes`/`to_base64`
+    give a compact, zlib-compressed binary form.
+
+    Not thread-safe: record from one thread, or guard with a lock (EndpointMetrics does).
+    """
+
+    def __init__(self, significant_digits: int = 2, highest_ms: float = 600_000.0):
+        """
+        Args:
+            significant_digits: Value precision, 1..5.
+            highest_ms: Highest value tracked without clamping.
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5.")
+        self.significant_digits = significant_digits
+        self.highest_us = max(int(math.ceil(highest_ms * 1000)), 2)
+
+        largest_single_unit = 2 * 10 ** significant_digits
+        sub_bucket_count_magnitude = int(math.ceil(math.log2(largest_single_unit)))
+        self._sub_half_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_count = 1 << (self._sub_half_magnitude + 1)
+        self._sub_half = self._sub_count // 2
+        self._sub_mask = self._sub_count - 1
+
+        smallest_untrackable = self._sub_count
+        buckets = 1
+        while smallest_untrackable <= self.highest_us:
+            smallest_untrackable <<= 1
+            buckets += 1
+        self._bucket_count = buckets
+        self.counts = array("q", bytes(8 * (buckets + 1) * self._sub_half))
+
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    # -------------------------------------------------
+    # Layout
+    # -------------------------------------------------
+
+    def _index(self, value_us: int) -> int:
+        bucket = (value_us | self._sub_mask).bit_length() - (self._sub_half_magnitude + 1)
+        sub = value_us >> bucket
+        return ((bucket + 1) << self._sub_half_magnitude) + (sub - self._sub_half)
+
+    def _bucket_of(self, index: int) -> tuple[int, int]:
+        bucket = (index >> self._sub_half_magnitude) - 1
+        sub = (index & (self._sub_half - 1)) + self._sub_half
+        if bucket < 0:
+            sub -= self._sub_half
+            bucket = 0
+        return bucket, sub
+
+    def _value_range_us(self, index: int) -> tuple[int, int]:
+        """
+        Returns:
+            (lowest, size) of the value range counted at `index`.
+        """
+        bucket, sub = self._bucket_of(index)
+        return sub << bucket, 1 << bucket
+
+    def _same_layout(self, other: "LatencyHistogram") -> bool:
+        return (
+            self.significant_digits == other.significant_digits
+            and len(self.counts) == len(other.counts)
+        )
+
+    # -------------------------------------------------
+    # Recording / merging
+    # -------------------------------------------------
+
+    def record(self, value_ms: float, count: int = 1):
+        value_us = min(max(int(value_ms * 1000), 0), self.highest_us)
+        self.counts[self._index(value_us)] += count
+        self.count += count
+        self.total += value_ms * count
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = value_ms if self.max is None else max(self.max, value_ms)
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add every sample of `other` to this histogram.
+
+        Histograms with different settings are merged by re-recording each of the
+        other's non-empty buckets at its midpoint (precision is the coarser of the two).
+        """
+        if self._same_layout(other):
+            counts = self.counts
+            for i, n in enumerate(other.counts):
+                if n:
+                    counts[i] += n
+        else:
+            for i, n in enumerate(other.counts):
+                if n:
+                    low, size = other._value_range_us(i)
+                    value_us = min(low + size // 2, self.highest_us)
+                    self.counts[self._index(value_us)] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Args:
+            q: Percentile in [0, 100].
+
+        Returns:
+            Approximate value at the given percentile, or None if empty.
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= rank:
+                low, size = self._value_range_us(i)
+                return min(max((low + size / 2) / 1000.0, self.min), self.max)
+        return self.max
+
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            count / mean / p50 / p95 / p99 / max (milliseconds), as used in benchmark reports.
+        """
+        return {
+            "count": self.count,
+            "meanMs": self.mean(),
+            "p50Ms": self.percentile(50),
+            "p95Ms": self.percentile(95),
+            "p99Ms": self.percentile(99),
+            "maxMs": self.max,
+        }
+
+    # -------------------------------------------------
+    # Serialization
+    # -------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary form (header + run-length/varint counters, zlib-compressed).
+        """
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            self.significant_digits,
+            self.highest_us,
+            self.count,
+            math.nan if self.min is None else self.min,
+            math.nan if self.max is None else self.max,
+            self.total,
+        )
+        return zlib.compress(header + _encode_counts(self.counts))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LatencyHistogram":
+        raw = zlib.decompress(data)
+        magic, version, digits, highest_us, count, min_ms, max_ms, total = _HEADER.unpack_from(raw)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a serialized LatencyHistogram.")
+        h = cls(significant_digits=digits, highest_ms=highest_us / 1000.0)
+        h.counts = _decode_counts(raw[_HEADER.size:], len(h.counts))
+        h.count = count
+        h.total = total
+        h.min = None if math.isnan(min_ms) else min_ms
+        h.max = None if math.isnan(max_ms) else max_ms
+        return h
+
+    def to_base64(self) -> str:
+        return base64.b64encode(self.to_bytes()).decode("ascii")
+
+    @classmethod
+    def from_base64(cls, text: str) -> "LatencyHistogram":
+        return cls.from_bytes(base64.b64decode(text))
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "hdr": self.to_base64()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        return cls.from_base64(data["hdr"])
@@ -0,0 +1,376 @@
+"""
+Deterministic, streaming generators for the import endpoints.
+
+Row generators produce the columns of the client, account and transaction import formats
+(CLIENT_IMPORT_HEADER, ACCOUNT_IMPORT_HEADER, TRANSACTION_IMPORT_HEADER) from a seeded
+random.Random, so the same arguments always give the same rows. Writers turn any row
+iterator into a stream of byte chunks, as CSV or as a single-sheet XLSX workbook (the
+format read by the API's ParseExcel path); neither ever holds the whole file:
+
+    rows = transaction_rows(account_identifiers, 100_000, seed=7, end=end, violating_fraction=0.01)
+    write_import_file("tx.xlsx", TRANSACTION_IMPORT_HEADER, rows)
+
+Distributions are either a sequence of values (uniform) or a mapping {value: weight}.
+"""
+import csv
+import io
+import random
+import zipfile
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from xml.sax.saxutils import escape
+
+Distribution = Sequence[str] | Mapping[str, float]
+
+CHUNK_SIZE = 64 * 1024
+
+# Seeded rule parameters (banned_countries_default, daily_limit_default).
+BANNED_COUNTRIES = ("IR", "KP", "SY")
+DAILY_LIMIT_USD = 10_000.0
+
+_COUNTRY_NAMES = {
+    "BR": "Brazil",
+    "US": "United States",
+    "DE": "Germany",
+    "GB": "United Kingdom",
+    "JP": "Japan",
+    "FR": "France",
+    "CH": "Switzerland",
+    "IR": "Iran",
+    "KP": "North Korea",
+    "SY": "Syria",
+}
+
+
+class _Picker:
+    """
+    Draws values from a Distribution with a shared random.Random.
+    """
+
+    def __init__(self, rng: random.Random, distribution: Distribution):
+        if isinstance(distribution, Mapping):
+            self.values = list(distribution)
+            weights = list(distribution.values())
+        else:
+            self.values = list(distribution)
+            weights = [1.0] * len(self.values)
+        if not self.values:
+            raise ValueError("Distribution must have at least one value.")
+        self.rng = rng
+        self.cum_weights = [sum(weights[: i + 1]) for i in range(len(weights))]
+
+    def __call__(self) -> str:
+        return self.rng.choices(self.values, cum_weights=self.cum_weights)[0]
+
+
+def _iso_z(value: datetime) -> str:
+    return value.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+# -------------------------------------------------
+# Row generators
+# -------------------------------------------------
+
+
+def client_rows(
+    count: int,
+    *,
+    seed: int = 0,
+    name_prefix: str = "Generated Client",
+    legal_types: Distribution = {"Individual": 4, "Corporate": 1},
+    countries: Distribution = ("BR",),
+    risk_levels: Distribution = {"Low": 6, "Medium": 3, "High": 1},
+) -> Iterator[list[str]]:
+    """
+    Rows for POST /api/clients/import, in CLIENT_IMPORT_HEADER column order.
+
+    Names are "{name_prefix} {n}" (1-based), so a unique prefix per run keeps them apart.
+    """
+    rng = random.Random(seed)
+    legal_type, country, risk_level = (_Picker(rng, d) for d in (legal_types, countries, risk_levels))
+    for i in range(count):
+        code = country()
+        yield [
+            legal_type(),
+            f"{name_prefix} {i + 1}",
+            f"+55119{rng.randrange(10**8):08d}",
+            f"Street {rng.randrange(1, 5000)}",
+            "São Paulo",
+            "SP",
+            f"{rng.randrange(10**5):05d}-{rng.randrange(1000):03d}",
+            _COUNTRY_NAMES.get(code, code),
+            code,
+            risk_level(),
+        ]
+
+
+def account_rows(
+    count: int,
+    *,
+    seed: int = 0,
+    identifier_prefix: str = "GEN",
+    countries: Distribution = ("BR",),
+    account_types: Distribution = {"Checking": 5, "Savings": 3, "Investment": 1, "Other": 1},
+    currencies: Distribution = {"BRL": 3, "USD": 1},
+) -> Iterator[list[str]]:
+    """
+    Rows for POST /api/clients/{clientId}/accounts/import, in ACCOUNT_IMPORT_HEADER column order.
+
+    Account identifiers are "{identifier_prefix}-{n:08d}" (1-based); they must be unique in
+    the database, so pass a unique prefix per run.
+    """
+    rng = random.Random(seed)
+    country, account_type, currency = (_Picker(rng, d) for d in (countries, account_types, currencies))
+    for i in range(count):
+        yield [f"{identifier_prefix}-{i + 1:08d}", country(), account_type(), currency()]
+
+
+def transaction_rows(
+    account_identifiers: Sequence[str],
+    count: int,
+    *,
+    seed: int = 0,
+    end: datetime | None = None,
+    window: timedelta = timedelta(days=30),
+    kinds: Distribution = {"Deposit": 5, "Withdrawal": 2, "Transfer": 3},
+    currencies: Distribution = {"USD": 1, "BRL": 1},
+    cp_countries: Distribution = ("US", "DE", "GB", "JP"),
+    transfer_methods: Distribution = ("PIX", "TED", "WIRE"),
+    amount_mu: float = 4.0,
+    amount_sigma: float = 1.2,
+    amount_cap: float = 50_000.0,
+    violating_fraction: float = 0.0,
+    tally: Counter | None = None,
+) -> Iterator[list[str]]:
+    """
+    Rows for POST /api/transactions/import, in TRANSACTION_IMPORT_HEADER column order.
+
+    Args:
+        account_identifiers: Existing account identifiers the rows are spread over (uniformly).
+        count: Number of rows.
+        seed: Seed of the generator; identical arguments produce identical rows.
+        end: Latest OccurredAtUtc; timestamps are uniform over [end - window, end]. Defaults to
+            now, so pass it explicitly for byte-identical files across runs.
+        window: Width of the timestamp range.
+        kinds: Transaction type distribution (Deposit / Withdrawal / Transfer).
+        currencies: Currency distribution.
+        cp_countries: Counterparty country distribution for transfers. "BR" transfers need an
+            existing counterparty identifier, so leave it out unless that is what is measured.
+        transfer_methods: Transfer method distribution (PIX / TED / WIRE).
+        amount_mu, amount_sigma: Lognormal parameters of the amount, in currency units.
+        amount_cap: Upper bound of the amount.
+        violating_fraction: Fraction of rows that break a seeded rule on their own: a transfer
+            to a banned country (banned_countries_default) or a single USD deposit above
+            the daily limit (daily_limit_default), half each.
+        tally: Optional Counter updated with the number of rows per kind and per violation
+            ("violation:banned_country", "violation:daily_limit").
+    """
+    rng = random.Random(seed)
+    kind, currency, cp_country, transfer_method = (
+        _Picker(rng, d) for d in (kinds, currencies, cp_countries, transfer_methods)
+    )
+    end = end or datetime.now(timezone.utc)
+    window_s = int(window.total_seconds())
+    tally = tally if tally is not None else Counter()
+
+    for _ in range(count):
+        row_kind = kind()
+        row_currency = currency()
+        row_cp_country = cp_country()
+        amount = min(rng.lognormvariate(amount_mu, amount_sigma), amount_cap)
+        if rng.random() < violating_fraction:
+            if rng.random() < 0.5:
+                row_kind, row_cp_country = "Transfer", rng.choice(BANNED_COUNTRIES)
+                tally["violation:banned_country"] += 1
+            else:
+                row_kind, row_currency = "Deposit", "USD"
+                amount = DAILY_LIMIT_USD * rng.uniform(1.5, 3.0)
+                tally["violation:daily_limit"] += 1
+        tally[row_kind] += 1
+
+        row = [
+            rng.choice(account_identifiers),
+            row_kind,
+            "",
+            f"{amount:.2f}",
+            row_currency,
+            _iso_z(end - timedelta(seconds=rng.randrange(window_s + 1))),
+            "", "", "", "", "", "", "",
+        ]
+        if row_kind == "Transfer":
+            row[2] = transfer_method()
+            row[6:] = [
+                "Counterparty Inc", "", "", "",
+                "TAX_ID", f"CP-{seed}-{rng.getrandbits(64):016x}", row_cp_country,
+            ]
+        yield row
+
+
+# -------------------------------------------------
+# Writers
+# -------------------------------------------------
+
+
+def csv_chunks(header: str, rows: Iterable[Sequence[str]], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream a CSV file (UTF-8, "\\n" line endings) as byte chunks of about chunk_size.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    buffer.write(header + "\n")
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    ),
+}
+
+_SHEET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_CLOSE = "</sheetData></worksheet>"
+
+
+def _column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        name = chr(ord("A") + rem) + name
+    return name
+
+
+def _xlsx_row(number: int, values: Sequence[str], columns: Sequence[str]) -> str:
+    # Every cell is an inline string: the API reads each one with GetString().
+    cells = "".join(
+        f'<c r="{col}{number}" t="inlineStr"><is><t xml:space="preserve">{escape(str(v))}</t></is></c>'
+        for col, v in zip(columns, values)
+        if v != ""
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+class _ChunkSink:
+    """
+    Write-only, non-seekable file object collecting what zipfile writes between yields.
+    """
+
+    def __init__(self):
+        self.parts: list[bytes] = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data, self.parts, self.size = b"".join(self.parts), [], 0
+        return data
+
+
+def xlsx_chunks(header: str, rows: Iterable[Sequence[str]], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream a single-sheet XLSX workbook (header in row 1) as byte chunks.
+
+    The zip archive is written to a non-seekable sink (entries use data descriptors and
+    Zip64), so only the compressor state and the pending chunk are held in memory.
+    """
+    sink = _ChunkSink()
+    names = header.split(",")
+    columns = [_column_name(i) for i in range(len(names))]
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write((_SHEET_OPEN + _xlsx_row(1, names, columns)).encode("utf-8"))
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, row, columns).encode("utf-8"))
+                if sink.size >= chunk_size:
+                    yield sink.drain()
+            sheet.write(_SHEET_CLOSE.encode("utf-8"))
+    yield sink.drain()
+
+
+def import_file_chunks(file_name: str, header: str, rows: Iterable[Sequence[str]]) -> Iterator[bytes]:
+    """
+    Stream rows as CSV or XLSX, chosen by the extension of file_name.
+    """
+    if file_name.lower().endswith(".xlsx"):
+        return xlsx_chunks(header, rows)
+    return csv_chunks(header, rows)
+
+
+def write_import_file(path: str, header: str, rows: Iterable[Sequence[str]]) -> int:
+    """
+    Write rows to path (CSV or XLSX by extension) and return the file size in bytes.
+    """
+    size = 0
+    with open(path, "wb") as f:
+        for chunk in import_file_chunks(path, header, rows):
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
@@ -0,0 +1,157 @@
+import json
+import re
+import threading
+
+from tests.helpers.histogram import LatencyHistogram
+
+_GUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_NUMBER_RE = re.compile(r"^\d+$")
+
+
+def route_template(path: str) -> str:
+    """
+    Collapse a concrete request path into its route template.
+
+    GUID and numeric path segments are replaced by `{id}` and the query string is dropped, e.g.
+        /api/cases/8c6f...e1/findings?page=1  ->  /api/cases/{id}/findings
+
+    Args:
+        path: Request path (optionally with query string).
+
+    Returns:
+        Route template string.
+    """
+    path = path.split("?", 1)[0]
+    segments = [
+        "{id}" if _GUID_RE.match(seg) or _NUMBER_RE.match(seg) else seg
+        for seg in path.split("/")
+    ]
+    return "/".join(segments)
+
+
+class EndpointStats:
+    """
+    Aggregated measurements for one (method, route template) pair.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.statuses: dict[int, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = LatencyHistogram()
+
+    def record(self, status: int, bytes_out: int, bytes_in: int, latency_ms: float):
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_out += bytes_out
+        self.bytes_in += bytes_in
+        self.latency.record(latency_ms)
+
+    def merge(self, other: "EndpointStats"):
+        self.count += other.count
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        self.bytes_out += other.bytes_out
+        self.bytes_in += other.bytes_in
+        self.latency.merge(other.latency)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "bytesIn": self.bytes_in,
+            "bytesOut": self.bytes_out,
+            "latencyMs": {
+                "mean": self.latency.mean(),
+                "p50": self.latency.percentile(50),
+                "p95": self.latency.percentile(95),
+                "p99": self.latency.percentile(99),
+                "max": self.latency.max,
+                "histogram": self.latency.to_dict(),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EndpointStats":
+        s = cls()
+        s.count = data["count"]
+        s.statuses = {int(k): v for k, v in data["statuses"].items()}
+        s.bytes_in = data["bytesIn"]
+        s.bytes_out = data["bytesOut"]
+        s.latency = LatencyHistogram.from_dict(data["latencyMs"]["histogram"])
+        return s
+
+
+class EndpointMetrics:
+    """
+    Thread-safe registry of per-endpoint request measurements recorded by ApiClient.
+
+    Keys are "<METHOD> <route template>" (e.g. "GET /api/cases/{id}/findings").
+    Registries are mergeable, so results from several clients, workers or runs can be combined.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, EndpointStats] = {}
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """
+        Register a callback invoked after every recorded request with the same
+        arguments as `record` (method, route, status, bytes_out, bytes_in, latency_s).
+        """
+        self._listeners.append(callback)
+
+    @staticmethod
+    def key(method: str, route: str) -> str:
+        return f"{method.upper()} {route}"
+
+    def record(self, method: str, route: str, status: int, bytes_out: int, bytes_in: int, latency_s: float):
+        """
+        Record one request.
+
+        Args:
+            method: HTTP method.
+            route: Route template (see route_template).
+            status: HTTP status code, or 0 if the request failed without a response.
+            bytes_out: Request body size in bytes.
+            bytes_in: Response body size in bytes.
+            latency_s: Wall-clock latency in seconds.
+        """
+        k = self.key(method, route)
+        with self._lock:
+            stats = self.endpoints.get(k)
+            if stats is None:
+                stats = self.endpoints[k] = EndpointStats()
+            stats.record(status, bytes_out, bytes_in, latency_s * 1000.0)
+        for callback in self._listeners:
+            callback(method, route, status, bytes_out, bytes_in, latency_s)
+
+    def merge(self, other: "EndpointMetrics"):
+        with other._lock:
+            items = [(k, EndpointStats.from_dict(v.to_dict())) for k, v in other.endpoints.items()]
+        with self._lock:
+            for k, stats in items:
+                mine = self.endpoints.get(k)
+                if mine is None:
+                    self.endpoints[k] = stats
+                else:
+                    mine.merge(stats)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {k: self.endpoints[k].to_dict() for k in sorted(self.endpoints)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EndpointMetrics":
+        m = cls()
+        m.endpoints = {k: EndpointStats.from_dict(v) for k, v in data.items()}
+        return m
+
+    def dump(self, path: str):
+        """
+        Write the registry as JSON to `path`.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
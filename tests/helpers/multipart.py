@@ -0,0 +1,209 @@
+"""
+Streaming multipart/form-data bodies for the import endpoints.
+
+requests (`files=`) and httpx build the whole multipart body in memory, so a
+multi-hundred-MB import would sit in the harness (often twice) before the first byte is
+sent. StreamingMultipart yields the body chunk by chunk instead, reading the file part
+from a path, a file object, bytes or any iterable of byte chunks (e.g.
+tests.helpers.import_files.csv_chunks), and reports upload progress as it goes:
+
+    body = StreamingMultipart("tx.csv", "/data/tx.csv", on_progress=print)
+    session.post(url, data=body, headers={"Content-Type": body.content_type})
+
+When the size of the file part is known up front the body advertises a Content-Length;
+otherwise it is sent with Transfer-Encoding: chunked.
+"""
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import BinaryIO
+
+CHUNK_SIZE = 256 * 1024
+
+UploadSource = bytes | str | os.PathLike | BinaryIO | Iterable[bytes]
+
+
+class UploadProgress:
+    """
+    Snapshot of an upload: bytes handed to the connection so far and the send rate.
+    """
+
+    def __init__(self, bytes_sent: int, total_bytes: int | None, elapsed_s: float, done: bool):
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.elapsed_s = elapsed_s
+        self.done = done
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes_sent / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def fraction(self) -> float | None:
+        return self.bytes_sent / self.total_bytes if self.total_bytes else None
+
+    def to_dict(self) -> dict:
+        return {
+            "bytesSent": self.bytes_sent,
+            "totalBytes": self.total_bytes,
+            "elapsedSeconds": self.elapsed_s,
+            "bytesPerSec": self.bytes_per_sec,
+        }
+
+    def __repr__(self) -> str:
+        total = f"/{self.total_bytes}" if self.total_bytes is not None else ""
+        return f"UploadProgress({self.bytes_sent}{total} bytes, {self.bytes_per_sec / 1e6:.2f} MB/s, done={self.done})"
+
+
+def _source_size(source) -> int | None:
+    """
+    Size in bytes of the file part, or None when it is only known once fully read.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if hasattr(source, "read"):
+        try:
+            return os.fstat(source.fileno()).st_size - source.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        try:
+            position = source.tell()
+            end = source.seek(0, os.SEEK_END)
+            source.seek(position)
+            return end - position
+        except (AttributeError, OSError, ValueError):
+            return None
+    return None
+
+
+def _read_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _escape_quoted(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "%0D").replace("\n", "%0A")
+
+
+class StreamingMultipart:
+    """
+    multipart/form-data body with a single file field, produced lazily.
+
+    The object is an iterable of byte chunks accepted as `data=` by requests and as
+    `content=` by httpx (sync clients; use `aiter()` with an AsyncClient). It can be
+    iterated once. Progress is reported to `on_progress` at most every
+    `progress_interval_s` seconds and always once more when the body is exhausted;
+    `progress()` returns the current snapshot at any time.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        source: UploadSource,
+        content_type: str = "text/csv",
+        *,
+        field: str = "file",
+        chunk_size: int = CHUNK_SIZE,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        progress_interval_s: float = 1.0,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.source = source
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.progress_interval_s = progress_interval_s
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_escape_quoted(field)}"; '
+            f'filename="{_escape_quoted(file_name)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        size = _source_size(source)
+        self.total_bytes = None if size is None else len(self._head) + size + len(self._tail)
+
+        self.bytes_sent = 0
+        self._started: float | None = None
+        self._finished: float | None = None
+        self._last_report = 0.0
+        self._consumed = False
+
+    @property
+    def len(self) -> int:
+        # requests sizes iterable bodies through `len`; without it the body goes out chunked.
+        if self.total_bytes is None:
+            raise AttributeError("len")
+        return self.total_bytes
+
+    def headers(self) -> dict:
+        """
+        Content-Type (and Content-Length when known) of this body.
+        """
+        headers = {"Content-Type": self.content_type}
+        if self.total_bytes is not None:
+            headers["Content-Length"] = str(self.total_bytes)
+        return headers
+
+    def progress(self) -> UploadProgress:
+        if self._started is None:
+            return UploadProgress(0, self.total_bytes, 0.0, False)
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return UploadProgress(self.bytes_sent, self.total_bytes, end - self._started, self._finished is not None)
+
+    def _file_chunks(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for offset in range(0, len(view), self.chunk_size):
+                yield bytes(view[offset : offset + self.chunk_size])
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from _read_chunks(f, self.chunk_size)
+        elif hasattr(source, "read"):
+            yield from _read_chunks(source, self.chunk_size)
+        else:
+            for chunk in source:
+                if chunk:
+                    yield bytes(chunk)
+
+    def _sent(self, n: int):
+        self.bytes_sent += n
+        now = time.perf_counter()
+        if self.on_progress is not None and now - self._last_report >= self.progress_interval_s:
+            self._last_report = now
+            self.on_progress(self.progress())
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._consumed:
+            raise RuntimeError("StreamingMultipart bodies can only be sent once.")
+        self._consumed = True
+        self._started = self._last_report = time.perf_counter()
+
+        yield self._head
+        self._sent(len(self._head))
+        for chunk in self._file_chunks():
+            yield chunk
+            self._sent(len(chunk))
+        yield self._tail
+        self.bytes_sent += len(self._tail)
+
+        self._finished = time.perf_counter()
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """
+        The same chunks as an async iterator, for httpx.AsyncClient (`content=body.aiter()`).
+
+        File reads stay blocking; they are bounded by chunk_size.
+        """
+        for chunk in self:
+            yield chunk
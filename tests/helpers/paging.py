@@ -0,0 +1,201 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from tests.helpers.assertions import assert_status
+
+# Largest pageSize accepted by every paged endpoint (PaginationDefaults.MaxPageSize).
+MAX_PAGE_SIZE = 100
+
+
+class PageDriftError(AssertionError):
+    """
+    Raised by scan_pages when the underlying data set changed while it was being scanned
+    (total row count moved, or the same row showed up on two pages).
+    """
+
+
+def paged_items(body) -> list:
+    """
+    Normalize "paged" responses:
+      - { "items": [...] }      (PagedResponse / PagedResult / PagedTransactionsResponseDto)
+      - { "Items": [...] }      (PascalCase)
+      - [...]                  (already a list)
+    """
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("items", "Items"):
+            if isinstance(body.get(key), list):
+                return body[key]
+    return []
+
+
+def paged_total_pages(body) -> int | None:
+    """
+    Returns:
+        `totalPages` of a paged response, or None if the payload does not report it.
+    """
+    if isinstance(body, dict):
+        for key in ("totalPages", "TotalPages"):
+            if isinstance(body.get(key), int):
+                return body[key]
+    return None
+
+
+def paged_total_count(body) -> int | None:
+    """
+    Returns:
+        Total number of rows reported by a paged response (`total` or `totalCount`), or None.
+    """
+    if isinstance(body, dict):
+        for key in ("total", "totalCount", "Total", "TotalCount"):
+            if isinstance(body.get(key), int):
+                return body[key]
+    return None
+
+
+def _fetch_page(search, params: dict, page: int, page_size: int) -> dict:
+    r = search({**params, "page": page, "pageSize": page_size})
+    assert_status(r, 200)
+    return r.json()
+
+
+def iter_pages(search, params: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+    """
+    Lazily walk every page of a paged endpoint.
+
+    While the caller consumes page N, page N+1 is fetched on a background thread, so at most
+    two pages are held in memory regardless of how many rows the endpoint returns.
+
+    Args:
+        search: Callable taking a query-params dict and returning a response (e.g. ApiClient.transactions_search).
+        params: Filter/sort query params; `page` and `pageSize` are managed by the iterator.
+        page_size: Rows requested per page.
+        prefetch: If False, pages are fetched synchronously on demand.
+
+    Yields:
+        Parsed JSON body of each page.
+    """
+    params = {k: v for k, v in (params or {}).items() if k not in ("page", "pageSize")}
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") if prefetch else None
+    pending = None
+    try:
+        page = 1
+        body = _fetch_page(search, params, page, page_size)
+        while True:
+            items = paged_items(body)
+            total_pages = paged_total_pages(body)
+            has_next = page < total_pages if total_pages is not None else len(items) >= page_size
+
+            if has_next and executor is not None:
+                pending = executor.submit(_fetch_page, search, params, page + 1, page_size)
+
+            yield body
+
+            if not has_next:
+                return
+            page += 1
+            if pending is not None:
+                body, pending = pending.result(), None
+            else:
+                body = _fetch_page(search, params, page, page_size)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_items(search, params: dict | None = None, *, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True):
+    """
+    Lazily yield every row of a paged endpoint (see iter_pages).
+    """
+    for body in iter_pages(search, params, page_size=page_size, prefetch=prefetch):
+        yield from paged_items(body)
+
+
+def _check_drift(body: dict, page: int, expected_total: int | None, seen_ids: set | None):
+    total = paged_total_count(body)
+    if expected_total is not None and total is not None and total != expected_total:
+        raise PageDriftError(
+            f"Page drift detected on page {page}: total changed from {expected_total} to {total} mid-scan."
+        )
+    if seen_ids is None:
+        return
+    for item in paged_items(body):
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None:
+            continue
+        if item_id in seen_ids:
+            raise PageDriftError(f"Page drift detected on page {page}: row id={item_id} returned by two pages.")
+        seen_ids.add(item_id)
+
+
+def scan_pages(
+    search,
+    params: dict | None = None,
+    *,
+    concurrency: int = 8,
+    ordered: bool = True,
+    page_size: int = MAX_PAGE_SIZE,
+    detect_duplicates: bool = True,
+):
+    """
+    Fetch every page of a paged endpoint concurrently.
+
+    The first page is fetched alone to learn `totalPages`; pages 2..totalPages are independent
+    and fetched by a bounded worker pool with at most `concurrency` requests in flight, so memory
+    stays bounded by `concurrency` pages.
+
+    Page drift (rows inserted/deleted mid-scan) is detected by comparing each page's total row
+    count with the first page's, and optionally by tracking row ids across pages.
+
+    Args:
+        search: Callable taking a query-params dict and returning a response.
+        params: Filter/sort query params; `page` and `pageSize` are managed by the scan.
+        concurrency: Maximum number of pages fetched in parallel.
+        ordered: If True pages are yielded in page order; otherwise as soon as they arrive.
+        page_size: Rows requested per page.
+        detect_duplicates: Track row ids to detect rows shifting between pages. Costs one id per row
+            in memory; disable for very large scans where the total-count check is enough.
+
+    Yields:
+        (page number, parsed JSON body) tuples.
+
+    Raises:
+        PageDriftError: If the data set changed during the scan.
+    """
+    params = {k: v for k, v in (params or {}).items() if k not in ("page", "pageSize")}
+    seen_ids = set() if detect_duplicates else None
+
+    first = _fetch_page(search, params, 1, page_size)
+    expected_total = paged_total_count(first)
+    total_pages = paged_total_pages(first)
+    if total_pages is None:
+        raise ValueError("scan_pages requires an endpoint whose paged response reports totalPages.")
+
+    _check_drift(first, 1, expected_total, seen_ids)
+    yield 1, first
+
+    next_page = 2
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="page-scan")
+    in_flight: dict = {}
+    try:
+        while next_page <= total_pages or in_flight:
+            while next_page <= total_pages and len(in_flight) < concurrency:
+                in_flight[executor.submit(_fetch_page, search, params, next_page, page_size)] = next_page
+                next_page += 1
+
+            if ordered:
+                future = min(in_flight, key=in_flight.get)
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = next(iter(done))
+
+            page = in_flight.pop(future)
+            body = future.result()
+            _check_drift(body, page, expected_total, seen_ids)
+            yield page, body
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,85 @@
+"""
+Helpers for running the integration suite under pytest-xdist (`pytest -n auto --dist loadgroup`).
+
+Every xdist worker is a separate process with its own session-scoped fixtures. These helpers
+let fixtures know which worker they run in and share values computed once per run (e.g. the
+login token) between workers through the run's common base temp directory.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Worker id reported when the suite is not distributed (same value pytest-xdist uses).
+MAIN_WORKER = "master"
+
+
+def worker_id() -> str:
+    """
+    Returns:
+        xdist worker id of the current process ("gw0", "gw1", ...) or MAIN_WORKER.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", MAIN_WORKER)
+
+
+def is_xdist_worker(config) -> bool:
+    """
+    Returns:
+        True if `config` belongs to an xdist worker process.
+    """
+    return hasattr(config, "workerinput")
+
+
+def is_xdist_controller(config) -> bool:
+    """
+    Returns:
+        True if `config` belongs to the xdist controller that distributes tests to workers.
+    """
+    return not is_xdist_worker(config) and bool(getattr(config.option, "numprocesses", None))
+
+
+@contextmanager
+def _file_lock(path, timeout: float = 60.0, poll: float = 0.05):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock {path}")
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+def shared_session_value(tmp_path_factory, name: str, produce):
+    """
+    Compute a JSON-serializable value once per test run and share it between xdist workers.
+
+    The first worker to get here calls `produce()` and caches the result in the run's common
+    temp directory; the other workers read the cached value. Without xdist this is just
+    `produce()`.
+
+    Args:
+        tmp_path_factory: pytest tmp_path_factory fixture.
+        name: Cache key (used as file name).
+        produce: Zero-argument callable producing the value.
+
+    Returns:
+        The shared value.
+    """
+    if worker_id() == MAIN_WORKER:
+        return produce()
+
+    root = tmp_path_factory.getbasetemp().parent
+    path = root / f"{name}.json"
+    with _file_lock(root / f"{name}.lock"):
+        if path.is_file():
+            return json.loads(path.read_text(encoding="utf-8"))
+        value = produce()
+        path.write_text(json.dumps(value), encoding="utf-8")
+        return value
@@ -0,0 +1,150 @@
+import uuid
+from datetime import datetime, timezone
+
+# Column order of the client import file (ClientImportRow).
+CLIENT_IMPORT_HEADER = "LegalType,Name,ContactNumber,Street,City,State,ZipCode,Country,CountryCode,RiskLevel"
+
+# Column order of the account import file (AccountImportRow).
+ACCOUNT_IMPORT_HEADER = "AccountIdentifier,CountryCode,AccountType,CurrencyCode"
+
+# Column order of the transaction import file (TransactionImportRow).
+TRANSACTION_IMPORT_HEADER = (
+    "AccountIdentifier,Type,TransferMethod,Amount,CurrencyCode,OccurredAtUtc,"
+    "CpName,CpBank,CpBranch,CpAccount,CpIdentifierType,CpIdentifier,CpCountryCode"
+)
+
+
+def valid_client_payload(
+    *,
+    legal_type: int = 0,
+    name: str = "John Doe",
+    contact_number: str = "+5511999999999",
+    country_code: str = "BR",
+    initial_risk_level: int | None = 1,
+):
+    """
+    Build a valid CreateClientRequest body (POST /api/clients).
+    """
+    payload = {
+        "legalType": legal_type,
+        "name": name,
+        "contactNumber": contact_number,
+        "addressJson": {
+            "street": "Av Paulista",
+            "city": "São Paulo",
+            "state": "SP",
+            "zipCode": "01310-100",
+            "country": "Brazil",
+        },
+        "countryCode": country_code,
+    }
+    if initial_risk_level is not None:
+        payload["initialRiskLevel"] = initial_risk_level
+    return payload
+
+
+def valid_account_payload(
+    *,
+    account_identifier: str | None = None,
+    country_code: str = "BR",
+    account_type: int = 0,  # enum int
+    currency_code: str = "BRL",
+):
+    """
+    Build a valid CreateAccountRequest body (POST /api/clients/{clientId}/accounts).
+    """
+    if account_identifier is None:
+        account_identifier = f"ACC-{uuid.uuid4()}"
+    return {
+        "accountIdentifier": account_identifier,
+        "countryCode": country_code,
+        "accountType": account_type,
+        "currencyCode": currency_code,
+    }
+
+
+def client_import_row(*, name: str, country_code: str = "BR", risk_level: str = "Low") -> str:
+    """
+    One CSV row for POST /api/clients/import matching CLIENT_IMPORT_HEADER.
+    """
+    return f"Individual,{name},+5511999999999,Av Paulista,São Paulo,SP,01310-100,Brazil,{country_code},{risk_level}"
+
+
+def account_import_row(*, account_identifier: str, country_code: str = "BR", currency_code: str = "BRL") -> str:
+    """
+    One CSV row for POST /api/clients/{clientId}/accounts/import matching ACCOUNT_IMPORT_HEADER.
+    """
+    return f"{account_identifier},{country_code},Checking,{currency_code}"
+
+
+def transaction_import_row(
+    *,
+    account_identifier: str,
+    kind: str = "Deposit",
+    amount: float = 10.00,
+    currency: str = "BRL",
+    occurred_at: str | None = None,
+    cp_country: str = "US",
+    cp_identifier: str | None = None,
+    transfer_method: str = "PIX",
+    cp_identifier_type: str = "TAX_ID",
+) -> str:
+    """
+    One CSV row for POST /api/transactions/import matching TRANSACTION_IMPORT_HEADER.
+
+    Counterparty columns are only filled for kind="Transfer".
+    """
+    occurred_at = occurred_at or now_iso_z()
+    if kind != "Transfer":
+        return f"{account_identifier},{kind},,{amount:.2f},{currency},{occurred_at},,,,,,,"
+    cp_identifier = cp_identifier or f"CP-{uuid.uuid4()}"
+    return (
+        f"{account_identifier},Transfer,{transfer_method},{amount:.2f},{currency},{occurred_at},"
+        f"Counterparty Inc,,,,{cp_identifier_type},{cp_identifier},{cp_country}"
+    )
+
+
+def now_iso_z() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def deposit_payload(account_id: str, *, amount: float = 100.50, currency: str = "BRL", occurred_at: str | None = None):
+    """
+    Build a CreateTransactionRequest body for a deposit (POST /api/transactions).
+    """
+    return {
+        "accountId": account_id,
+        "type": 0,  # Deposit
+        "amount": amount,
+        "currencyCode": currency,
+        "occurredAtUtc": occurred_at or now_iso_z(),
+    }
+
+
+def transfer_payload(
+    account_id: str,
+    *,
+    amount: float = 10.00,
+    currency: str = "BRL",
+    cp_country: str = "US",
+    cp_identifier_type: int = 0,
+    cp_identifier: str | None = None,
+    transfer_method: int = 0,  # PIX
+    cp_name: str = "Counterparty Inc",
+    occurred_at: str | None = None,
+):
+    """
+    Build a CreateTransactionRequest body for a transfer (POST /api/transactions).
+    """
+    return {
+        "accountId": account_id,
+        "type": 2,  # Transfer
+        "transferMethod": transfer_method,
+        "amount": amount,
+        "currencyCode": currency,
+        "occurredAtUtc": occurred_at or now_iso_z(),
+        "cpCountryCode": cp_country,
+        "cpIdentifierType": cp_identifier_type,
+        "cpIdentifier": cp_identifier or f"CP-{uuid.uuid4()}",
+        "cpName": cp_name,
+    }
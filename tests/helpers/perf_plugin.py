@@ -0,0 +1,277 @@
+"""
+pytest plugin producing an endpoint performance report for the whole integration run.
+
+Usage:
+    pytest --perf-report=perf.json
+
+Every request recorded by the session EndpointMetrics registry is attributed to the
+test module and pytest phase (setup / call / teardown) that was running when it was
+issued. At session end the plugin writes a JSON report and prints a terminal summary
+with request counts, p50/p95/p99 latency and error rates per endpoint and per module.
+
+Benchmarks (tests/perf) hand their results to the `record_benchmark` fixture; those are
+added to the report and printed in the terminal summary even without --perf-report.
+
+Under pytest-xdist every worker sends its measurements to the controller, which merges
+them and writes a single report.
+"""
+import json
+import os
+import threading
+
+import pytest
+
+from tests.helpers.metrics import EndpointMetrics
+from tests.helpers.parallel import is_xdist_worker
+
+PHASES = ("setup", "call", "teardown")
+
+
+def _is_error(status: int) -> bool:
+    # Transport failures (0) and server errors; 4xx are expected by negative tests.
+    return status == 0 or status >= 500
+
+
+def _summarize(stats) -> dict:
+    server_errors = sum(n for s, n in stats.statuses.items() if _is_error(s))
+    client_errors = sum(n for s, n in stats.statuses.items() if 400 <= s < 500)
+    return {
+        "count": stats.count,
+        "totalMs": stats.latency.total,
+        "p50Ms": stats.latency.percentile(50),
+        "p95Ms": stats.latency.percentile(95),
+        "p99Ms": stats.latency.percentile(99),
+        "maxMs": stats.latency.max,
+        "errorRate": server_errors / stats.count if stats.count else 0.0,
+        "clientErrorRate": client_errors / stats.count if stats.count else 0.0,
+        "bytesIn": stats.bytes_in,
+        "bytesOut": stats.bytes_out,
+    }
+
+
+class _ModuleReport:
+    def __init__(self):
+        self.tests = 0
+        self.phase_s = dict.fromkeys(PHASES, 0.0)
+        self.request_ms_by_phase = dict.fromkeys(PHASES, 0.0)
+        self.metrics = EndpointMetrics()
+
+
+class PerfCollector:
+    """
+    Aggregates ApiClient requests and pytest phase durations per test module,
+    plus results recorded by benchmarks.
+
+    Request tracking only runs when a report path is set; benchmark results are
+    always collected.
+    """
+
+    def __init__(self, path: str | None, config=None):
+        self.path = path
+        self.config = config
+        self.metrics = EndpointMetrics()
+        self.modules: dict[str, _ModuleReport] = {}
+        self.benchmarks: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._module: str | None = None
+        self._phase: str | None = None
+
+    def _module_report(self, module: str) -> _ModuleReport:
+        with self._lock:
+            report = self.modules.get(module)
+            if report is None:
+                report = self.modules[module] = _ModuleReport()
+            return report
+
+    def on_request(self, method: str, route: str, status: int, bytes_out: int, bytes_in: int, latency_s: float):
+        """
+        EndpointMetrics listener; attributes the request to the running module/phase.
+        """
+        self.metrics.record(method, route, status, bytes_out, bytes_in, latency_s)
+
+        module, phase = self._module or "<session>", self._phase or "setup"
+        report = self._module_report(module)
+        report.metrics.record(method, route, status, bytes_out, bytes_in, latency_s)
+        with self._lock:
+            report.request_ms_by_phase[phase] += latency_s * 1000.0
+
+    def record_benchmark(self, name: str, result: dict):
+        """
+        Store a benchmark result.
+
+        Args:
+            name: Benchmark name (one entry per name; re-recording replaces it).
+            result: JSON-serializable result. Latency distributions go under
+                `series` as {name: LatencyHistogram.summary()} and scalar results
+                (throughput, error rates, ...) under `metrics` as {name: number}; both
+                are printed in the summary.
+        """
+        with self._lock:
+            self.benchmarks[name] = result
+
+    # -------------------------------------------------
+    # pytest hooks
+    # -------------------------------------------------
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self._module = item.nodeid.split("::", 1)[0]
+        self._module_report(self._module).tests += 1
+        yield
+        self._module = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self._phase = "setup"
+        yield
+        self._phase = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        self._phase = "call"
+        yield
+        self._phase = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        self._phase = "teardown"
+        yield
+        self._phase = None
+
+    def pytest_runtest_logreport(self, report):
+        module = report.nodeid.split("::", 1)[0]
+        r = self._module_report(module)
+        with self._lock:
+            r.phase_s[report.when] += report.duration
+
+    def worker_state(self) -> dict:
+        """
+        Serializable measurements sent from an xdist worker to the controller.
+
+        Phase durations are left out: the controller receives every test report
+        itself and accounts for them in pytest_runtest_logreport.
+        """
+        return {
+            "benchmarks": dict(self.benchmarks),
+            "metrics": self.metrics.to_dict(),
+            "modules": {
+                name: {
+                    "tests": m.tests,
+                    "requestMsByPhase": dict(m.request_ms_by_phase),
+                    "metrics": m.metrics.to_dict(),
+                }
+                for name, m in self.modules.items()
+            },
+        }
+
+    def merge_worker_state(self, state: dict):
+        with self._lock:
+            self.benchmarks.update(state["benchmarks"])
+        self.metrics.merge(EndpointMetrics.from_dict(state["metrics"]))
+        for name, data in state["modules"].items():
+            report = self._module_report(name)
+            report.metrics.merge(EndpointMetrics.from_dict(data["metrics"]))
+            with self._lock:
+                report.tests += data["tests"]
+                for phase, ms in data["requestMsByPhase"].items():
+                    report.request_ms_by_phase[phase] += ms
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        state = getattr(node, "workeroutput", {}).get("perf")
+        if state:
+            self.merge_worker_state(state)
+
+    def to_dict(self) -> dict:
+        endpoints = self.metrics.endpoints
+        modules = {}
+        for name in sorted(self.modules):
+            m = self.modules[name]
+            modules[name] = {
+                "tests": m.tests,
+                "phaseSeconds": dict(m.phase_s),
+                "requestMsByPhase": dict(m.request_ms_by_phase),
+                "endpoints": {k: _summarize(v) for k, v in sorted(m.metrics.endpoints.items())},
+            }
+        return {
+            "endpoints": {k: _summarize(v) for k, v in sorted(endpoints.items())},
+            "modules": modules,
+            "histograms": self.metrics.to_dict(),
+            "benchmarks": dict(sorted(self.benchmarks.items())),
+        }
+
+    def pytest_sessionfinish(self, session):
+        if self.config is not None and is_xdist_worker(self.config):
+            self.config.workeroutput["perf"] = self.worker_state()
+            return
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.config is not None and is_xdist_worker(self.config):
+            return
+        tr = terminalreporter
+        report = self.to_dict()
+        if report["benchmarks"]:
+            self._write_benchmarks(tr, report["benchmarks"])
+        if not self.path:
+            return
+
+        tr.write_sep("-", "endpoint performance (by total time)")
+        tr.write_line(f"{'endpoint':<55} {'count':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'err%':>6} {'total s':>8}")
+        ranked = sorted(report["endpoints"].items(), key=lambda kv: kv[1]["totalMs"], reverse=True)
+        for key, s in ranked[:20]:
+            tr.write_line(
+                f"{key:<55} {s['count']:>6} {s['p50Ms']:>8.1f} {s['p95Ms']:>8.1f} {s['p99Ms']:>8.1f} "
+                f"{100 * s['errorRate']:>6.1f} {s['totalMs'] / 1000:>8.2f}"
+            )
+
+        tr.write_sep("-", "module time: setup vs body")
+        tr.write_line(f"{'module':<40} {'tests':>6} {'setup s':>8} {'call s':>8} {'req setup s':>11} {'req call s':>10}")
+        ranked_modules = sorted(
+            report["modules"].items(),
+            key=lambda kv: sum(kv[1]["phaseSeconds"].values()),
+            reverse=True,
+        )
+        for name, m in ranked_modules:
+            tr.write_line(
+                f"{name:<40} {m['tests']:>6} {m['phaseSeconds']['setup']:>8.2f} {m['phaseSeconds']['call']:>8.2f} "
+                f"{m['requestMsByPhase']['setup'] / 1000:>11.2f} {m['requestMsByPhase']['call'] / 1000:>10.2f}"
+            )
+        tr.write_line(f"perf report written to {self.path}")
+
+    @staticmethod
+    def _write_benchmarks(tr, benchmarks: dict):
+        tr.write_sep("-", "benchmarks")
+        tr.write_line(f"{'benchmark / series':<60} {'count':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'maxms':>8}")
+        for name, result in benchmarks.items():
+            params = result.get("params")
+            tr.write_line(f"{name}" + (f"  {json.dumps(params)}" if params else ""))
+            metrics = result.get("metrics")
+            if metrics:
+                tr.write_line("  " + "  ".join(f"{k}={v:.6g}" if isinstance(v, float) else f"{k}={v}" for k, v in metrics.items()))
+            for series, s in result.get("series", {}).items():
+                if not s.get("count"):
+                    tr.write_line(f"  {series:<58} {0:>6}")
+                    continue
+                tr.write_line(
+                    f"  {series:<58} {s['count']:>6} {s['p50Ms']:>8.1f} {s['p95Ms']:>8.1f} "
+                    f"{s['p99Ms']:>8.1f} {s['maxMs']:>8.1f}"
+                )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-report",
+        action="store",
+        default=os.getenv("API_PERF_REPORT"),
+        help="Write an endpoint performance report (JSON) for the run and print a terminal summary",
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(PerfCollector(config.getoption("--perf-report"), config), "perf-collector")
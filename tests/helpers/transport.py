@@ -0,0 +1,149 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats:
+    """
+    Thread-safe connection pool counters shared by every pool of a HttpTransport.
+
+    Counters:
+        checkouts: connections handed out to a request.
+        opened:    checkouts that had to open a new TCP/TLS connection.
+        reused:    checkouts served by an idle keep-alive connection.
+        waited:    checkouts that found the pool empty (blocked when pool_block=True).
+        discarded: connections dropped on release because the pool was already full.
+        expired:   idle connections closed because they exceeded max_idle.
+    """
+
+    FIELDS = ("checkouts", "opened", "reused", "waited", "discarded", "expired")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def incr(self, field: str, amount: int = 1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            Copy of the current counters.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+
+class _TrackedPoolMixin:
+    """
+    urllib3 connection pool hooks feeding PoolStats and enforcing max_idle.
+
+    `stats` and `max_idle` are bound as class attributes by _TrackedAdapter.
+    """
+
+    stats: PoolStats
+    max_idle: float | None = None
+
+    def _get_conn(self, timeout=None):
+        if self.pool is not None and self.pool.empty():
+            self.stats.incr("waited")
+
+        conn = super()._get_conn(timeout)
+
+        if conn.sock is not None and self.max_idle is not None:
+            idle_since = getattr(conn, "_idle_since", None)
+            if idle_since is not None and time.monotonic() - idle_since > self.max_idle:
+                conn.close()
+                self.stats.incr("expired")
+
+        self.stats.incr("checkouts")
+        self.stats.incr("reused" if conn.sock is not None else "opened")
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._idle_since = time.monotonic()
+            if self.pool is not None and self.pool.full():
+                self.stats.incr("discarded")
+        super()._put_conn(conn)
+
+
+class _TrackedAdapter(HTTPAdapter):
+    """
+    requests adapter whose urllib3 pools report to a shared PoolStats.
+    """
+
+    def __init__(self, stats: PoolStats, max_idle: float | None, **kwargs):
+        attrs = {"stats": stats, "max_idle": max_idle}
+        self._pool_classes = {
+            "http": type("TrackedHTTPConnectionPool", (_TrackedPoolMixin, HTTPConnectionPool), attrs),
+            "https": type("TrackedHTTPSConnectionPool", (_TrackedPoolMixin, HTTPSConnectionPool), attrs),
+        }
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+class HttpTransport:
+    """
+    Shared, configurable connection pool behind ApiClient and every client derived from it.
+
+    One HttpTransport holds a single requests.Session; clients built with `with_token`
+    reuse it, so per-analyst clients do not pay their own TCP/TLS handshakes.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_hosts: int = 10,
+        keep_alive: bool = True,
+        max_idle: float | None = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_maxsize: Maximum number of connections kept per host.
+            pool_block: If True, requests wait for a free connection instead of opening
+                an extra (discarded) one when the per-host pool is exhausted.
+            max_hosts: Number of per-host pools cached by the pool manager.
+            keep_alive: If False, every request asks the server to close the connection.
+            max_idle: Seconds an idle connection may stay in the pool before it is closed
+                instead of reused (None = no limit).
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_hosts = max_hosts
+        self.keep_alive = keep_alive
+        self.max_idle = max_idle
+        self.stats = PoolStats()
+
+        self.session = requests.Session()
+        adapter = _TrackedAdapter(
+            self.stats,
+            max_idle,
+            pool_connections=max_hosts,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        self.session.close()
@@ -0,0 +1,95 @@
+import time
+
+
+class WaitTimeoutError(AssertionError):
+    """
+    Raised by wait_until when the condition did not hold before the deadline.
+    """
+
+
+def wait_until(
+    probe,
+    *,
+    timeout: float = 10.0,
+    initial_delay: float = 0.05,
+    max_delay: float = 1.0,
+    factor: float = 2.0,
+    description: str | None = None,
+):
+    """
+    Call `probe()` until it returns a truthy value, backing off exponentially between attempts.
+
+    The first probe runs immediately, so a condition that already holds costs a single call.
+    Delays grow from `initial_delay` by `factor` up to `max_delay` and never overshoot the deadline.
+
+    Args:
+        probe: Zero-argument callable; a truthy return value ends the wait. Exceptions propagate.
+        timeout: Total time budget in seconds.
+        initial_delay: Delay before the second attempt.
+        max_delay: Upper bound of the delay between attempts.
+        factor: Backoff multiplier.
+        description: What is being waited for (used in the timeout message).
+
+    Returns:
+        The first truthy value returned by `probe`.
+
+    Raises:
+        WaitTimeoutError: If the deadline passes first.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempts = 0
+    while True:
+        attempts += 1
+        result = probe()
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeoutError(
+                f"{description or 'Condition'} not met within {timeout}s ({attempts} attempts). "
+                f"Last result: {result!r}"
+            )
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_delay)
+
+
+def eventually(
+    assertion,
+    *,
+    timeout: float = 10.0,
+    initial_delay: float = 0.05,
+    max_delay: float = 1.0,
+    factor: float = 2.0,
+):
+    """
+    Retry `assertion()` until it stops raising AssertionError (see wait_until for the backoff).
+
+    Args:
+        assertion: Zero-argument callable that raises AssertionError while the expected state
+            is not reached yet.
+
+    Returns:
+        Whatever `assertion()` returned on its first successful call.
+
+    Raises:
+        AssertionError: The last assertion failure, if the deadline passes first.
+    """
+    last_error: list[AssertionError] = []
+
+    def probe():
+        try:
+            value = assertion()
+        except AssertionError as ex:
+            last_error[:] = [ex]
+            return None
+        # Wrapped so that a falsy return value still counts as success.
+        return (value,)
+
+    try:
+        return wait_until(
+            probe, timeout=timeout, initial_delay=initial_delay, max_delay=max_delay, factor=factor
+        )[0]
+    except WaitTimeoutError:
+        raise last_error[0] from None
@@ -0,0 +1,441 @@
+"""
+Multi-host open-loop load: one coordinator, N agents, one TCP control channel each.
+
+The coordinator owns the scenario (target, arrival schedule, accounts). Agents connect
+to it, possibly from other machines, and each drives its share of the load from its own
+process, logging in with the analyst credentials of its own environment or arguments:
+
+    agent -> coordinator   hello     {"version", "agent", "weight"}
+    coordinator -> agent   scenario  {"share": {...}, "progressInterval"}
+    agent -> coordinator   ready     (logged in, client built)
+    coordinator -> agent   start     {"startIn": seconds}
+    agent -> coordinator   progress  {"result": LoadResult.to_dict()}   every progressInterval
+    agent -> coordinator   result    {"result": LoadResult.to_dict()}   once, at the end
+    either direction       error     {"message"}
+
+Messages are newline-delimited JSON. The schedule and the accounts are dealt to agents
+in proportion to their weight (smooth weighted round-robin), so an agent with weight 2
+offers twice the rate of one with weight 1 and the combined profile is unchanged.
+`start` carries a relative delay instead of a timestamp, so agents do not need
+synchronized clocks; their start times differ by the control-message delivery skew.
+Progress snapshots are cumulative and merged live by the coordinator.
+
+The channel is unauthenticated, so credentials never travel on it, and the coordinator
+listens on 127.0.0.1 unless --listen names another interface: expose it on a trusted
+network only.
+
+Command line:
+    python -m tests.perf.distributed coordinator --listen 10.0.0.5:7700 --agents 3 --rate 600 --duration 120
+    python -m tests.perf.distributed agent --connect 10.0.0.5:7700 --weight 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import time
+
+from tests.perf.loadgen import (
+    LoadResult,
+    add_load_arguments,
+    build_schedule,
+    prepare_accounts,
+    run_transactions_load,
+    write_result,
+)
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 7700
+# Scenario messages carry the whole schedule; allow long lines.
+LINE_LIMIT = 64 * 1024 * 1024
+# Lead time between "every agent is ready" and the first scheduled request.
+START_LEAD_S = 1.0
+# Slack on top of the schedule length before an agent is considered lost.
+RESULT_GRACE_S = 60.0
+
+
+async def _send(writer: asyncio.StreamWriter, msg_type: str, **fields):
+    writer.write(json.dumps({"type": msg_type, **fields}).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def _recv(reader: asyncio.StreamReader, timeout: float | None = None) -> dict:
+    """
+    Raises:
+        ConnectionError: If the peer closed the connection or sent an error message.
+        TimeoutError: If nothing arrives within `timeout` seconds.
+    """
+    line = await asyncio.wait_for(reader.readline(), timeout)
+    if not line:
+        raise ConnectionError("Peer closed the control connection.")
+    msg = json.loads(line)
+    if msg.get("type") == "error":
+        raise ConnectionError(msg.get("message", "unknown error"))
+    return msg
+
+
+async def _expect(reader: asyncio.StreamReader, msg_type: str, timeout: float | None = None) -> dict:
+    msg = await _recv(reader, timeout)
+    if msg.get("type") != msg_type:
+        raise ConnectionError(f"Expected '{msg_type}' message, got '{msg.get('type')}'.")
+    return msg
+
+
+def weighted_partition(items: list, weights: list[float]) -> list[list]:
+    """
+    Deal `items` into len(weights) lists in proportion to `weights`, interleaved
+    (smooth weighted round-robin), so every list spans the whole input range.
+    """
+    total = sum(weights)
+    current = [0.0] * len(weights)
+    out = [[] for _ in weights]
+    for item in items:
+        for i, w in enumerate(weights):
+            current[i] += w
+        k = max(range(len(weights)), key=current.__getitem__)
+        current[k] -= total
+        out[k].append(item)
+    return out
+
+
+# -------------------------------------------------
+# Coordinator
+# -------------------------------------------------
+
+
+class _AgentConnection:
+    def __init__(self, name: str, weight: float, reader, writer):
+        self.name = name
+        self.weight = weight
+        self.reader = reader
+        self.writer = writer
+        self.latest: LoadResult | None = None
+
+
+class LoadCoordinator:
+    """
+    Accepts `agents` connections, hands out the scenario, starts every agent together and
+    merges their results.
+
+        coordinator = LoadCoordinator(scenario, agents=3, port=0)
+        await coordinator.start()        # coordinator.port is now bound
+        merged, per_agent = await coordinator.run()
+    """
+
+    def __init__(
+        self,
+        scenario: dict,
+        *,
+        agents: int,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        progress_interval: float = 1.0,
+        join_timeout: float = 60.0,
+        on_progress=None,
+    ):
+        """
+        Args:
+            scenario: base_url, account_ids, offsets, kind, max_in_flight. Everything in it
+                is sent to the agents over the unauthenticated channel.
+            agents: Number of agents to wait for before starting.
+            host: Interface to listen on.
+            port: TCP port (0 picks a free one, see `port` after start()).
+            progress_interval: Seconds between agent progress snapshots.
+            join_timeout: Seconds to wait for all agents to connect and get ready.
+            on_progress: Optional callback(merged LoadResult, {agent: LoadResult}) invoked on
+                every progress snapshot received.
+        """
+        if agents < 1:
+            raise ValueError("agents must be >= 1.")
+        if len(scenario["account_ids"]) < agents:
+            raise ValueError(f"Need at least one account per agent ({len(scenario['account_ids'])} accounts, {agents} agents).")
+        self.scenario = scenario
+        self.expected = agents
+        self.host = host
+        self.port = port
+        self.progress_interval = progress_interval
+        self.join_timeout = join_timeout
+        self.on_progress = on_progress
+        self._agents: list[_AgentConnection] = []
+        self._joined: asyncio.Event | None = None
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self):
+        """
+        Start listening for agents.
+        """
+        self._joined = asyncio.Event()
+        self._server = await asyncio.start_server(self._on_connect, self.host, self.port, limit=LINE_LIMIT)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _on_connect(self, reader, writer):
+        try:
+            hello = await _expect(reader, "hello", timeout=10)
+        except (ConnectionError, TimeoutError, ValueError):
+            writer.close()
+            return
+        if hello.get("version") != PROTOCOL_VERSION:
+            await _send(writer, "error", message=f"protocol version {hello.get('version')} != {PROTOCOL_VERSION}")
+            writer.close()
+            return
+        if len(self._agents) >= self.expected:
+            await _send(writer, "error", message="run already has all its agents")
+            writer.close()
+            return
+        name = hello.get("agent") or f"agent-{len(self._agents)}"
+        if any(a.name == name for a in self._agents):
+            name = f"{name}-{len(self._agents)}"
+        self._agents.append(_AgentConnection(name, float(hello.get("weight", 1.0)), reader, writer))
+        if len(self._agents) == self.expected:
+            self._joined.set()
+
+    def merged_progress(self) -> LoadResult:
+        """
+        Returns:
+            Merge of the latest snapshot of every agent.
+        """
+        merged = LoadResult(0)
+        for agent in self._agents:
+            if agent.latest is not None:
+                merged.merge(agent.latest)
+        return merged
+
+    async def _follow(self, agent: _AgentConnection, timeout: float) -> LoadResult:
+        deadline = time.monotonic() + timeout
+        while True:
+            msg = await _recv(agent.reader, max(deadline - time.monotonic(), 0.01))
+            agent.latest = LoadResult.from_dict(msg["result"])
+            if msg["type"] == "result":
+                return agent.latest
+            if self.on_progress is not None:
+                self.on_progress(self.merged_progress(), {a.name: a.latest for a in self._agents if a.latest})
+
+    async def run(self) -> tuple[LoadResult, dict[str, LoadResult]]:
+        """
+        Wait for the agents, run the scenario and collect the results.
+
+        Returns:
+            (merged result, {agent name: result}).
+
+        Raises:
+            TimeoutError: If the agents do not join, get ready or finish in time.
+            ConnectionError: If an agent fails or disconnects.
+        """
+        if self._server is None:
+            await self.start()
+        try:
+            await asyncio.wait_for(self._joined.wait(), self.join_timeout)
+            self._server.close()
+
+            weights = [a.weight for a in self._agents]
+            accounts = weighted_partition(self.scenario["account_ids"], weights)
+            schedules = weighted_partition(self.scenario["offsets"], weights)
+            for agent, agent_accounts, agent_offsets in zip(self._agents, accounts, schedules):
+                share = {**self.scenario, "account_ids": agent_accounts, "offsets": agent_offsets}
+                await _send(agent.writer, "scenario", share=share, progressInterval=self.progress_interval)
+
+            await asyncio.wait_for(
+                asyncio.gather(*(_expect(a.reader, "ready") for a in self._agents)),
+                self.join_timeout,
+            )
+            for agent in self._agents:
+                await _send(agent.writer, "start", startIn=START_LEAD_S)
+
+            offsets = self.scenario["offsets"]
+            span = (offsets[-1] if offsets else 0.0) + START_LEAD_S + RESULT_GRACE_S
+            results = await asyncio.gather(*(self._follow(a, span) for a in self._agents))
+        except ConnectionError as ex:
+            for agent in self._agents:
+                try:
+                    await _send(agent.writer, "error", message=f"run aborted: {ex}")
+                except ConnectionError:
+                    pass
+            raise
+        finally:
+            self._server.close()
+            for agent in self._agents:
+                agent.writer.close()
+
+        per_agent = {a.name: r for a, r in zip(self._agents, results)}
+        merged = LoadResult(0)
+        for result in results:
+            merged.merge(result)
+        return merged, per_agent
+
+
+# -------------------------------------------------
+# Agent
+# -------------------------------------------------
+
+
+async def run_agent(
+    host: str,
+    port: int,
+    *,
+    email: str,
+    password: str,
+    name: str | None = None,
+    weight: float = 1.0,
+    connect_timeout: float = 30.0,
+):
+    """
+    Connect to a coordinator, run the share it hands out and report back.
+
+    Args:
+        host: Coordinator host.
+        port: Coordinator port.
+        email: Analyst e-mail used to log in to the API.
+        password: Analyst password.
+        name: Agent name in reports (default: <hostname>-<pid>).
+        weight: Relative share of the load this agent should take.
+        connect_timeout: Seconds to keep retrying the connection (the coordinator may
+            not be listening yet).
+
+    Raises:
+        ConnectionError: If the coordinator is unreachable or aborts the run.
+    """
+    from tests.helpers.async_api_client import AsyncApiClient
+
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+            break
+        except OSError as ex:
+            if time.monotonic() >= deadline:
+                raise ConnectionError(f"Could not reach coordinator {host}:{port}: {ex}") from ex
+            await asyncio.sleep(0.5)
+
+    try:
+        await _send(
+            writer,
+            "hello",
+            version=PROTOCOL_VERSION,
+            agent=name or f"{socket.gethostname()}-{os.getpid()}",
+            weight=weight,
+        )
+        msg = await _expect(reader, "scenario")
+        share, interval = msg["share"], msg["progressInterval"]
+
+        try:
+            async with AsyncApiClient(share["base_url"]) as api:
+                r = await api.auth_login(email, password)
+                r.raise_for_status()
+                token = r.json()["token"]
+        except Exception as ex:
+            await _send(writer, "error", message=f"login failed: {ex}")
+            raise ConnectionError(f"login failed: {ex}") from ex
+        await _send(writer, "ready")
+
+        msg = await _expect(reader, "start")
+        start = time.perf_counter() + msg["startIn"]
+        result = LoadResult(len(share["offsets"]))
+        load = asyncio.create_task(
+            run_transactions_load(
+                AsyncApiClient(share["base_url"], token=token),
+                share["account_ids"],
+                share["offsets"],
+                kind=share["kind"],
+                max_in_flight=share["max_in_flight"],
+                start=start,
+                result=result,
+            )
+        )
+        while not load.done():
+            await asyncio.wait({load}, timeout=interval)
+            if not load.done():
+                result.duration_s = max(time.perf_counter() - start, 0.0)
+                await _send(writer, "progress", result=result.to_dict())
+        await _send(writer, "result", result=load.result().to_dict())
+    finally:
+        writer.close()
+
+
+# -------------------------------------------------
+# Command line
+# -------------------------------------------------
+
+
+def _host_port(text: str) -> tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _progress_printer(min_interval: float = 1.0):
+    last = 0.0
+
+    def show(merged: LoadResult, per_agent: dict):
+        nonlocal last
+        now = time.monotonic()
+        if now - last < min_interval:
+            return
+        last = now
+        p99 = merged.corrected.percentile(99)
+        print(
+            f"[{len(per_agent)} agents] completed={merged.completed}/{merged.scheduled} errors={merged.errors} "
+            f"rate={merged.achieved_rate:.1f}/s p99={'-' if p99 is None else f'{p99:.1f}'}ms",
+            flush=True,
+        )
+
+    return show
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = sub.add_parser("coordinator", help="Own the scenario and wait for agents")
+    add_load_arguments(coordinator)
+    coordinator.add_argument(
+        "--listen",
+        default=f"127.0.0.1:{DEFAULT_PORT}",
+        help="host:port for agents (default: loopback only; name an interface for multi-host runs)",
+    )
+    coordinator.add_argument("--agents", type=int, required=True, help="Agents to wait for")
+    coordinator.add_argument("--join-timeout", type=float, default=300.0, help="Seconds to wait for agents")
+
+    agent = sub.add_parser("agent", help="Connect to a coordinator and generate load")
+    agent.add_argument("--connect", required=True, help="Coordinator host:port")
+    agent.add_argument("--name", help="Agent name in reports")
+    agent.add_argument("--weight", type=float, default=1.0, help="Relative share of the load")
+    agent.add_argument("--email", default=os.getenv("TEST_ANALYST_EMAIL", "analyst@ubs.com"))
+    agent.add_argument("--password", default=os.getenv("TEST_ANALYST_PASSWORD", "Password123!"))
+
+    args = parser.parse_args(argv)
+
+    if args.role == "agent":
+        host, port = _host_port(args.connect)
+        asyncio.run(run_agent(host, port, email=args.email, password=args.password, name=args.name, weight=args.weight))
+        return
+
+    _, account_ids = prepare_accounts(args)
+    scenario = {
+        "base_url": args.base_url,
+        "account_ids": account_ids,
+        "offsets": build_schedule(args),
+        "kind": args.kind,
+        "max_in_flight": args.max_in_flight,
+    }
+    host, port = _host_port(args.listen)
+
+    async def coordinate():
+        c = LoadCoordinator(
+            scenario,
+            agents=args.agents,
+            host=host,
+            port=port,
+            join_timeout=args.join_timeout,
+            on_progress=_progress_printer(),
+        )
+        await c.start()
+        print(f"Waiting for {args.agents} agents on {host}:{c.port} ...", flush=True)
+        return await c.run()
+
+    merged, per_agent = asyncio.run(coordinate())
+    for name, result in per_agent.items():
+        print(f"{name}: completed={result.completed} errors={result.errors} achieved={result.achieved_rate:.1f}/s")
+    write_result(merged, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+Open-loop load generator for POST /api/transactions.
+
+Requests are issued on a precomputed arrival schedule (constant, ramp, step or Poisson),
+independent of how fast the API answers, so queueing inside the API shows up in the
+results instead of silently slowing the generator down.
+
+Latency is measured from each request's *intended* send time, which corrects for
+coordinated omission: if the generator could not send on time (too many requests in
+flight, event loop stalled), that delay is charged to the request. The uncorrected
+service time (actual send -> response) is reported alongside.
+
+Command line:
+    python -m tests.perf.loadgen --base-url http://localhost:8080 --profile poisson --rate 50 --duration 60
+    python -m tests.perf.loadgen --profile step --stages 10:30,50:30,100:30 --kind transfer --accounts 50
+    python -m tests.perf.loadgen --rate 400 --duration 60 --accounts 200 --workers 8   (see multiprocess.py)
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import time
+
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.payloads import deposit_payload, transfer_payload
+
+# -------------------------------------------------
+# Arrival schedules (offsets in seconds from the start of the run)
+# -------------------------------------------------
+
+
+def constant(rate: float, duration: float) -> list[float]:
+    """
+    Evenly spaced arrivals at `rate` requests/second.
+    """
+    n = int(rate * duration)
+    return [i / rate for i in range(n)]
+
+
+def ramp(start_rate: float, end_rate: float, duration: float) -> list[float]:
+    """
+    Arrival rate growing linearly from `start_rate` to `end_rate` over `duration`.
+
+    The i-th arrival is placed where the integrated rate reaches i.
+    """
+    if math.isclose(start_rate, end_rate):
+        return constant(start_rate, duration)
+    slope = (end_rate - start_rate) / duration
+    n = int((start_rate + end_rate) / 2 * duration)
+    # Solve start_rate * t + slope * t^2 / 2 = i for t.
+    return [(-start_rate + math.sqrt(start_rate ** 2 + 2 * slope * i)) / slope for i in range(n)]
+
+
+def step(stages: list[tuple[float, float]]) -> list[float]:
+    """
+    Consecutive constant-rate stages, each given as (rate, duration).
+    """
+    offsets = []
+    t0 = 0.0
+    for rate, duration in stages:
+        offsets.extend(t0 + t for t in constant(rate, duration))
+        t0 += duration
+    return offsets
+
+
+def poisson(rate: float, duration: float, seed: int = 0) -> list[float]:
+    """
+    Poisson arrivals (exponential inter-arrival times) averaging `rate` requests/second.
+    """
+    rng = random.Random(seed)
+    offsets = []
+    t = rng.expovariate(rate)
+    while t < duration:
+        offsets.append(t)
+        t += rng.expovariate(rate)
+    return offsets
+
+
+# -------------------------------------------------
+# Open-loop runner
+# -------------------------------------------------
+
+
+class LoadResult:
+    """
+    Outcome of one open-loop run.
+
+    Attributes:
+        corrected: Intended send time -> response (coordinated-omission corrected).
+        service: Actual send time -> response.
+        send_lag: Intended -> actual send time.
+    """
+
+    def __init__(self, scheduled: int):
+        self.scheduled = scheduled
+        self.completed = 0
+        self.errors = 0
+        self.statuses: dict[int, int] = {}
+        self.corrected = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.send_lag = LatencyHistogram()
+        self.max_in_flight = 0
+        self.duration_s = 0.0
+
+    def record(self, status: int, intended: float, sent: float, done: float):
+        self.completed += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status == 0 or status >= 400:
+            self.errors += 1
+        self.corrected.record((done - intended) * 1000.0)
+        self.service.record((done - sent) * 1000.0)
+        self.send_lag.record((sent - intended) * 1000.0)
+
+    @property
+    def achieved_rate(self) -> float:
+        return self.completed / self.duration_s if self.duration_s else 0.0
+
+    def merge(self, other: "LoadResult"):
+        """
+        Fold in the result of a run executed concurrently with this one (another worker
+        process or agent sharing the same start time).
+
+        Durations are concurrent, so the longer one is kept; max_in_flight becomes the
+        sum of the per-run peaks (an upper bound on the combined peak).
+        """
+        self.scheduled += other.scheduled
+        self.completed += other.completed
+        self.errors += other.errors
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        self.corrected.merge(other.corrected)
+        self.service.merge(other.service)
+        self.send_lag.merge(other.send_lag)
+        self.max_in_flight += other.max_in_flight
+        self.duration_s = max(self.duration_s, other.duration_s)
+
+    def to_dict(self) -> dict:
+        return {
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "errors": self.errors,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "durationSeconds": self.duration_s,
+            "achievedRatePerSec": self.achieved_rate,
+            "maxInFlight": self.max_in_flight,
+            "series": {
+                "corrected": self.corrected.summary(),
+                "service": self.service.summary(),
+                "sendLag": self.send_lag.summary(),
+            },
+            "histograms": {
+                "corrected": self.corrected.to_dict(),
+                "service": self.service.to_dict(),
+                "sendLag": self.send_lag.to_dict(),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoadResult":
+        r = cls(data["scheduled"])
+        r.completed = data["completed"]
+        r.errors = data["errors"]
+        r.statuses = {int(k): v for k, v in data["statuses"].items()}
+        r.duration_s = data["durationSeconds"]
+        r.max_in_flight = data["maxInFlight"]
+        r.corrected = LatencyHistogram.from_dict(data["histograms"]["corrected"])
+        r.service = LatencyHistogram.from_dict(data["histograms"]["service"])
+        r.send_lag = LatencyHistogram.from_dict(data["histograms"]["sendLag"])
+        return r
+
+
+async def run_open_loop(
+    send,
+    offsets: list[float],
+    *,
+    max_in_flight: int = 1000,
+    start: float | None = None,
+    result: LoadResult | None = None,
+) -> LoadResult:
+    """
+    Call `send(i)` at start + offsets[i] for every i, without waiting for earlier calls.
+
+    Args:
+        send: Coroutine function taking the request index and returning a response with
+            `status_code`. Exceptions count as status 0.
+        offsets: Sorted arrival offsets in seconds (see constant/ramp/step/poisson).
+        max_in_flight: Cap on concurrent requests. Requests over the cap wait for a slot;
+            the wait is included in the corrected latency.
+        start: time.perf_counter() value the offsets are relative to (default: now).
+            Used to line up several generators on a common start time.
+        result: LoadResult to record into (default: a new one). Passing one lets a task on
+            the same event loop read live progress while the run is going.
+
+    Returns:
+        LoadResult.
+    """
+    if result is None:
+        result = LoadResult(len(offsets))
+    slots = asyncio.Semaphore(max_in_flight)
+    in_flight = 0
+
+    async def one(i: int, intended: float):
+        nonlocal in_flight
+        async with slots:
+            in_flight += 1
+            result.max_in_flight = max(result.max_in_flight, in_flight)
+            sent = time.perf_counter()
+            try:
+                status = (await send(i)).status_code
+            except Exception:
+                status = 0
+            done = time.perf_counter()
+            in_flight -= 1
+        result.record(status, intended, sent, done)
+
+    tasks = []
+    if start is None:
+        start = time.perf_counter()
+    for i, offset in enumerate(offsets):
+        intended = start + offset
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i, intended)))
+
+    await asyncio.gather(*tasks)
+    result.duration_s = time.perf_counter() - start
+    return result
+
+
+def transaction_sender(async_api, account_ids: list[str], kind: str = "deposit"):
+    """
+    Build a `send(i)` coroutine function POSTing transactions round-robin over `account_ids`.
+
+    Args:
+        async_api: Authenticated AsyncApiClient.
+        account_ids: Accounts to spread the load over.
+        kind: "deposit" or "transfer" (non-BR counterparty, no identifier lookup).
+    """
+    if kind not in ("deposit", "transfer"):
+        raise ValueError(f"Unknown transaction kind: {kind}")
+
+    async def send(i: int):
+        account_id = account_ids[i % len(account_ids)]
+        payload = deposit_payload(account_id) if kind == "deposit" else transfer_payload(account_id, cp_country="US")
+        return await async_api.transaction_create(payload)
+
+    return send
+
+
+async def run_transactions_load(
+    async_api,
+    account_ids: list[str],
+    offsets: list[float],
+    *,
+    kind: str = "deposit",
+    max_in_flight: int = 1000,
+    start: float | None = None,
+    result: LoadResult | None = None,
+) -> LoadResult:
+    """
+    Drive POST /api/transactions on the given arrival schedule (see run_open_loop).
+    """
+    async with async_api:
+        return await run_open_loop(
+            transaction_sender(async_api, account_ids, kind),
+            offsets,
+            max_in_flight=max_in_flight,
+            start=start,
+            result=result,
+        )
+
+
+# -------------------------------------------------
+# Command line
+# -------------------------------------------------
+
+
+def _parse_stages(text: str) -> list[tuple[float, float]]:
+    stages = []
+    for part in text.split(","):
+        rate, duration = part.split(":")
+        stages.append((float(rate), float(duration)))
+    return stages
+
+
+def build_schedule(args) -> list[float]:
+    if args.profile == "constant":
+        return constant(args.rate, args.duration)
+    if args.profile == "ramp":
+        return ramp(args.start_rate, args.rate, args.duration)
+    if args.profile == "step":
+        return step(_parse_stages(args.stages))
+    if args.profile == "poisson":
+        return poisson(args.rate, args.duration, args.seed)
+    raise ValueError(f"Unknown profile: {args.profile}")
+
+
+def print_result(result: LoadResult):
+    print(
+        f"scheduled={result.scheduled} completed={result.completed} errors={result.errors} "
+        f"achieved={result.achieved_rate:.1f}/s max_in_flight={result.max_in_flight} statuses={result.statuses}"
+    )
+    print(f"{'series':<12} {'p50ms':>8} {'p90ms':>8} {'p99ms':>8} {'p99.9ms':>8} {'maxms':>8}")
+    for name, h in (("corrected", result.corrected), ("service", result.service), ("send lag", result.send_lag)):
+        if not h.count:
+            continue
+        print(
+            f"{name:<12} {h.percentile(50):>8.1f} {h.percentile(90):>8.1f} {h.percentile(99):>8.1f} "
+            f"{h.percentile(99.9):>8.1f} {h.max:>8.1f}"
+        )
+
+
+def add_load_arguments(parser: argparse.ArgumentParser):
+    """
+    Target, credentials, arrival profile and data-set options shared by the load CLIs.
+    """
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", "http://localhost:8080"))
+    parser.add_argument("--email", default=os.getenv("TEST_ANALYST_EMAIL", "analyst@ubs.com"))
+    parser.add_argument("--password", default=os.getenv("TEST_ANALYST_PASSWORD", "Password123!"))
+    parser.add_argument("--profile", choices=("constant", "ramp", "step", "poisson"), default="constant")
+    parser.add_argument("--rate", type=float, default=10.0, help="Requests/second (end rate for ramp)")
+    parser.add_argument("--start-rate", type=float, default=1.0, help="Initial rate for ramp")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument("--stages", default="10:10,20:10", help="step profile as rate:seconds,...")
+    parser.add_argument("--seed", type=int, default=0, help="Poisson seed")
+    parser.add_argument("--kind", choices=("deposit", "transfer"), default="deposit")
+    parser.add_argument("--accounts", type=int, default=20, help="Fresh accounts to spread the load over")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Per load process (worker or agent)")
+    parser.add_argument("--json", help="Write the result as JSON to this path")
+
+
+def prepare_accounts(args) -> tuple[str, list[str]]:
+    """
+    Log in and create `args.accounts` fresh client/account pairs to load.
+
+    Returns:
+        (JWT, account ids).
+    """
+    from tests.helpers.api_client import ApiClient
+    from tests.helpers.data_factory import DataFactory
+
+    api = ApiClient(args.base_url)
+    r = api.auth_login(args.email, args.password)
+    r.raise_for_status()
+    token = r.json()["token"]
+
+    factory = DataFactory(api.with_token(token), namespace="Load")
+    factory.prefill(args.accounts)
+    return token, [factory.client_with_account()[1]["id"] for _ in range(args.accounts)]
+
+
+def write_result(result: LoadResult, path: str | None):
+    print_result(result)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result.to_dict(), f, indent=2)
+
+
+def main(argv=None):
+    from tests.helpers.async_api_client import AsyncApiClient
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_load_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes sharing the load")
+    args = parser.parse_args(argv)
+
+    token, account_ids = prepare_accounts(args)
+    offsets = build_schedule(args)
+    if args.workers > 1:
+        from tests.perf.multiprocess import run_multiprocess_load
+
+        result, _ = run_multiprocess_load(
+            args.base_url,
+            args.email,
+            args.password,
+            account_ids,
+            offsets,
+            workers=args.workers,
+            kind=args.kind,
+            max_in_flight=args.max_in_flight,
+        )
+    else:
+        result = asyncio.run(
+            run_transactions_load(
+                AsyncApiClient(args.base_url, token=token),
+                account_ids,
+                offsets,
+                kind=args.kind,
+                max_in_flight=args.max_in_flight,
+            )
+        )
+    write_result(result, args.json)
+
+
+if __name__ == "__main__":
+    main()
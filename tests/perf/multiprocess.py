@@ -0,0 +1,198 @@
+"""
+Multi-process driver for the open-loop transaction load (see tests/perf/loadgen.py).
+
+A single Python process saturates one core long before the API or Postgres do, so the
+offered load is split across N worker processes:
+
+    * every worker logs in on its own and drives its own pooled AsyncApiClient;
+    * accounts are partitioned (worker i gets account_ids[i::N]), so no two workers
+      write to the same account;
+    * the arrival schedule is dealt round-robin (worker i gets offsets[i::N]), which keeps
+      the combined profile identical to the single-process one;
+    * all workers wait on a common wall-clock start time fixed by the coordinator once
+      every worker is logged in and ready;
+    * per-worker LoadResults (histograms, statuses, errors) are merged into one.
+
+Command line (same options as loadgen, plus --workers):
+    python -m tests.perf.loadgen --profile constant --rate 400 --duration 60 --workers 8
+"""
+import asyncio
+import multiprocessing
+import queue
+import time
+
+from tests.perf.loadgen import LoadResult, run_transactions_load
+
+# Lead time between "everyone is ready" and the first scheduled request.
+START_LEAD_S = 0.5
+# How long workers get to log in and report ready.
+READY_TIMEOUT_S = 60.0
+# Slack on top of the schedule length before a worker is considered lost.
+RESULT_GRACE_S = 60.0
+
+
+def partition(items: list, n: int) -> list[list]:
+    """
+    Deal `items` round-robin into `n` lists (item i goes to list i % n).
+    """
+    return [items[i::n] for i in range(n)]
+
+
+def login(share: dict) -> str:
+    """
+    Returns:
+        JWT for the share's credentials.
+    """
+    from tests.helpers.api_client import ApiClient
+
+    r = ApiClient(share["base_url"]).auth_login(share["email"], share["password"])
+    r.raise_for_status()
+    return r.json()["token"]
+
+
+def run_share(share: dict, token: str, start_at: float) -> LoadResult:
+    """
+    Drive one share of the load on its own event loop and AsyncApiClient.
+
+    Args:
+        share: base_url, account_ids, offsets, kind, max_in_flight.
+        token: JWT (see login).
+        start_at: time.time() value the share's offsets are relative to.
+    """
+    from tests.helpers.async_api_client import AsyncApiClient
+
+    # perf_counter is per process; translate the shared wall-clock start into it.
+    start = time.perf_counter() + (start_at - time.time())
+    return asyncio.run(
+        run_transactions_load(
+            AsyncApiClient(share["base_url"], token=token),
+            share["account_ids"],
+            share["offsets"],
+            kind=share["kind"],
+            max_in_flight=share["max_in_flight"],
+            start=start,
+        )
+    )
+
+
+def _worker_main(index: int, share: dict, messages, go, start_at):
+    """
+    Worker process: log in, report ready, wait for the start signal, run, report the result.
+    """
+    try:
+        token = login(share)
+    except Exception as ex:
+        messages.put(("error", index, f"login failed: {ex}"))
+        return
+    messages.put(("ready", index, None))
+
+    go.wait()
+    if start_at.value == 0.0:
+        return  # another worker failed, run aborted
+
+    try:
+        result = run_share(share, token, start_at.value)
+    except Exception as ex:
+        messages.put(("error", index, f"run failed: {ex}"))
+        return
+    messages.put(("result", index, result.to_dict()))
+
+
+def _collect(messages, kind: str, n: int, timeout: float) -> dict[int, object]:
+    """
+    Read `n` messages of type `kind` from the workers.
+
+    Raises:
+        RuntimeError: If a worker reports an error or the timeout expires.
+    """
+    deadline = time.monotonic() + timeout
+    received = {}
+    while len(received) < n:
+        remaining = deadline - time.monotonic()
+        try:
+            msg_kind, index, payload = messages.get(timeout=max(remaining, 0.01))
+        except queue.Empty:
+            raise RuntimeError(f"{n - len(received)} of {n} workers did not report '{kind}' within {timeout:.0f}s.")
+        if msg_kind == "error":
+            raise RuntimeError(f"Load worker {index}: {payload}")
+        received[index] = payload
+    return received
+
+
+def run_multiprocess_load(
+    base_url: str,
+    email: str,
+    password: str,
+    account_ids: list[str],
+    offsets: list[float],
+    *,
+    workers: int,
+    kind: str = "deposit",
+    max_in_flight: int = 1000,
+) -> tuple[LoadResult, list[LoadResult]]:
+    """
+    Run the open-loop transaction load from `workers` processes and merge the results.
+
+    Args:
+        base_url: API root URL.
+        email: Analyst e-mail; every worker logs in separately with it.
+        password: Analyst password.
+        account_ids: Accounts to spread the load over, partitioned across workers.
+        offsets: Combined arrival schedule (see loadgen.constant/ramp/step/poisson).
+        workers: Number of worker processes.
+        kind: "deposit" or "transfer".
+        max_in_flight: Per-worker cap on concurrent requests.
+
+    Returns:
+        (merged result, per-worker results in worker order).
+
+    Raises:
+        ValueError: If there are fewer accounts than workers.
+        RuntimeError: If a worker fails to log in, crashes or does not finish in time.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1.")
+    if len(account_ids) < workers:
+        raise ValueError(f"Need at least one account per worker ({len(account_ids)} accounts, {workers} workers).")
+
+    ctx = multiprocessing.get_context("spawn")
+    messages = ctx.Queue()
+    go = ctx.Event()
+    start_at = ctx.Value("d", 0.0)
+
+    accounts = partition(account_ids, workers)
+    schedules = partition(offsets, workers)
+    processes = []
+    for i in range(workers):
+        share = {
+            "base_url": base_url,
+            "email": email,
+            "password": password,
+            "account_ids": accounts[i],
+            "offsets": schedules[i],
+            "kind": kind,
+            "max_in_flight": max_in_flight,
+        }
+        p = ctx.Process(target=_worker_main, args=(i, share, messages, go, start_at), name=f"load-worker-{i}", daemon=True)
+        p.start()
+        processes.append(p)
+
+    try:
+        _collect(messages, "ready", workers, READY_TIMEOUT_S)
+        start_at.value = time.time() + START_LEAD_S
+        go.set()
+        span = (offsets[-1] if offsets else 0.0) + START_LEAD_S + RESULT_GRACE_S
+        dicts = _collect(messages, "result", workers, span)
+    finally:
+        # Leaving start_at at 0 tells still-waiting workers to exit.
+        go.set()
+        for p in processes:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+    per_worker = [LoadResult.from_dict(dicts[i]) for i in range(workers)]
+    merged = LoadResult(0)
+    for result in per_worker:
+        merged.merge(result)
+    return merged, per_worker
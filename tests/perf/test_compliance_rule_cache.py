@@ -0,0 +1,82 @@
+"""
+Per-transaction compliance-rule evaluation overhead.
+
+The active rules are cached by the API with their parameters pre-parsed, so a
+POST /api/transactions normally evaluates them without loading or parsing anything. A
+successful PATCH /api/rules/{id} invalidates that cache and the next transaction reloads
+it. This benchmark measures POST /api/transactions with the cache warm and for the first
+transaction after each invalidation, the difference being the cost of loading and
+parsing the rules on a cache miss.
+
+Invalidations are triggered by toggling the name of a seeded rule, which changes nothing
+about how transactions are evaluated; the original name is restored at the end.
+
+Tuning (environment variables):
+    PERF_RULE_CACHE_SAMPLES   measured POSTs per series (default 50)
+"""
+import os
+import time
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.compliance import rule_by_code
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.payloads import deposit_payload, now_iso_z
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+SAMPLES = int(os.getenv("PERF_RULE_CACHE_SAMPLES", "50"))
+
+# Far below the seeded 10,000 USD daily limit even after both series, so no measured
+# deposit opens a case.
+AMOUNT_USD = 1.00
+RULE_CODE = "banned_countries_default"
+
+
+def _timed_create(authed, payload: dict) -> float:
+    started = time.perf_counter()
+    r = authed.transaction_create(payload)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    assert_status(r, 201)
+    return elapsed_ms
+
+
+@pytest.mark.serial
+def test_rule_evaluation_overhead(authed, data_factory, record_benchmark):
+    rule = rule_by_code(authed, RULE_CODE)
+    original_name = rule["name"]
+    _, account = data_factory.client_with_account()
+    occurred_at = now_iso_z()
+
+    def payload() -> dict:
+        return deposit_payload(account["id"], amount=AMOUNT_USD, currency="USD", occurred_at=occurred_at)
+
+    # Warm the cache (and the connection) before measuring.
+    _timed_create(authed, payload())
+
+    cached = LatencyHistogram()
+    for _ in range(SAMPLES):
+        cached.record(_timed_create(authed, payload()))
+
+    invalidated = LatencyHistogram()
+    try:
+        for i in range(SAMPLES):
+            # The patch endpoint rejects no-op changes, so alternate between two names.
+            name = original_name if i % 2 else f"{original_name} (benchmark)"
+            assert_status(authed.rules_patch(rule["id"], {"name": name}), 200)
+            invalidated.record(_timed_create(authed, payload()))
+    finally:
+        current = rule_by_code(authed, RULE_CODE)
+        if current["name"] != original_name:
+            assert_status(authed.rules_patch(rule["id"], {"name": original_name}), 200)
+
+    cached_summary = cached.summary()
+    invalidated_summary = invalidated.summary()
+    record_benchmark(
+        "rule_evaluation_overhead",
+        {
+            "params": {"samples": SAMPLES, "invalidatedBy": f"PATCH /api/rules ({RULE_CODE} name)"},
+            "series": {"cached": cached_summary, "afterInvalidation": invalidated_summary},
+            "histograms": {"cached": cached.to_dict(), "afterInvalidation": invalidated.to_dict()},
+        },
+    )
@@ -0,0 +1,221 @@
+"""
+Compliance-rule cost vs per-client history.
+
+Every POST /api/transactions evaluates the active rules synchronously; the daily-limit
+rule sums that day's transactions of the client (or account) and the structuring rule
+counts that day's sub-threshold transfers on each insert. These benchmarks grow a
+client's same-day history (bulk-loaded through POST /api/transactions/import) and measure
+POST /api/transactions at each level, giving a latency-vs-history scaling curve.
+
+History transactions and measured ones share a single OccurredAtUtc, so the whole run
+lands on the same UTC day even if it crosses midnight.
+
+Tuning (environment variables):
+    PERF_DAILY_LIMIT_LEVELS   comma-separated same-day history sizes (default 10,100,1000,10000)
+    PERF_STRUCTURING_LEVELS   comma-separated prior transfer counts (default 0,4,10,100,1000)
+    PERF_SCALING_SAMPLES      measured POSTs per level (default 20)
+"""
+import os
+import time
+from contextlib import contextmanager
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.compliance import case_for_transaction, rule_by_code
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.payloads import (
+    deposit_payload,
+    now_iso_z,
+    transaction_import_row,
+    transfer_payload,
+    valid_account_payload,
+)
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+DAILY_LIMIT_LEVELS = [int(n) for n in os.getenv("PERF_DAILY_LIMIT_LEVELS", "10,100,1000,10000").split(",")]
+STRUCTURING_LEVELS = [int(n) for n in os.getenv("PERF_STRUCTURING_LEVELS", "0,4,10,100,1000").split(",")]
+SAMPLES = int(os.getenv("PERF_SCALING_SAMPLES", "20"))
+
+# Small enough that 10k history rows plus the measured deposits stay far below the seeded
+# 10,000 USD daily limit, so every level measures the aggregation, not case creation.
+HISTORY_AMOUNT_USD = 0.01
+MEASURED_AMOUNT_USD = 1.00
+# Under structuring_default's xBaseAmount, and small enough that 1k+ transfers stay under
+# the daily limit.
+TRANSFER_AMOUNT_USD = 1.00
+
+
+@contextmanager
+def _rule_scope(authed, rule: dict, scope: str):
+    """
+    Temporarily switch a rule's scope, restoring the original on exit.
+    """
+    original = rule.get("scope")
+    if original == scope:
+        yield rule
+        return
+    r = authed.rules_patch(rule["id"], {"scope": scope})
+    assert_status(r, 200)
+    try:
+        yield r.json()
+    finally:
+        assert_status(authed.rules_patch(rule["id"], {"scope": original}), 200)
+
+
+def _measure_creates(authed, payload_for, samples: int) -> tuple[LatencyHistogram, list[dict]]:
+    latency = LatencyHistogram()
+    created = []
+    for i in range(samples):
+        payload = payload_for(i)
+        started = time.perf_counter()
+        r = authed.transaction_create(payload)
+        latency.record((time.perf_counter() - started) * 1000.0)
+        assert_status(r, 201)
+        created.append(r.json())
+    return latency, created
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("scope", ["PerClient", "PerAccount"])
+def test_daily_limit_aggregation_scaling(authed, data_factory, record_benchmark, scope):
+    """
+    Same-day history alternates between two accounts of one client and the measured
+    deposits go to the first account, so the daily-limit rule sums the whole history
+    under PerClient and about half of it under PerAccount.
+    """
+    rule = rule_by_code(authed, "daily_limit_default")
+    client, measured_account = data_factory.client_with_account()
+    r = authed.account_create(client["id"], valid_account_payload())
+    assert_status(r, 201)
+    other_account = r.json()
+    occurred_at = now_iso_z()
+    history_rows = [
+        transaction_import_row(
+            account_identifier=account["accountIdentifier"],
+            amount=HISTORY_AMOUNT_USD,
+            currency="USD",
+            occurred_at=occurred_at,
+        )
+        for account in (measured_account, other_account)
+    ]
+
+    series = {}
+    curve = []
+    with _rule_scope(authed, rule, scope):
+        history = on_measured = 0
+        for level in sorted(DAILY_LIMIT_LEVELS):
+            rows = [history_rows[i % 2] for i in range(history, level)]
+            on_measured += sum(1 for row in rows if row is history_rows[0])
+            history += data_factory.seed_transactions(rows)
+            in_scope = history if scope == "PerClient" else on_measured
+
+            latency, _ = _measure_creates(
+                authed,
+                lambda i: deposit_payload(
+                    measured_account["id"], amount=MEASURED_AMOUNT_USD, currency="USD", occurred_at=occurred_at
+                ),
+                SAMPLES,
+            )
+
+            series[f"history={level}"] = latency.summary()
+            curve.append(
+                {"history": history, "inScopeHistory": in_scope, **latency.summary(), "histogram": latency.to_dict()}
+            )
+            # The measured deposits are part of the history of the next level, on the measured account.
+            history += SAMPLES
+            on_measured += SAMPLES
+
+    record_benchmark(
+        f"daily_limit_aggregation_scaling[{scope}]",
+        {
+            "params": {
+                "levels": sorted(DAILY_LIMIT_LEVELS),
+                "samples": SAMPLES,
+                "rule": "daily_limit_default",
+                "scope": scope,
+            },
+            "series": series,
+            "curve": curve,
+        },
+    )
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("scope", ["PerClient", "PerAccount"])
+def test_structuring_count_scaling(authed, data_factory, record_benchmark, scope):
+    """
+    Prior transfers alternate between two accounts of one client, and the measured
+    transfers go to the first account, so PerClient and PerAccount see different counts
+    for the same history. Each measured transfer must open a case exactly when the
+    in-scope count (including itself) reaches the rule's n.
+    """
+    rule = rule_by_code(authed, "structuring_default")
+    n = int(rule["parameters"]["n"])
+    occurred_at = now_iso_z()
+
+    series = {}
+    curve = []
+    mismatches = []
+    with _rule_scope(authed, rule, scope):
+        for prior in sorted(STRUCTURING_LEVELS):
+            client, measured_account = data_factory.client_with_account()
+            r = authed.account_create(client["id"], valid_account_payload())
+            assert_status(r, 201)
+            other_account = r.json()
+
+            on_measured = (prior + 1) // 2
+            rows = [
+                transaction_import_row(
+                    account_identifier=(measured_account if i % 2 == 0 else other_account)["accountIdentifier"],
+                    kind="Transfer",
+                    amount=TRANSFER_AMOUNT_USD,
+                    currency="USD",
+                    occurred_at=occurred_at,
+                )
+                for i in range(prior)
+            ]
+            data_factory.seed_transactions(rows)
+
+            latency, created = _measure_creates(
+                authed,
+                lambda i: transfer_payload(
+                    measured_account["id"], amount=TRANSFER_AMOUNT_USD, currency="USD", occurred_at=occurred_at
+                ),
+                SAMPLES,
+            )
+
+            in_scope_before = prior if scope == "PerClient" else on_measured
+            expected_cases = observed_cases = 0
+            for i, tx in enumerate(created):
+                expected = in_scope_before + i + 1 >= n
+                case = case_for_transaction(authed, tx["id"])
+                opened = case is not None
+                expected_cases += expected
+                observed_cases += opened
+                if opened != expected:
+                    mismatches.append({"prior": prior, "sample": i, "expectedCase": expected, "caseOpened": opened})
+
+            series[f"prior={prior}"] = latency.summary()
+            curve.append(
+                {
+                    "priorTransfers": prior,
+                    "inScopeBefore": in_scope_before,
+                    "expectedCases": expected_cases,
+                    "observedCases": observed_cases,
+                    **latency.summary(),
+                    "histogram": latency.to_dict(),
+                }
+            )
+
+    record_benchmark(
+        f"structuring_count_scaling[{scope}]",
+        {
+            "params": {"levels": sorted(STRUCTURING_LEVELS), "samples": SAMPLES, "scope": scope, "n": n},
+            "series": series,
+            "curve": curve,
+            "caseMismatches": mismatches,
+        },
+    )
+
+    assert not mismatches, f"Structuring cases opened incorrectly ({len(mismatches)}): {mismatches[:5]}"
@@ -0,0 +1,112 @@
+"""
+Currency-conversion cost of POST /api/transactions under controlled upstream conditions.
+
+Non-base-currency transactions are converted by FxRateService.ConvertToBaseCurrencyAsync:
+the provider serves the base currency's (USD) rate table from its in-memory cache, fetches
+it from ExchangeRate-API on a miss (retrying transient failures with backoff) and, when
+the upstream stays down, falls back to the latest rate stored in the database.
+
+The upstream here is the local FX stub (tests/helpers/fx_stub.py). The benchmark first
+makes it fail every call, then answer slowly, and measures BRL deposits in each phase.
+The API keeps the USD table for ExchangeRateApi:CacheMinutes, so the upstream (and the
+DB fallback) is only reached while that cache is cold, e.g. on an API started for the
+benchmark run; each phase records the upstream calls it caused, so the report tells
+which path was measured, and the assertions follow that path.
+
+Tuning (environment variables):
+    PERF_FX_SAMPLES      measured POSTs per phase (default 5)
+    PERF_FX_LATENCY_MS   upstream latency injected in the slow phase (default 300)
+"""
+import os
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.fx_stub import USD_RATES
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.payloads import deposit_payload
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+SAMPLES = int(os.getenv("PERF_FX_SAMPLES", "5"))
+LATENCY_MS = float(os.getenv("PERF_FX_LATENCY_MS", "300"))
+
+BASE = "USD"
+CURRENCY = "BRL"
+AMOUNT = 100.00
+# USD/BRL rate seeded by DatabaseSeeder; the DB fallback may also find a stub rate the
+# API persisted earlier.
+SEEDED_RATE = Decimal("5.25")
+
+PHASES = [
+    ("upstream_failing", {"failure_rate": 1.0, "failure_status": 503}),
+    ("upstream_slow", {"latency_ms": LATENCY_MS}),
+]
+
+
+def _base_amount(rate: Decimal) -> Decimal:
+    return (Decimal(str(AMOUNT)) / rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+@pytest.mark.serial
+def test_fx_conversion_under_upstream_faults(authed, data_factory, fx_upstream, record_benchmark):
+    _, account = data_factory.client_with_account()
+    stub_rate = Decimal(str(USD_RATES[CURRENCY]))
+    rate_by_amount = {_base_amount(stub_rate): "stub", _base_amount(SEEDED_RATE): "seeded"}
+
+    series = {}
+    phases = []
+    try:
+        for phase, settings in PHASES:
+            fx_upstream.configure(BASE, **{"latency_ms": 0, "failure_rate": 0, **settings})
+            before = fx_upstream.requests_for(BASE)
+
+            latency = LatencyHistogram()
+            created = []
+            for _ in range(SAMPLES):
+                started = time.perf_counter()
+                r = authed.transaction_create(deposit_payload(account["id"], amount=AMOUNT, currency=CURRENCY))
+                latency.record((time.perf_counter() - started) * 1000.0)
+                assert_status(r, 201)
+                created.append(r.json())
+
+            upstream_calls = fx_upstream.requests_for(BASE) - before
+            rates_used = [rate_by_amount.get(Decimal(str(tx["baseAmount"]))) for tx in created]
+            assert None not in rates_used, (
+                f"{phase}: base amounts {[tx['baseAmount'] for tx in created]} match neither the stub "
+                f"nor the seeded {BASE}/{CURRENCY} rate."
+            )
+            assert all(tx["fxRateId"] is not None for tx in created)
+
+            if phase == "upstream_failing" and upstream_calls:
+                # Failed fetches are not cached: every conversion retried, then fell back to the DB.
+                assert upstream_calls >= SAMPLES
+            if phase == "upstream_slow":
+                assert set(rates_used) == {"stub"}
+                if upstream_calls:
+                    # The first conversion paid the upstream latency and cached the table.
+                    assert upstream_calls == 1
+                    assert latency.max >= LATENCY_MS
+
+            series[phase] = latency.summary()
+            phases.append(
+                {
+                    "phase": phase,
+                    "upstreamCalls": upstream_calls,
+                    "ratesUsed": sorted(set(rates_used)),
+                    **latency.summary(),
+                    "histogram": latency.to_dict(),
+                }
+            )
+    finally:
+        fx_upstream.configure(BASE, latency_ms=0, failure_rate=0)
+
+    record_benchmark(
+        "fx_conversion_upstream_faults",
+        {
+            "params": {"samples": SAMPLES, "latencyMs": LATENCY_MS, "currency": CURRENCY, "base": BASE},
+            "series": series,
+            "phases": phases,
+        },
+    )
@@ -0,0 +1,95 @@
+"""
+Transaction -> caseOpened notification latency (compliance detection SLA).
+
+Violating deposits are POSTed at a fixed rate, each for a fresh client, while the session
+SignalR listener timestamps the `caseOpened` push for that client. Three intervals are
+reported per transaction:
+
+    postToResponse          POST sent -> 201 received
+    responseToNotification  201 received -> push received on /hubs/cases
+    postToNotification      POST sent -> push received (end-to-end detection latency)
+
+Tuning (environment variables):
+    PERF_NOTIFY_COUNT   transactions to send (default 50)
+    PERF_NOTIFY_RATE    transactions per second (default 5)
+    PERF_NOTIFY_SLA_MS  if set, fail when p99 postToNotification exceeds it
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.payloads import deposit_payload
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+COUNT = int(os.getenv("PERF_NOTIFY_COUNT", "50"))
+RATE_PER_S = float(os.getenv("PERF_NOTIFY_RATE", "5"))
+SLA_MS = float(os.environ["PERF_NOTIFY_SLA_MS"]) if os.getenv("PERF_NOTIFY_SLA_MS") else None
+
+# Above the seeded daily_limit_default (10,000 USD base amount) in one deposit.
+VIOLATING_AMOUNT_USD = 25_000.0
+NOTIFICATION_TIMEOUT_S = 30.0
+
+
+def test_transaction_to_case_opened_notification_latency(authed, data_factory, case_notifications, record_benchmark):
+    data_factory.prefill(COUNT)
+    pairs = [data_factory.client_with_account() for _ in range(COUNT)]
+
+    post_to_response = LatencyHistogram()
+    response_to_notification = LatencyHistogram()
+    post_to_notification = LatencyHistogram()
+    missed: list[str] = []
+
+    start = time.perf_counter() + 0.5
+
+    def send(i: int):
+        client, account = pairs[i]
+        # Open loop: every send has a fixed slot, independent of earlier responses.
+        delay = start + i / RATE_PER_S - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        pending = case_notifications.expect_client(client["id"])
+        t_sent = time.perf_counter()
+        r = authed.transaction_create(deposit_payload(account["id"], amount=VIOLATING_AMOUNT_USD, currency="USD"))
+        t_response = time.perf_counter()
+        assert_status(r, 201)
+        return client["id"], pending, t_sent, t_response
+
+    with ThreadPoolExecutor(max_workers=min(COUNT, 64), thread_name_prefix="notify-bench") as pool:
+        sent = list(pool.map(send, range(COUNT)))
+
+    for client_id, pending, t_sent, t_response in sent:
+        try:
+            payload = pending.result(timeout=NOTIFICATION_TIMEOUT_S)
+        except TimeoutError:
+            missed.append(client_id)
+            continue
+        t_notified = case_notifications.received_at(payload.get("caseId"))
+        post_to_response.record((t_response - t_sent) * 1000.0)
+        response_to_notification.record(max(t_notified - t_response, 0.0) * 1000.0)
+        post_to_notification.record((t_notified - t_sent) * 1000.0)
+
+    result = {
+        "params": {"count": COUNT, "ratePerSec": RATE_PER_S},
+        "missedNotifications": len(missed),
+        "series": {
+            "postToResponse": post_to_response.summary(),
+            "responseToNotification": response_to_notification.summary(),
+            "postToNotification": post_to_notification.summary(),
+        },
+        "histograms": {
+            "postToResponse": post_to_response.to_dict(),
+            "responseToNotification": response_to_notification.to_dict(),
+            "postToNotification": post_to_notification.to_dict(),
+        },
+    }
+    record_benchmark("transaction_to_case_opened_notification", result)
+
+    assert not missed, f"{len(missed)} of {COUNT} caseOpened notifications not received within {NOTIFICATION_TIMEOUT_S}s"
+    if SLA_MS is not None:
+        p99 = post_to_notification.percentile(99)
+        assert p99 <= SLA_MS, f"p99 detection latency {p99:.1f}ms exceeds SLA {SLA_MS}ms"
@@ -0,0 +1,181 @@
+"""
+Cost of the report endpoints vs the length of the reported period.
+
+A year of transaction history is bulk-loaded (POST /api/transactions/import) for a pool
+of clients, spread uniformly over the last 365 days, so each period length covers a
+proportional share of it. For every period the benchmarks measure:
+
+    - GET /api/reports/system: latency, plus API process memory sampled from the
+      "process" entry of GET /api/health while the requests run (peak working set and
+      managed bytes allocated per request; the API only reports it with
+      HealthChecks:ExposeProcessMemory enabled, as in appsettings.Development.json);
+    - the report CSV exports, downloaded through streamed responses: time-to-first-byte,
+      total time and throughput.
+
+The default history keeps the run short; set PERF_REPORT_HISTORY to a few million rows
+(and reuse the database between runs) to see how year-long reports scale.
+
+Tuning (environment variables):
+    PERF_REPORT_HISTORY   transactions loaded over the last 365 days (default 20000)
+    PERF_REPORT_CLIENTS   clients the history is spread over (default 20)
+    PERF_REPORT_PERIODS   comma-separated period lengths in days (default 1,30,365)
+    PERF_REPORT_SAMPLES   requests per endpoint and period (default 5)
+"""
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.import_files import transaction_rows
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+HISTORY = int(os.getenv("PERF_REPORT_HISTORY", "20000"))
+CLIENTS = int(os.getenv("PERF_REPORT_CLIENTS", "20"))
+PERIODS = [int(n) for n in os.getenv("PERF_REPORT_PERIODS", "1,30,365").split(",")]
+SAMPLES = int(os.getenv("PERF_REPORT_SAMPLES", "5"))
+
+
+def _period(days: int) -> dict:
+    end = date.today()
+    return {"startDate": (end - timedelta(days=days - 1)).isoformat(), "endDate": end.isoformat()}
+
+
+@pytest.fixture(scope="module")
+def report_history(data_factory) -> tuple[list[dict], int]:
+    """
+    (clients, transactions imported) for a year of history over CLIENTS fresh clients.
+    """
+    data_factory.prefill(CLIENTS)
+    pairs = [data_factory.client_with_accounts() for _ in range(CLIENTS)]
+    identifiers = [a["accountIdentifier"] for _, accounts in pairs for a in accounts]
+    rows = transaction_rows(
+        identifiers,
+        HISTORY,
+        seed=365,
+        end=datetime.now(timezone.utc),
+        window=timedelta(days=365),
+    )
+    return [client for client, _ in pairs], data_factory.seed_transactions(rows, chunk_size=5000)
+
+
+def _server_memory(api) -> dict | None:
+    """
+    Data of the "process" check of GET /api/health, or None if the API does not report it.
+    """
+    r = api.health()
+    if r.status_code != 200:
+        return None
+    check = next((c for c in r.json().get("checks", []) if c.get("name") == "process"), None)
+    return (check or {}).get("data") or None
+
+
+class _MemorySampler:
+    """
+    Polls the API process memory in the background and keeps the peak working set.
+    """
+
+    def __init__(self, api, interval_s: float = 0.1):
+        self.api = api
+        self.interval_s = interval_s
+        self.peak_working_set = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            memory = _server_memory(self.api)
+            if memory:
+                self.peak_working_set = max(self.peak_working_set, memory["workingSetBytes"])
+            self._stop.wait(self.interval_s)
+
+    def __enter__(self) -> "_MemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+@pytest.mark.parametrize("days", PERIODS, ids=lambda d: f"{d}d")
+def test_system_report_latency_and_memory(api, authed, report_history, record_benchmark, days):
+    _, imported = report_history
+    before = _server_memory(api)
+    if before is None:
+        pytest.skip("GET /api/health does not report process memory (HealthChecks:ExposeProcessMemory is off).")
+
+    latency = LatencyHistogram()
+    with _MemorySampler(api) as sampler:
+        for _ in range(SAMPLES):
+            started = time.perf_counter()
+            r = authed.report_system(_period(days))
+            latency.record((time.perf_counter() - started) * 1000.0)
+            assert_status(r, 200)
+    after = _server_memory(api)
+    report = r.json()
+
+    record_benchmark(
+        f"report_system[{days}d]",
+        {
+            "params": {"days": days, "samples": SAMPLES, "history": imported, "clients": CLIENTS},
+            "metrics": {
+                "transactions": report["transactionMetrics"]["totalTransactions"],
+                "allocatedBytesPerRequest": (after["gcTotalAllocatedBytes"] - before["gcTotalAllocatedBytes"]) / SAMPLES,
+                "workingSetBeforeBytes": before["workingSetBytes"],
+                "workingSetPeakBytes": max(sampler.peak_working_set, after["workingSetBytes"]),
+                "workingSetAfterBytes": after["workingSetBytes"],
+            },
+            "series": {"request": latency.summary()},
+        },
+    )
+
+
+def _measure_export(export, samples: int, tmp_path) -> tuple[dict, dict]:
+    ttfb, total = LatencyHistogram(), LatencyHistogram()
+    received = seconds = 0.0
+    for i in range(samples):
+        with export() as download:
+            assert_status(download.response, 200)
+            stats = download.save(str(tmp_path / f"export-{i}.csv"))
+        ttfb.record((stats.ttfb_s or stats.total_s) * 1000.0)
+        total.record(stats.total_s * 1000.0)
+        received += stats.bytes_received
+        seconds += stats.total_s
+    metrics = {"bytes": received / samples, "bytesPerSec": received / seconds if seconds else 0.0}
+    return {"ttfb": ttfb.summary(), "total": total.summary()}, metrics
+
+
+@pytest.mark.parametrize("days", PERIODS, ids=lambda d: f"{d}d")
+def test_system_report_export_csv(authed, report_history, record_benchmark, tmp_path, days):
+    _, imported = report_history
+    series, metrics = _measure_export(
+        lambda: authed.report_system_export_csv(_period(days)), SAMPLES, tmp_path
+    )
+    record_benchmark(
+        f"report_system_export_csv[{days}d]",
+        {
+            "params": {"days": days, "samples": SAMPLES, "history": imported, "clients": CLIENTS},
+            "metrics": metrics,
+            "series": series,
+        },
+    )
+
+
+@pytest.mark.parametrize("days", PERIODS, ids=lambda d: f"{d}d")
+def test_client_report_export_csv(authed, report_history, record_benchmark, tmp_path, days):
+    clients, imported = report_history
+    series, metrics = _measure_export(
+        lambda: authed.report_client_export_csv(clients[0]["id"], _period(days)), SAMPLES, tmp_path
+    )
+    record_benchmark(
+        f"report_client_export_csv[{days}d]",
+        {
+            "params": {"days": days, "samples": SAMPLES, "history": imported, "clients": CLIENTS},
+            "metrics": metrics,
+            "series": series,
+        },
+    )
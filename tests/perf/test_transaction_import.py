@@ -0,0 +1,88 @@
+"""
+Throughput of POST /api/transactions/import at increasing file sizes.
+
+A realistic file is generated for each size and format (CSV and XLSX) by
+tests.helpers.import_files: deposits, withdrawals and transfers spread over a pool of
+accounts, USD/BRL amounts with a long tail, timestamps over the last 30 days. The file is
+written to a temporary directory first and streamed from disk in one request, so neither
+generation nor harness memory is part of the measurement. The result reports rows/second,
+request latency, the upload send rate and the per-row error rate returned by the API.
+
+Tuning (environment variables):
+    PERF_IMPORT_SIZES     comma-separated row counts (default 1000,10000,100000)
+    PERF_IMPORT_ACCOUNTS  accounts the rows are spread over (default 50)
+    PERF_IMPORT_TIMEOUT   request timeout in seconds (default 1800)
+    PERF_IMPORT_FORMATS   comma-separated file formats (default csv,xlsx)
+"""
+import os
+import time
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.histogram import LatencyHistogram
+from tests.helpers.import_files import transaction_rows, write_import_file
+from tests.helpers.payloads import TRANSACTION_IMPORT_HEADER
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+SIZES = [int(n) for n in os.getenv("PERF_IMPORT_SIZES", "1000,10000,100000").split(",")]
+ACCOUNTS = int(os.getenv("PERF_IMPORT_ACCOUNTS", "50"))
+TIMEOUT_S = float(os.getenv("PERF_IMPORT_TIMEOUT", "1800"))
+FORMATS = os.getenv("PERF_IMPORT_FORMATS", "csv,xlsx").split(",")
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+@pytest.fixture(scope="module")
+def import_account_identifiers(data_factory):
+    data_factory.prefill(ACCOUNTS)
+    return [data_factory.client_with_account()[1]["accountIdentifier"] for _ in range(ACCOUNTS)]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("rows", SIZES, ids=lambda n: f"{n}rows")
+def test_transactions_import_throughput(
+    authed, import_account_identifiers, record_benchmark, tmp_path, rows, fmt
+):
+    file_name = f"import-{rows}.{fmt}"
+    path = tmp_path / file_name
+    size = write_import_file(
+        str(path),
+        TRANSACTION_IMPORT_HEADER,
+        transaction_rows(import_account_identifiers, rows, seed=rows),
+    )
+
+    uploads = []
+    started = time.perf_counter()
+    r = authed.transactions_import(
+        file_name, path, content_type=CONTENT_TYPES[fmt], timeout=TIMEOUT_S, on_progress=uploads.append
+    )
+    elapsed = time.perf_counter() - started
+
+    assert_status(r, 200)
+    result = r.json()
+    latency = LatencyHistogram()
+    latency.record(elapsed * 1000.0)
+
+    record_benchmark(
+        f"transactions_import[{fmt}-{rows}]",
+        {
+            "params": {"rows": rows, "format": fmt, "accounts": ACCOUNTS, "bytes": size},
+            "metrics": {
+                "rowsPerSec": rows / elapsed,
+                "requestSeconds": elapsed,
+                "uploadSeconds": uploads[-1].elapsed_s,
+                "uploadBytesPerSec": uploads[-1].bytes_per_sec,
+                "successCount": result["successCount"],
+                "errorCount": result["errorCount"],
+                "errorRate": result["errorCount"] / result["totalProcessed"] if result["totalProcessed"] else 0.0,
+            },
+            "series": {"request": latency.summary()},
+            "errorsSample": result.get("errors", [])[:10],
+        },
+    )
+
+    assert result["totalProcessed"] == rows
@@ -0,0 +1,138 @@
+"""
+Open-loop load on POST /api/transactions (see tests/perf/loadgen.py).
+
+Each arrival profile runs for a short window against fresh accounts and records the
+coordinated-omission-corrected latency, the raw service time and the generator's send lag.
+
+Tuning (environment variables):
+    PERF_LOAD_RATE      target requests/second (default 20)
+    PERF_LOAD_DURATION  seconds per profile (default 10)
+    PERF_LOAD_ACCOUNTS  accounts the load is spread over (default 20)
+    PERF_LOAD_WORKERS   worker processes for the multi-process run (default 4); it offers
+                        PERF_LOAD_RATE per worker
+    PERF_LOAD_AGENTS    localhost agents for the coordinator/agent run (default 3); it
+                        offers PERF_LOAD_RATE per agent
+"""
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from tests.perf.distributed import LoadCoordinator
+from tests.perf.loadgen import constant, poisson, ramp, run_transactions_load, step
+from tests.perf.multiprocess import run_multiprocess_load
+
+pytestmark = [pytest.mark.integration, pytest.mark.perf]
+
+RATE = float(os.getenv("PERF_LOAD_RATE", "20"))
+DURATION = float(os.getenv("PERF_LOAD_DURATION", "10"))
+ACCOUNTS = int(os.getenv("PERF_LOAD_ACCOUNTS", "20"))
+WORKERS = int(os.getenv("PERF_LOAD_WORKERS", "4"))
+AGENTS = int(os.getenv("PERF_LOAD_AGENTS", "3"))
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+PROFILES = {
+    "constant": lambda: constant(RATE, DURATION),
+    "ramp": lambda: ramp(RATE / 10, RATE * 2, DURATION),
+    "step": lambda: step([(RATE / 2, DURATION / 2), (RATE * 2, DURATION / 2)]),
+    "poisson": lambda: poisson(RATE, DURATION, seed=42),
+}
+
+
+@pytest.fixture(scope="module")
+def load_account_ids(data_factory):
+    data_factory.prefill(ACCOUNTS)
+    return [data_factory.client_with_account()[1]["id"] for _ in range(ACCOUNTS)]
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+@pytest.mark.parametrize("kind", ["deposit", "transfer"])
+def test_transaction_create_open_loop_load(async_authed, load_account_ids, record_benchmark, profile, kind):
+    offsets = PROFILES[profile]()
+
+    result = asyncio.run(run_transactions_load(async_authed, load_account_ids, offsets, kind=kind))
+
+    data = result.to_dict()
+    data["params"] = {"profile": profile, "kind": kind, "rate": RATE, "duration": DURATION, "accounts": ACCOUNTS}
+    record_benchmark(f"transactions_open_loop[{kind}-{profile}]", data)
+
+    assert result.completed == len(offsets)
+    assert result.statuses.get(0, 0) == 0, f"Transport failures under load: {result.statuses}"
+
+
+def test_transaction_create_multiprocess_load(base_url, creds, load_account_ids, record_benchmark):
+    offsets = constant(RATE * WORKERS, DURATION)
+
+    result, per_worker = run_multiprocess_load(
+        base_url,
+        creds["email"],
+        creds["password"],
+        load_account_ids,
+        offsets,
+        workers=WORKERS,
+    )
+
+    data = result.to_dict()
+    data["params"] = {"rate": RATE * WORKERS, "duration": DURATION, "accounts": ACCOUNTS, "workers": WORKERS}
+    data["workers"] = [w.to_dict()["series"] for w in per_worker]
+    record_benchmark(f"transactions_open_loop_multiprocess[{WORKERS}]", data)
+
+    assert result.completed == len(offsets)
+    assert result.statuses.get(0, 0) == 0, f"Transport failures under load: {result.statuses}"
+
+
+def test_transaction_create_distributed_load(base_url, creds, load_account_ids, record_benchmark):
+    offsets = constant(RATE * AGENTS, DURATION)
+    scenario = {
+        "base_url": base_url,
+        "account_ids": load_account_ids,
+        "offsets": offsets,
+        "kind": "deposit",
+        "max_in_flight": 1000,
+    }
+    progress = []
+
+    async def coordinate():
+        coordinator = LoadCoordinator(
+            scenario,
+            agents=AGENTS,
+            port=0,
+            on_progress=lambda merged, _: progress.append(merged.completed),
+        )
+        await coordinator.start()
+        agents = [
+            subprocess.Popen(
+                [
+                    sys.executable, "-m", "tests.perf.distributed", "agent",
+                    "--connect", f"127.0.0.1:{coordinator.port}",
+                    "--name", f"agent-{i}",
+                ],
+                cwd=REPO_ROOT,
+                # Agents log in with their own credentials; the control channel never carries them.
+                env={**os.environ, "TEST_ANALYST_EMAIL": creds["email"], "TEST_ANALYST_PASSWORD": creds["password"]},
+            )
+            for i in range(AGENTS)
+        ]
+        try:
+            return await coordinator.run()
+        finally:
+            for p in agents:
+                try:
+                    p.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    p.kill()
+
+    result, per_agent = asyncio.run(coordinate())
+
+    data = result.to_dict()
+    data["params"] = {"rate": RATE * AGENTS, "duration": DURATION, "accounts": ACCOUNTS, "agents": AGENTS}
+    data["agents"] = {name: r.to_dict()["series"] for name, r in per_agent.items()}
+    record_benchmark(f"transactions_open_loop_distributed[{AGENTS}]", data)
+
+    assert sorted(per_agent) == [f"agent-{i}" for i in range(AGENTS)]
+    assert result.completed == len(offsets)
+    assert result.statuses.get(0, 0) == 0, f"Transport failures under load: {result.statuses}"
+    assert progress == sorted(progress), "Live progress went backwards"
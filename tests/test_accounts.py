@@ -7,58 +7,6 @@ from tests.helpers.assertions import assert_status
 pytestmark = pytest.mark.integration
 
 
-# -----------------------------
-# Helpers (Client)
-# -----------------------------
-def _valid_client_payload(
-    *,
-    legal_type: int = 0,
-    name: str = "John Doe",
-    contact_number: str = "+5511999999999",
-    country_code: str = "BR",
-    initial_risk_level: int | None = 1,
-):
-    payload = {
-        "legalType": legal_type,
-        "name": name,
-        "contactNumber": contact_number,
-        "addressJson": {
-            "street": "Av Paulista",
-            "city": "São Paulo",
-            "state": "SP",
-            "zipCode": "01310-100",
-            "country": "Brazil",
-        },
-        "countryCode": country_code,
-    }
-    if initial_risk_level is not None:
-        payload["initialRiskLevel"] = initial_risk_level
-    return payload
-
-
-def _create_client_or_skip(authed):
-    """
-    Cria um client e retorna o JSON.
-    Se o ambiente não tiver o seed de Countries (ex.: BR), o validator pode retornar 400.
-    Nesse caso, skip para evitar falhas em cascata.
-    """
-    payload = _valid_client_payload()
-    r = authed.client_create(payload)
-
-    if r.status_code == 400:
-        try:
-            body = r.json()
-        except Exception:
-            body = {"raw": r.text}
-        pytest.skip(
-            "Could not create client (likely missing countries seed). "
-            f"Response: {json.dumps(body, ensure_ascii=False)}"
-        )
-
-    assert_status(r, 201)
-    return r.json()
-
-
 # -----------------------------
 # Helpers (Account)
 # -----------------------------
@@ -124,8 +72,8 @@ def _csv_bytes_for_import(*, account_identifier: str, country_code: str = "BR"):
 # -------------------------------------------------
 # CreateAccount
 # -------------------------------------------------
-def test_create_account_success_returns_201_and_body(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_create_account_success_returns_201_and_body(authed, data_factory):
+    client = data_factory.client()
     payload = _valid_account_payload()
 
     r = authed.account_create(client["id"], payload)
@@ -155,8 +103,8 @@ def test_create_account_success_returns_201_and_body(authed, api_up):
     assert "updatedAtUtc" in body
 
 
-def test_create_account_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_create_account_requires_auth(api, data_factory):
+    client = data_factory.client()
     payload = _valid_account_payload()
 
     r = api.account_create(client["id"], payload)
@@ -175,8 +123,8 @@ def test_create_account_client_not_found_returns_404(authed, api_up):
     assert "title" in body
 
 
-def test_create_account_duplicate_identifier_returns_400(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_create_account_duplicate_identifier_returns_400(authed, data_factory):
+    client = data_factory.client()
 
     fixed_identifier = f"ACC-DUP-{uuid.uuid4()}"
     payload = _valid_account_payload(account_identifier=fixed_identifier)
@@ -210,8 +158,8 @@ def test_create_account_duplicate_identifier_returns_400(authed, api_up):
         lambda p: p.update({"accountType": 999}),       # invalid enum
     ],
 )
-def test_create_account_validation_errors_return_400(authed, api_up, mutator):
-    client = _create_client_or_skip(authed)
+def test_create_account_validation_errors_return_400(authed, data_factory, mutator):
+    client = data_factory.client()
     payload = _valid_account_payload()
     mutator(payload)
 
@@ -226,9 +174,8 @@ def test_create_account_validation_errors_return_400(authed, api_up, mutator):
 # -------------------------------------------------
 # GetAccountsByClientId
 # -------------------------------------------------
-def test_get_accounts_by_client_id_success_returns_200_list(authed, api_up):
-    client = _create_client_or_skip(authed)
-    created = _create_account_or_skip(authed, client["id"])
+def test_get_accounts_by_client_id_success_returns_200_list(authed, data_factory):
+    client, created = data_factory.client_with_account()
 
     r = authed.accounts_get_by_client(client["id"])
     assert_status(r, 200)
@@ -249,8 +196,8 @@ def test_get_accounts_by_client_id_client_not_found_returns_404(authed, api_up):
     assert "title" in body
 
 
-def test_get_accounts_by_client_id_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_get_accounts_by_client_id_requires_auth(api, data_factory):
+    client = data_factory.client()
 
     r = api.accounts_get_by_client(client["id"])
     assert_status(r, 401)
@@ -259,9 +206,8 @@ def test_get_accounts_by_client_id_requires_auth(api, authed, api_up):
 # -------------------------------------------------
 # GetAccountById
 # -------------------------------------------------
-def test_get_account_by_id_success_returns_200_detail(authed, api_up):
-    client = _create_client_or_skip(authed)
-    created = _create_account_or_skip(authed, client["id"])
+def test_get_account_by_id_success_returns_200_detail(authed, data_factory):
+    client, created = data_factory.client_with_account()
 
     r = authed.account_get(created["id"])
     assert_status(r, 200)
@@ -284,9 +230,8 @@ def test_get_account_by_id_not_found_returns_404(authed, api_up):
     assert "title" in body
 
 
-def test_get_account_by_id_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
-    created = _create_account_or_skip(authed, client["id"])
+def test_get_account_by_id_requires_auth(api, data_factory):
+    _, created = data_factory.client_with_account()
 
     r = api.account_get(created["id"])
     assert_status(r, 401)
@@ -295,8 +240,8 @@ def test_get_account_by_id_requires_auth(api, authed, api_up):
 # -------------------------------------------------
 # ImportAccounts
 # -------------------------------------------------
-def test_import_accounts_no_file_returns_400(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_import_accounts_no_file_returns_400(authed, data_factory):
+    client = data_factory.client()
 
     # No multipart "file" field -> should hit controller "No file provided"
     r = authed.post(f"/api/clients/{client['id']}/accounts/import")
@@ -307,8 +252,8 @@ def test_import_accounts_no_file_returns_400(authed, api_up):
     assert "title" in body
 
 
-def test_import_accounts_invalid_extension_returns_400(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_import_accounts_invalid_extension_returns_400(authed, data_factory):
+    client = data_factory.client()
 
     file_bytes = _csv_bytes_for_import(account_identifier=f"ACC-IMP-{uuid.uuid4()}")
     r = authed.accounts_import(client["id"], "accounts.txt", file_bytes)
@@ -331,16 +276,16 @@ def test_import_accounts_client_not_found_returns_404(authed, api_up):
     assert "title" in body
 
 
-def test_import_accounts_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_import_accounts_requires_auth(api, data_factory):
+    client = data_factory.client()
 
     file_bytes = _csv_bytes_for_import(account_identifier=f"ACC-IMP-{uuid.uuid4()}")
     r = api.accounts_import(client["id"], "accounts.csv", file_bytes)
     assert_status(r, 401)
 
 
-def test_import_accounts_success_csv_returns_200(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_import_accounts_success_csv_returns_200(authed, data_factory):
+    client = data_factory.client()
 
     account_identifier = f"ACC-IMP-{uuid.uuid4()}"
     file_bytes = _csv_bytes_for_import(account_identifier=account_identifier)
@@ -55,83 +55,6 @@ def _find_case_by_transaction_id(authed, tx_id: str) -> dict | None:
     return items[0]
 
 
-# -----------------------------
-# Client + Account helpers
-# -----------------------------
-def _valid_client_payload(
-    *,
-    legal_type: int = 0,
-    name: str = "John Doe",
-    contact_number: str = "+5511999999999",
-    country_code: str = "BR",
-    initial_risk_level: int | None = 1,
-):
-    payload = {
-        "legalType": legal_type,
-        "name": name,
-        "contactNumber": contact_number,
-        "addressJson": {
-            "street": "Av Paulista",
-            "city": "São Paulo",
-            "state": "SP",
-            "zipCode": "01310-100",
-            "country": "Brazil",
-        },
-        "countryCode": country_code,
-    }
-    if initial_risk_level is not None:
-        payload["initialRiskLevel"] = initial_risk_level
-    return payload
-
-
-def _create_client_or_skip(authed):
-    payload = _valid_client_payload(name=f"Client-{uuid.uuid4()}")
-    r = authed.client_create(payload)
-
-    if r.status_code == 400:
-        # Common if countries seed missing for BR
-        try:
-            body = r.json()
-        except Exception:
-            body = {"raw": r.text}
-        pytest.skip(f"Could not create client (likely missing countries seed). Response: {json.dumps(body, ensure_ascii=False)}")
-
-    assert_status(r, 201)
-    return r.json()
-
-
-def _valid_account_payload(
-    *,
-    account_identifier: str | None = None,
-    country_code: str = "BR",
-    account_type: int = 0,  # enum int
-    currency_code: str = "BRL",
-):
-    if account_identifier is None:
-        account_identifier = f"ACC-{uuid.uuid4()}"
-    return {
-        "accountIdentifier": account_identifier,
-        "countryCode": country_code,
-        "accountType": account_type,
-        "currencyCode": currency_code,
-    }
-
-
-def _create_account_or_skip(authed, client_id: str):
-    payload = _valid_account_payload()
-    r = authed.account_create(client_id, payload)
-
-    if r.status_code == 400:
-        try:
-            body = r.json()
-        except Exception:
-            body = {"raw": r.text}
-        pytest.skip(f"Could not create account. Response: {json.dumps(body, ensure_ascii=False)}")
-
-    assert_status(r, 201)
-    return r.json()
-
-
 # -----------------------------
 # Transaction payload builders
 # -----------------------------
@@ -176,7 +99,7 @@ def _transfer_payload(
 # Tests: Seeded rules -> create transactions -> verify cases
 # ============================================================
 
-def test_rule_1_daily_limit_default_creates_case_and_finding(authed, api_up):
+def test_rule_1_daily_limit_default_creates_case_and_finding(authed, data_factory, api_up):
     """
     daily_limit_default:
       RuleType = DailyLimit
@@ -190,8 +113,7 @@ def test_rule_1_daily_limit_default_creates_case_and_finding(authed, api_up):
     rule = _get_rule_by_code_or_skip(authed, "daily_limit_default")
     expected_severity = rule.get("severity")
 
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    client, account = data_factory.client_with_account()
 
     tx_payload = _deposit_payload(account["id"], amount=25000.00, currency="USD")
     tx_resp = authed.transaction_create(tx_payload)
@@ -224,7 +146,7 @@ def test_rule_1_daily_limit_default_creates_case_and_finding(authed, api_up):
     assert any(f.get("ruleCode") == "daily_limit_default" for f in findings)
 
 
-def test_rule_2_banned_countries_default_creates_case_and_finding(authed, api_up):
+def test_rule_2_banned_countries_default_creates_case_and_finding(authed, data_factory, api_up):
     """
     banned_countries_default:
       RuleType = BannedCountries
@@ -237,8 +159,7 @@ def test_rule_2_banned_countries_default_creates_case_and_finding(authed, api_up
     rule = _get_rule_by_code_or_skip(authed, "banned_countries_default")
     expected_severity = rule.get("severity")
 
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    _, account = data_factory.client_with_account()
 
     tx_payload = _transfer_payload(
         account["id"],
@@ -274,7 +195,7 @@ def test_rule_2_banned_countries_default_creates_case_and_finding(authed, api_up
     assert any(f.get("ruleCode") == "banned_countries_default" for f in findings)
 
 
-def test_rule_3_structuring_default_creates_case_on_5th_transfer_only(authed, api_up):
+def test_rule_3_structuring_default_creates_case_on_5th_transfer_only(authed, data_factory, api_up):
     """
     structuring_default:
       RuleType = Structuring
@@ -291,8 +212,7 @@ def test_rule_3_structuring_default_creates_case_on_5th_transfer_only(authed, ap
     rule = _get_rule_by_code_or_skip(authed, "structuring_default")
     expected_severity = rule.get("severity")
 
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    _, account = data_factory.client_with_account()
 
     # First 4: should NOT create cases
     tx_ids = []
@@ -345,7 +265,7 @@ def test_rule_3_structuring_default_creates_case_on_5th_transfer_only(authed, ap
     assert any(f.get("ruleCode") == "structuring_default" for f in findings)
 
 
-def test_rule_4_banned_accounts_default_inactive_no_violation_no_case_created(authed, api_up):
+def test_rule_4_banned_accounts_default_inactive_no_violation_no_case_created(authed, data_factory, api_up):
     """
     banned_accounts_default is seeded as IsActive=false and is not evaluated by TransactionComplianceChecker anyway.
     We validate the baseline expectation:
@@ -353,8 +273,7 @@ def test_rule_4_banned_accounts_default_inactive_no_violation_no_case_created(au
     """
     _get_rule_by_code_or_skip(authed, "banned_accounts_default")
 
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    _, account = data_factory.client_with_account()
 
     # Small deposit: should not exceed daily limit, and doesn't involve transfer-only rules.
     tx_payload = _deposit_payload(account["id"], amount=10.00, currency="USD")
@@ -374,15 +293,14 @@ def test_rule_4_banned_accounts_default_inactive_no_violation_no_case_created(au
     assert case is None, "Did not expect a case for a non-violating transaction."
 
 
-def test_case_detail_endpoint_returns_findings_and_entities(authed, api_up):
+def test_case_detail_endpoint_returns_findings_and_entities(authed, data_factory, api_up):
     """
     Sanity test for CasesController:
       - After a violation-generated case, GET /api/cases/{id} returns detail incl. findings.
     """
     _get_rule_by_code_or_skip(authed, "daily_limit_default")
 
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    _, account = data_factory.client_with_account()
 
     tx_resp = authed.transaction_create(_deposit_payload(account["id"], amount=25000.00, currency="USD"))
     if tx_resp.status_code == 400:
@@ -1,4 +1,3 @@
-import json
 import uuid
 
 import pytest
@@ -54,23 +53,6 @@ def _valid_client_payload(
     return payload
 
 
-def _create_client_or_skip(authed):
-    """
-    Create a client and return its JSON.
-    If the environment doesn't have seeded countries (e.g., BR), skip.
-    """
-    payload = _valid_client_payload()
-    r = authed.client_create(payload)
-
-    if r.status_code == 400:
-        body = _try_json(r) or {"raw": r.text}
-        msg = json.dumps(body, ensure_ascii=False)
-        pytest.skip(f"Could not create client (likely missing countries seed). Response: {msg}")
-
-    assert_status(r, 201)
-    return r.json()
-
-
 # -------------------------------------------------
 # POST /api/clients
 # -------------------------------------------------
@@ -159,13 +141,15 @@ def test_get_clients_default_returns_200_paged(authed, api_up):
     assert isinstance(items, list)
 
 
-def test_get_clients_filter_country_code_can_find_created_client(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_get_clients_filter_country_code_can_find_created_client(authed, data_factory):
+    client = data_factory.client()
 
     params = {
         "Page.Page": 1,
         "Page.PageSize": 50,
         "CountryCode": client["countryCode"],
+        # Factory clients are created in bulk, so narrow to this one by name.
+        "SearchTerm": client["name"],
         # optional sorting:
         "Page.SortBy": "CreatedAtUtc",
         "Page.SortDir": "desc",
@@ -192,8 +176,8 @@ def test_get_client_by_id_requires_auth_returns_401(api, api_up):
     assert_status(r, 401)
 
 
-def test_get_client_by_id_success_returns_200_detail(authed, api_up):
-    client = _create_client_or_skip(authed)
+def test_get_client_by_id_success_returns_200_detail(authed, data_factory):
+    client = data_factory.client()
 
     r = authed.client_get(client["id"])
     assert_status(r, 200)
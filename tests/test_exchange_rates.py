@@ -0,0 +1,73 @@
+import time
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.fx_stub import fresh_base_code, rate_table
+
+pytestmark = pytest.mark.integration
+
+
+def test_exchange_rates_are_served_by_local_stub(authed, fx_upstream):
+    """
+    Check that GET /api/exchangerates/{base} returns the stub's deterministic table.
+
+    This test validates:
+        1. The rates match the stub's table for the base currency
+        2. The upstream is called once; the second call is served from the API cache
+    """
+    base = fresh_base_code()
+
+    r = authed.exchange_rates_get(base)
+    assert_status(r, 200)
+    body = r.json()
+    assert body["baseCurrencyCode"] == base
+    expected = rate_table(base)
+    for code, rate in expected.items():
+        assert float(body["conversionRates"][code]) == pytest.approx(rate)
+
+    r2 = authed.exchange_rates_get(base)
+    assert_status(r2, 200)
+    assert fx_upstream.requests_for(base) == 1
+
+
+def test_upstream_latency_is_paid_once_then_cached(authed, fx_upstream):
+    """
+    Check the cost of a slow upstream on the API's rate lookup.
+
+    This test validates:
+        1. A cache miss takes at least the injected upstream latency
+        2. The next lookup for the same base does not reach the upstream
+    """
+    base = fresh_base_code()
+    latency_ms = 400
+    fx_upstream.configure(base, latency_ms=latency_ms)
+
+    t0 = time.perf_counter()
+    r = authed.exchange_rate_get(base, "BRL")
+    miss_s = time.perf_counter() - t0
+    assert_status(r, 200)
+
+    t0 = time.perf_counter()
+    r = authed.exchange_rate_get(base, "EUR")
+    hit_s = time.perf_counter() - t0
+    assert_status(r, 200)
+
+    assert miss_s >= latency_ms / 1000
+    assert hit_s < latency_ms / 1000
+    assert fx_upstream.requests_for(base) == 1
+
+
+def test_upstream_failures_are_retried_then_reported_unavailable(authed, fx_upstream):
+    """
+    Check the provider's retry policy against a failing upstream.
+
+    This test validates:
+        1. With every upstream call failing, the API answers 503
+        2. The provider retried (more than one upstream call for the base)
+    """
+    base = fresh_base_code()
+    fx_upstream.configure(base, failure_rate=1.0, failure_status=503)
+
+    r = authed.exchange_rates_get(base)
+    assert_status(r, 503)
+    assert fx_upstream.requests_for(base) > 1
@@ -1,3 +1,6 @@
+import asyncio
+import uuid
+
 import pytest
 from tests.helpers.assertions import assert_status
 
@@ -17,3 +20,87 @@ def test_health_ok(api, api_up):
 
     body = r.json()
     assert body.get("status") == "Healthy"
+
+
+def test_health_reports_process_memory(api, api_up):
+    """
+    Check that GET /api/health exposes the API process memory used by the benchmarks.
+
+    The `process` check is opt-in (HealthChecks:ExposeProcessMemory), so the test skips
+    when the API does not register it.
+
+    This test validates:
+        1. Its data reports a positive working set and cumulative GC allocations
+    """
+    r = api.health()
+    assert_status(r, 200)
+
+    checks = {c["name"]: c for c in r.json().get("checks", [])}
+    if "process" not in checks:
+        pytest.skip("GET /api/health does not report process memory (HealthChecks:ExposeProcessMemory is off).")
+
+    data = checks["process"]["data"]
+    assert data["workingSetBytes"] > 0
+    assert data["peakWorkingSetBytes"] >= data["workingSetBytes"]
+    assert data["gcTotalAllocatedBytes"] > 0
+
+
+def test_health_ok_concurrently_with_async_client(async_api, api_up):
+    """
+    Check that the async client keeps several requests in flight over one pool.
+
+    This test validates:
+        1. Every concurrent health call returns HTTP 200
+        2. Every response body reports `"status": "Healthy"`
+    """
+
+    async def _run():
+        async with async_api:
+            return await asyncio.gather(*(async_api.health() for _ in range(20)))
+
+    responses = asyncio.run(_run())
+
+    for r in responses:
+        assert_status(r, 200)
+        assert r.json().get("status") == "Healthy"
+
+
+def test_derived_clients_share_connection_pool(api, authed, api_up):
+    """
+    Check that `authed` (built with ApiClient.with_token) reuses the connection pool of `api`.
+
+    This test validates:
+        1. Both clients hold the same HttpTransport
+        2. Back-to-back calls from both clients are served by reused keep-alive connections
+    """
+    assert authed.transport is api.transport
+
+    before = api.pool_stats()
+    for _ in range(3):
+        assert_status(api.health(), 200)
+        assert_status(authed.health(), 200)
+    after = authed.pool_stats()
+
+    assert after["checkouts"] - before["checkouts"] == 6
+    assert after["reused"] - before["reused"] >= 5
+
+
+def test_requests_are_recorded_per_route_template(authed, api_up):
+    """
+    Check that ApiClient records every request under its route template.
+
+    This test validates:
+        1. Concrete GUIDs are collapsed into `{id}` in the endpoint key
+        2. Count, status and latency are captured for the endpoint
+    """
+    missing_id = str(uuid.uuid4())
+    key = "GET /api/cases/{id}/findings"
+    before = authed.metrics.to_dict().get(key, {}).get("count", 0)
+
+    authed.case_findings(missing_id)
+
+    stats = authed.metrics.to_dict()[key]
+    assert stats["count"] == before + 1
+    assert sum(stats["statuses"].values()) == stats["count"]
+    assert stats["latencyMs"]["max"] > 0
+    assert missing_id not in "".join(authed.metrics.to_dict())
@@ -1,10 +1,10 @@
 import json
-import time
 import uuid
 from datetime import datetime, timezone
 
 import pytest
 from tests.helpers.assertions import assert_status
+from tests.helpers.waiting import WaitTimeoutError, wait_until
 
 pytestmark = pytest.mark.integration
 
@@ -68,29 +68,13 @@ def _stringify(obj) -> str:
         return str(obj)
 
 
-def _entry_mentions_value(entry: dict, needle: str) -> bool:
-    """
-    Audit schemas vary. The most robust thing we can do is: does the entry contain the entity id
-    somewhere in its JSON representation?
-    """
-    hay = _stringify(entry)
-    return needle in hay
-
-
 def _entry_mentions_actor(entry: dict, actor_id: str | None, actor_email: str | None) -> bool:
     """
     Link audit entry to the authenticated principal.
     We accept either the actor id OR the actor email appearing in the entry.
     """
-    hay = _stringify(entry)
-    if actor_id and actor_id in hay:
-        return True
-    if actor_email and actor_email.lower() in hay.lower():
-        return True
-
-    # Some APIs store actor under nested structures; the string scan above usually catches it.
-    # If not, also check a few common keys.
-    for k in ["actorId", "performedById", "userId", "analystId", "createdById", "updatedById"]:
+    # Check the common keys first; AuditLogDto exposes the actor as performedByAnalystId.
+    for k in ["performedByAnalystId", "actorId", "performedById", "userId", "analystId", "createdById", "updatedById"]:
         v = entry.get(k)
         if v and actor_id and str(v) == actor_id:
             return True
@@ -100,6 +84,13 @@ def _entry_mentions_actor(entry: dict, actor_id: str | None, actor_email: str |
         if v and actor_email and str(v).lower() == actor_email.lower():
             return True
 
+    # Some APIs store actor under nested structures; fall back to a string scan.
+    hay = _stringify(entry)
+    if actor_id and actor_id in hay:
+        return True
+    if actor_email and actor_email.lower() in hay.lower():
+        return True
+
     return False
 
 
@@ -132,8 +123,8 @@ def _resolve_audit_path_or_fail(authed) -> str:
 
 def _audit_search(authed, audit_path: str, params: dict | None = None):
     """
-    Generic search/list call. Your API may support filters like entityId, entityType, dateFrom, etc.
-    This test only relies on being able to fetch a recent page.
+    Generic search/list call. /api/audit-logs supports EntityType/EntityId filters
+    (AuditLogQuery); if the endpoint rejects the params, fall back to the latest page.
     """
     r = authed.get(audit_path, params=params or DEFAULT_AUDIT_PAGE_PARAMS)
     if r.status_code == 400:
@@ -148,23 +139,28 @@ def _assert_audit_entry_for_entity(
     audit_path: str,
     *,
     entity_id: str,
+    entity_type: str | None = None,
     actor_id: str | None,
     actor_email: str | None,
     min_expected: int = 1,
-    retries: int = 6,
-    sleep_s: float = 0.25,
+    timeout: float = 5.0,
 ):
     """
-    Poll audit log for a short period and assert:
-      - at least `min_expected` entries mention entity_id
+    Wait (with backoff) until the audit log shows the entity, and assert:
+      - at least `min_expected` entries are for entity_id
       - and at least one of those entries mentions the actor id/email
+
+    The search is filtered by EntityId (and EntityType), so in the common case
+    the first request already returns the matching entries.
     """
-    last_resp = None
-    matches: list[dict] = []
+    params = {**DEFAULT_AUDIT_PAGE_PARAMS, "EntityId": entity_id}
+    if entity_type:
+        params["EntityType"] = entity_type
+    last: dict = {}
 
-    for _ in range(retries):
-        resp = _audit_search(authed, audit_path)
-        last_resp = resp
+    def probe():
+        resp = _audit_search(authed, audit_path, params)
+        last["resp"] = resp
 
         if resp.status_code != 200:
             body = _try_json(resp)
@@ -175,98 +171,37 @@ def _assert_audit_entry_for_entity(
                 f"Body: {_stringify(body) if body is not None else resp.text}"
             )
 
-        body = resp.json()
-        items = _paged_items(body)
-
-        matches = [e for e in items if isinstance(e, dict) and _entry_mentions_value(e, entity_id)]
-        if len(matches) >= min_expected:
-            # If actor is not specified, entity presence is enough
-            if actor_id is None and actor_email is None:
-                return matches
-
-            # Otherwise enforce actor linkage
-            if any(_entry_mentions_actor(e, actor_id, actor_email) for e in matches):
-                return matches
-
-        time.sleep(sleep_s)
+        items = _paged_items(resp.json())
+        matches = [e for e in items if isinstance(e, dict) and str(e.get("entityId")) == entity_id]
+        if len(matches) < min_expected:
+            return None
+        # If actor is not specified, entity presence is enough; otherwise enforce actor linkage.
+        if actor_id is None and actor_email is None:
+            return matches
+        if any(_entry_mentions_actor(e, actor_id, actor_email) for e in matches):
+            return matches
+        return None
 
-    # If we got here, we didn't find it.
-    body = _try_json(last_resp) if last_resp is not None else None
-    raise AssertionError(
-        "Audit entry not found (or not linked to actor) for entity.\n"
-        f"entity_id={entity_id}\n"
-        f"actor_id={actor_id}\n"
-        f"actor_email={actor_email}\n"
-        f"Last URL: {getattr(last_resp, 'url', None)}\n"
-        f"Last status: {getattr(last_resp, 'status_code', None)}\n"
-        f"Last body: {_stringify(body) if body is not None else getattr(last_resp, 'text', None)}"
-    )
+    try:
+        return wait_until(probe, timeout=timeout, description=f"Audit entry for {entity_type or 'entity'} {entity_id}")
+    except WaitTimeoutError:
+        last_resp = last.get("resp")
+        body = _try_json(last_resp) if last_resp is not None else None
+        raise AssertionError(
+            "Audit entry not found (or not linked to actor) for entity.\n"
+            f"entity_id={entity_id}\n"
+            f"entity_type={entity_type}\n"
+            f"actor_id={actor_id}\n"
+            f"actor_email={actor_email}\n"
+            f"Last URL: {getattr(last_resp, 'url', None)}\n"
+            f"Last status: {getattr(last_resp, 'status_code', None)}\n"
+            f"Last body: {_stringify(body) if body is not None else getattr(last_resp, 'text', None)}"
+        ) from None
 
 
 # ---------------------------------------------------------------------
 # Domain creation helpers (reuse the patterns you already validated)
 # ---------------------------------------------------------------------
-def _valid_client_payload(
-    *,
-    legal_type: int = 0,
-    name: str = "Audit Test Client",
-    contact_number: str = "+5511999999999",
-    country_code: str = "BR",
-    initial_risk_level: int | None = 1,
-):
-    payload = {
-        "legalType": legal_type,
-        "name": name,
-        "contactNumber": contact_number,
-        "addressJson": {
-            "street": "Av Paulista",
-            "city": "São Paulo",
-            "state": "SP",
-            "zipCode": "01310-100",
-            "country": "Brazil",
-        },
-        "countryCode": country_code,
-    }
-    if initial_risk_level is not None:
-        payload["initialRiskLevel"] = initial_risk_level
-    return payload
-
-
-def _create_client_or_skip(authed) -> dict:
-    """
-    Create a client. If seed dependencies (e.g., countries) are missing, skip.
-    """
-    payload = _valid_client_payload(name=f"Audit Client {uuid.uuid4()}")
-    r = authed.post("/api/clients", json=payload)
-
-    if r.status_code == 400:
-        body = _try_json(r) or {"raw": r.text}
-        pytest.skip(f"Could not create client (validation/seed issue). Response: {_stringify(body)}")
-
-    assert_status(r, 201)
-    return r.json()
-
-
-def _create_account_or_skip(authed, client_id: str) -> dict:
-    """
-    Create an account for a client. If validation/seed blocks it, skip.
-    """
-    payload = {
-        "accountIdentifier": f"AUD-{uuid.uuid4()}",
-        "countryCode": "BR",
-        "accountType": 0,   # Checking (assumption: enum int)
-        "currencyCode": "BRL",
-    }
-
-    r = authed.post(f"/api/clients/{client_id}/accounts", json=payload)
-    if r.status_code == 400:
-        body = _try_json(r) or {"raw": r.text}
-        pytest.skip(f"Could not create account (validation/seed issue). Response: {_stringify(body)}")
-
-    assert_status(r, 201)
-    return r.json()
-
-
 def _create_transaction_or_skip(authed, account_id: str, *, amount: float, currency: str = "BRL", tx_type: int = 0) -> dict:
     """
     Create a transaction. If FX rates/base currency config blocks it, skip.
@@ -316,7 +251,8 @@ def _get_case_by_transaction_or_skip(authed, transaction_id: str) -> dict:
 # ---------------------------------------------------------------------
 # Tests: "exhaust the cases" for create/change/update and actor linkage
 # ---------------------------------------------------------------------
-def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_actor(authed, api_up):
+@pytest.mark.serial
+def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_actor(authed, data_factory):
     """
     Exhaustive-ish audit test across core flows:
       1) Create Client => audit entry linked to actor
@@ -339,14 +275,15 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     actor_email = str(me.get("corporateEmail")) if isinstance(me, dict) and me.get("corporateEmail") else None
 
     # -------------------------
-    # 1) CREATE CLIENT
+    # 1) CREATE CLIENT (bulk-imported by the data factory under the same analyst)
     # -------------------------
-    client = _create_client_or_skip(authed)
+    client, account = data_factory.client_with_account()
     client_id = client["id"]
 
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=client_id,
+        entity_type="Client",
         actor_id=actor_id,
         actor_email=actor_email,
     )
@@ -354,12 +291,12 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     # -------------------------
     # 2) CREATE ACCOUNT
     # -------------------------
-    account = _create_account_or_skip(authed, client_id)
     account_id = account["id"]
 
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=account_id,
+        entity_type="Account",
         actor_id=actor_id,
         actor_email=actor_email,
     )
@@ -373,6 +310,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=tx_id,
+        entity_type="Transaction",
         actor_id=actor_id,
         actor_email=actor_email,
     )
@@ -388,6 +326,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=violating_tx_id,
+        entity_type="Transaction",
         actor_id=actor_id,
         actor_email=actor_email,
     )
@@ -401,6 +340,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=case_id,
+        entity_type="Case",
         actor_id=None,
         actor_email=None,
         min_expected=1,
@@ -417,6 +357,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=case_id,
+        entity_type="Case",
         actor_id=actor_id,
         actor_email=actor_email,
         min_expected=1,
@@ -440,6 +381,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=case_id,
+        entity_type="Case",
         actor_id=actor_id,
         actor_email=actor_email,
         min_expected=1,
@@ -477,6 +419,7 @@ def test_audit_log_exhaustive_create_change_update_are_logged_and_linked_to_acto
     _assert_audit_entry_for_entity(
         authed, audit_path,
         entity_id=str(rule_id),
+        entity_type="ComplianceRule",
         actor_id=actor_id,
         actor_email=actor_email,
         min_expected=1,
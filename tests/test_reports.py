@@ -0,0 +1,239 @@
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from tests.helpers.assertions import assert_status
+from tests.helpers.compliance import rule_by_code
+from tests.helpers.import_files import transaction_rows
+from tests.helpers.payloads import deposit_payload
+
+pytestmark = pytest.mark.integration
+
+
+def _period(days: int) -> dict:
+    end = date.today()
+    return {"startDate": (end - timedelta(days=days)).isoformat(), "endDate": end.isoformat()}
+
+
+def _cents(value) -> Decimal:
+    return Decimal(str(value)).quantize(Decimal("0.01"))
+
+
+def _sections(rows: list[list[str]]) -> dict[str, list[list[str]]]:
+    """
+    Split a report CSV into its sections ("TRANSACTION METRICS", ...), keyed by title row.
+    """
+    sections, current = {}, None
+    for row in rows:
+        if not any(row):
+            current = None
+            continue
+        if current is None:
+            current = sections.setdefault(row[0], [])
+            continue
+        current.append(row)
+    return sections
+
+
+# -------------------------------------------------
+# GET /api/reports/system/export/csv
+# -------------------------------------------------
+def test_system_report_csv_streams_to_disk(authed, api_up, tmp_path):
+    path = tmp_path / "system.csv"
+
+    with authed.report_system_export_csv(_period(30)) as download:
+        assert_status(download.response, 200)
+        stats = download.save(str(path))
+
+    assert download.response.headers.get("Content-Type", "").startswith("text/csv")
+    assert (download.file_name or "").startswith("system_report_")
+    assert stats.bytes_received == path.stat().st_size > 0
+    assert stats.ttfb_s is not None and stats.ttfb_s <= stats.total_s
+
+
+def test_system_report_csv_rows_include_recent_transactions(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
+    assert_status(authed.transaction_create(deposit_payload(account["id"])), 201)
+
+    with authed.report_system_export_csv(_period(1)) as download:
+        assert_status(download.response, 200)
+        sections = _sections(list(download.rows()))
+
+    header = dict(row[:2] for row in sections["SYSTEM REPORT"])
+    metrics = dict(row[:2] for row in sections["TRANSACTION METRICS"])
+
+    assert download.stats.rows > 0
+    assert int(header["Active Clients"]) >= 1
+    assert int(metrics["Total Transactions"]) >= 1
+
+
+# -------------------------------------------------
+# GET /api/reports/client/{clientId}/export/csv
+# -------------------------------------------------
+def test_client_report_csv_rows_include_client_and_accounts(authed, data_factory, api_up):
+    client, account = data_factory.client_with_account()
+    assert_status(authed.transaction_create(deposit_payload(account["id"])), 201)
+
+    with authed.report_client_export_csv(client["id"], _period(1)) as download:
+        assert_status(download.response, 200)
+        sections = _sections(list(download.rows()))
+
+    header = dict(row[:2] for row in sections["CLIENT REPORT"])
+    metrics = dict(row[:2] for row in sections["TRANSACTION METRICS"])
+    top_accounts = [row[0] for row in sections["TOP ACCOUNTS BY VOLUME"][1:]]
+
+    assert header["Client ID"] == client["id"]
+    assert int(metrics["Total Transactions"]) == 1
+    assert top_accounts == [account["accountIdentifier"]]
+
+
+def test_client_report_csv_unknown_client_returns_404(authed, api_up):
+    with authed.report_client_export_csv(str(uuid.uuid4())) as download:
+        assert_status(download.response, 404)
+
+
+# -------------------------------------------------
+# Daily rollups: report aggregates and the daily limit rule read pre-aggregated
+# per-day totals, so they must agree with a recomputation over the raw transactions.
+# -------------------------------------------------
+HISTORY_DAYS = 14
+
+
+@pytest.fixture(scope="module")
+def rollup_history(authed, data_factory) -> dict:
+    """
+    Client with a generated two-week history.
+
+    The history is imported (batch saves) and followed by one transaction created through
+    POST /api/transactions (single insert), so both rollup update paths are covered.
+    """
+    client, accounts = data_factory.client_with_accounts()
+    rows = transaction_rows(
+        [a["accountIdentifier"] for a in accounts],
+        400,
+        seed=24,
+        end=datetime.now(timezone.utc) - timedelta(minutes=5),
+        window=timedelta(days=HISTORY_DAYS - 1),
+        violating_fraction=0.05,
+    )
+    data_factory.seed_transactions(rows, chunk_size=150)
+    assert_status(authed.transaction_create(deposit_payload(accounts[0]["id"], amount=42.00, currency="USD")), 201)
+    return client
+
+
+def _raw_transactions(authed, client: dict) -> list[dict]:
+    return list(authed.iter_transactions({"clientId": client["id"]}))
+
+
+def _raw_day(tx: dict) -> date:
+    return datetime.fromisoformat(tx["occurredAtUtc"]).astimezone(timezone.utc).date()
+
+
+def _raw_totals(transactions: list[dict], key) -> dict:
+    """
+    {key(tx): (count, base amount)} recomputed from raw transactions.
+    """
+    totals = defaultdict(lambda: [0, Decimal("0")])
+    for tx in transactions:
+        entry = totals[key(tx)]
+        entry[0] += 1
+        entry[1] += _cents(tx["baseAmount"])
+    return {k: (count, volume) for k, (count, volume) in totals.items()}
+
+
+def _assert_client_report_matches_raw(authed, client: dict, days: int) -> list[dict]:
+    """
+    Compare the rollup-based aggregates of GET /api/reports/client/{id} with the client's raw transactions.
+    """
+    transactions = _raw_transactions(authed, client)
+
+    r = authed.report_client(client["id"], _period(days))
+    assert_status(r, 200)
+    report = r.json()
+
+    trend = {date.fromisoformat(p["date"]): (p["count"], _cents(p["volumeUSD"])) for p in report["transactionTrend"]}
+    by_type = {t["type"]: (t["count"], _cents(t["volumeUSD"])) for t in report["transactionsByType"]}
+    top_accounts = {a["accountId"]: (a["transactionCount"], _cents(a["totalVolumeUSD"])) for a in report["topAccounts"]}
+    metrics = report["transactionMetrics"]
+
+    assert trend == _raw_totals(transactions, _raw_day)
+    assert by_type == _raw_totals(transactions, lambda tx: tx["type"])
+    assert top_accounts == _raw_totals(transactions, lambda tx: tx["accountId"])
+    assert metrics["totalTransactions"] == len(transactions)
+    assert _cents(metrics["totalVolumeUSD"]) == sum(_cents(tx["baseAmount"]) for tx in transactions)
+    return transactions
+
+
+def test_client_report_aggregates_match_raw_transactions(authed, rollup_history, api_up):
+    _assert_client_report_matches_raw(authed, rollup_history, HISTORY_DAYS)
+
+
+def test_mixed_currency_import_rollups_match_raw_transactions(authed, data_factory, api_up):
+    """
+    An import converts non-base-currency rows row by row, and storing a new FX rate saves
+    the rows added before it ahead of the batch save: those rows must be rolled up too.
+    """
+    client, accounts = data_factory.client_with_accounts()
+    rows = list(
+        transaction_rows(
+            [a["accountIdentifier"] for a in accounts],
+            120,
+            seed=2401,
+            end=datetime.now(timezone.utc) - timedelta(minutes=5),
+            window=timedelta(days=2),
+            currencies={"USD": 1, "BRL": 1},
+        )
+    )
+    data_factory.seed_transactions(rows, chunk_size=60)
+
+    transactions = _assert_client_report_matches_raw(authed, client, 3)
+    assert len(transactions) == len(rows)
+    assert {tx["currencyCode"] for tx in transactions} == {"USD", "BRL"}
+
+
+def test_system_report_trend_covers_client_history(authed, rollup_history, api_up):
+    transactions = _raw_transactions(authed, rollup_history)
+
+    r = authed.report_system(_period(HISTORY_DAYS))
+    assert_status(r, 200)
+    trend = {date.fromisoformat(p["date"]): (p["count"], _cents(p["volumeUSD"])) for p in r.json()["transactionTrend"]}
+
+    # Other tests add transactions concurrently, so the system-wide days can only be larger.
+    for day, (count, volume) in _raw_totals(transactions, _raw_day).items():
+        assert trend[day][0] >= count
+        assert trend[day][1] >= volume
+
+
+def test_daily_limit_uses_the_same_daily_totals_as_raw_transactions(authed, rollup_history, api_up):
+    """
+    Probe the days with the highest and lowest raw totals with a small deposit: a case must
+    be opened exactly when the raw total of the day plus the probe exceeds the limit.
+    """
+    transactions = _raw_transactions(authed, rollup_history)
+    rule = rule_by_code(authed, "daily_limit_default")
+    if not rule.get("isActive"):
+        pytest.skip("daily_limit_default is not active.")
+    limit = _cents(rule["parameters"]["limitBaseAmount"])
+    account_id = transactions[0]["accountId"]
+
+    per_account = rule.get("scope") == "PerAccount"
+    scoped = [tx for tx in transactions if not per_account or tx["accountId"] == account_id]
+    daily = _raw_totals(scoped, _raw_day)
+    # Days before today (UTC), so a probe at noon is never in the future.
+    today = datetime.now(timezone.utc).date()
+    days = sorted((d for d in daily if d < today), key=lambda d: daily[d][1])
+    if not days or not daily[days[0]][1] < limit < daily[days[-1]][1]:
+        pytest.skip("Generated history has no day on each side of the daily limit.")
+
+    for day in (days[0], days[-1]):
+        occurred_at = datetime.combine(day, time(12), tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+        r = authed.transaction_create(deposit_payload(account_id, amount=1.00, currency="USD", occurred_at=occurred_at))
+        assert_status(r, 201)
+        probe = r.json()
+
+        expected = daily[day][1] + _cents(probe["baseAmount"]) > limit
+        cases = authed.cases_search(params={"transactionId": probe["id"], "page": 1, "pageSize": 20})
+        assert_status(cases, 200)
+        assert bool(cases.json()["items"]) == expected, f"{day}: raw total {daily[day][1]} vs limit {limit}"
@@ -1,6 +1,8 @@
 import uuid
 import pytest
 from tests.helpers.assertions import assert_status, assert_problem_details
+from tests.helpers.compliance import case_for_transaction
+from tests.helpers.payloads import transfer_payload
 
 pytestmark = pytest.mark.integration
 
@@ -143,6 +145,7 @@ def test_patch_rule_empty_object_rejected_by_validation(authed, api_up):
     assert_problem_details(r, 400)
 
 
+@pytest.mark.serial
 def test_patch_rule_no_effective_change_returns_no_changes(authed, api_up):
     """
     This is the Application-level 'NoChanges' outcome:
@@ -157,6 +160,7 @@ def test_patch_rule_no_effective_change_returns_no_changes(authed, api_up):
     assert_problem_details(r, 400)
 
 
+@pytest.mark.serial
 def test_patch_rule_invalid_parameters_returns_400(authed, api_up):
     rule = _get_any_rule(authed)
     rule_id = rule["id"]
@@ -176,6 +180,7 @@ def test_patch_rule_invalid_update_returns_400(authed, api_up):
     assert_problem_details(r, 400)
 
 
+@pytest.mark.serial
 def test_patch_rule_success_update_and_revert_name(authed, api_up):
     rule = _get_any_rule(authed)
     rule_id = rule["id"]
@@ -190,3 +195,46 @@ def test_patch_rule_success_update_and_revert_name(authed, api_up):
     r2 = authed.rules_patch(rule_id, {"name": original_name})
     assert_status(r2, 200)
     assert r2.json()["name"] == original_name
+
+
+# ----------------------------
+# Rule cache: active rules are cached with pre-parsed parameters by the compliance
+# checker and the cache is invalidated by a successful PATCH.
+# ----------------------------
+
+@pytest.mark.serial
+def test_patch_rule_parameters_apply_to_next_transaction(authed, data_factory):
+    """
+    A transfer to a country is evaluated (warming the rule cache), the country is then
+    added to banned_countries_default: the very next transfer must open a case, and after
+    the rule is restored the one after must not.
+    """
+    rule = next((x for x in authed.iter_rules() if x.get("code") == "banned_countries_default"), None)
+    if rule is None or not rule.get("isActive"):
+        pytest.skip("banned_countries_default is not seeded or not active.")
+    original = rule["parameters"]
+    country = "NZ"
+    if country in original["countries"]:
+        pytest.skip(f"{country} is already banned by banned_countries_default.")
+
+    _, account = data_factory.client_with_account()
+
+    def transfer() -> dict:
+        r = authed.transaction_create(transfer_payload(account["id"], amount=10.00, currency="USD", cp_country=country))
+        assert_status(r, 201)
+        return r.json()
+
+    assert case_for_transaction(authed, transfer()["id"]) is None
+
+    r = authed.rules_patch(rule["id"], {"parameters": {**original, "countries": [*original["countries"], country]}})
+    assert_status(r, 200)
+    try:
+        case = case_for_transaction(authed, transfer()["id"])
+        assert case is not None, "Patched banned country was not applied to the next transaction."
+        findings = authed.case_findings(case["id"])
+        assert_status(findings, 200)
+        assert any(f.get("ruleCode") == "banned_countries_default" for f in findings.json())
+    finally:
+        assert_status(authed.rules_patch(rule["id"], {"parameters": original}), 200)
+
+    assert case_for_transaction(authed, transfer()["id"]) is None
@@ -1,103 +1,17 @@
 import json
 import uuid
 from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
 
 import pytest
 from tests.helpers.assertions import assert_status
+from tests.helpers.fx_stub import USD_RATES
+from tests.helpers.import_files import import_file_chunks, transaction_rows
+from tests.helpers.payloads import TRANSACTION_IMPORT_HEADER, deposit_payload, transfer_payload
 
 pytestmark = pytest.mark.integration
 
 
-# -----------------------------
-# Client helpers (same pattern you used)
-# -----------------------------
-def _valid_client_payload(
-    *,
-    legal_type: int = 0,
-    name: str = "John Doe",
-    contact_number: str = "+5511999999999",
-    country_code: str = "BR",
-    initial_risk_level: int | None = 1,
-):
-    payload = {
-        "legalType": legal_type,
-        "name": name,
-        "contactNumber": contact_number,
-        "addressJson": {
-            "street": "Av Paulista",
-            "city": "São Paulo",
-            "state": "SP",
-            "zipCode": "01310-100",
-            "country": "Brazil",
-        },
-        "countryCode": country_code,
-    }
-    if initial_risk_level is not None:
-        payload["initialRiskLevel"] = initial_risk_level
-    return payload
-
-
-def _create_client_or_skip(authed):
-    payload = _valid_client_payload()
-    r = authed.client_create(payload)
-
-    if r.status_code == 400:
-        # Common when Countries seed is missing.
-        try:
-            body = r.json()
-        except Exception:
-            body = {"raw": r.text}
-        pytest.skip(
-            "Could not create client (likely missing countries seed). "
-            f"Response: {json.dumps(body, ensure_ascii=False)}"
-        )
-
-    assert_status(r, 201)
-    return r.json()
-
-
-# -----------------------------
-# Account helpers (assumes your AccountsController)
-# -----------------------------
-def _valid_account_payload(
-    *,
-    account_identifier: str | None = None,
-    country_code: str = "BR",
-    account_type: int = 0,  # enum int
-    currency_code: str = "BRL",
-):
-    if account_identifier is None:
-        account_identifier = f"ACC-{uuid.uuid4()}"
-    return {
-        "accountIdentifier": account_identifier,
-        "countryCode": country_code,
-        "accountType": account_type,
-        "currencyCode": currency_code,
-    }
-
-
-def _create_account_or_skip(authed, client_id: str, payload: dict | None = None):
-    if payload is None:
-        payload = _valid_account_payload()
-
-    r = authed.account_create(client_id, payload)
-
-    if r.status_code == 400:
-        try:
-            body = r.json()
-        except Exception:
-            body = {"raw": r.text}
-        errors = body.get("errors") if isinstance(body, dict) else None
-        if isinstance(errors, dict) and ("CountryCode" in errors or "countryCode" in errors):
-            pytest.skip(
-                "Could not create account (likely missing countries seed). "
-                f"Response: {json.dumps(body, ensure_ascii=False)}"
-            )
-
-    assert_status(r, 201)
-    return r.json()
-
-
 # -----------------------------
 # Transaction helpers
 # -----------------------------
@@ -110,28 +24,12 @@ def _future_iso_z(minutes: int = 60):
 
 
 def _valid_deposit_payload(account_id: str):
-    return {
-        "accountId": account_id,
-        "type": 0,
-        "amount": 100.50,
-        "currencyCode": "BRL",
-        "occurredAtUtc": _now_iso_z(),
-    }
+    return deposit_payload(account_id, amount=100.50, currency="BRL")
 
 
 def _valid_transfer_non_br_payload(account_id: str):
-    return {
-        "accountId": account_id,
-        "type": 2,
-        "transferMethod": 0,         
-        "amount": 10.00,
-        "currencyCode": "BRL",
-        "occurredAtUtc": _now_iso_z(),
-        "cpCountryCode": "US",        
-        "cpIdentifierType": 0,        
-        "cpIdentifier": f"CP-{uuid.uuid4()}",
-        "cpName": "Counterparty Inc",
-    }
+    # Shared with the load generator in tests/perf
+    return transfer_payload(account_id, amount=10.00, currency="BRL", cp_country="US")
 
 
 def _valid_transfer_br_payload(account_id: str, cp_identifier_type: int, cp_identifier: str):
@@ -185,9 +83,8 @@ def _extract_items(paged_json):
 # -------------------------------------------------
 # POST /api/transactions
 # -------------------------------------------------
-def test_create_transaction_deposit_success_returns_201_and_body(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_create_transaction_deposit_success_returns_201_and_body(authed, data_factory, api_up):
+    client, account = data_factory.client_with_account()
 
     payload = _valid_deposit_payload(account["id"])
     r = authed.transaction_create(payload)
@@ -208,9 +105,28 @@ def test_create_transaction_deposit_success_returns_201_and_body(authed, api_up)
     assert "createdAtUtc" in body
 
 
-def test_create_transaction_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_create_transaction_converts_non_base_currency_with_upstream_rate(authed, data_factory, fx_upstream):
+    """
+    With the API wired to the FX stub, a BRL deposit is converted to the base currency
+    at the stub's deterministic USD/BRL rate (no skip on FX errors here).
+    """
+    _, account = data_factory.client_with_account()
+
+    payload = _valid_deposit_payload(account["id"])
+    r = authed.transaction_create(payload)
+    assert_status(r, 201)
+    body = r.json()
+
+    expected = (Decimal(str(payload["amount"])) / Decimal(str(USD_RATES["BRL"]))).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+    assert body["baseCurrencyCode"] == "USD"
+    assert Decimal(str(body["baseAmount"])) == expected
+    assert body["fxRateId"] is not None
+
+
+def test_create_transaction_requires_auth(api, authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     payload = _valid_deposit_payload(account["id"])
     r = api.transaction_create(payload)
@@ -234,9 +150,8 @@ def test_create_transaction_requires_auth(api, authed, api_up):
         (lambda p: p.update({"occurredAtUtc": _future_iso_z(minutes=60 * 24)}), "OccurredAtUtc"),
     ],
 )
-def test_create_transaction_validation_errors_return_400(authed, api_up, mutator, expected_error_key):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_create_transaction_validation_errors_return_400(authed, data_factory, api_up, mutator, expected_error_key):
+    _, account = data_factory.client_with_account()
 
     payload = _valid_deposit_payload(account["id"])
     mutator(payload)
@@ -250,9 +165,8 @@ def test_create_transaction_validation_errors_return_400(authed, api_up, mutator
     assert expected_error_key in body["errors"]
 
 
-def test_create_transfer_requires_fields_return_400(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_create_transfer_requires_fields_return_400(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     payload = _valid_transfer_non_br_payload(account["id"])
     # Remove required transfer fields
@@ -267,9 +181,8 @@ def test_create_transfer_requires_fields_return_400(authed, api_up):
     assert "TransferMethod" in body["errors"]
 
 
-def test_create_transfer_non_br_success_returns_201_or_skips_if_country_missing(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_create_transfer_non_br_success_returns_201_or_skips_if_country_missing(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     payload = _valid_transfer_non_br_payload(account["id"])
     r = authed.transaction_create(payload)
@@ -287,14 +200,13 @@ def test_create_transfer_non_br_success_returns_201_or_skips_if_country_missing(
     assert body["cpCountryCode"] == "US"
 
 
-def test_create_transfer_br_identifier_must_exist_return_400(authed, api_up):
+def test_create_transfer_br_identifier_must_exist_return_400(authed, data_factory, api_up):
     """
     Your validator enforces that for BR transfers the counterparty identifier
     must exist in the system (account_identifiers table).
     Here we intentionally use a random identifier to confirm it fails.
     """
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+    _, account = data_factory.client_with_account()
 
     payload = _valid_transfer_br_payload(
         account_id=account["id"],
@@ -315,9 +227,8 @@ def test_create_transfer_br_identifier_must_exist_return_400(authed, api_up):
 # -------------------------------------------------
 # GET /api/transactions/{id}
 # -------------------------------------------------
-def test_get_transaction_by_id_success_returns_200(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_get_transaction_by_id_success_returns_200(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     create_payload = _valid_deposit_payload(account["id"])
     created = authed.transaction_create(create_payload)
@@ -345,9 +256,8 @@ def test_get_transaction_by_id_not_found_returns_404(authed, api_up):
     assert "title" in body
 
 
-def test_get_transaction_by_id_requires_auth(api, authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_get_transaction_by_id_requires_auth(api, authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     created = authed.transaction_create(_valid_deposit_payload(account["id"]))
     if created.status_code == 400:
@@ -363,9 +273,8 @@ def test_get_transaction_by_id_requires_auth(api, authed, api_up):
 # -------------------------------------------------
 # GET /api/transactions (paged search)
 # -------------------------------------------------
-def test_search_transactions_by_account_returns_paged_items(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+def test_search_transactions_by_account_returns_paged_items(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
 
     created = authed.transaction_create(_valid_deposit_payload(account["id"]))
     if created.status_code == 400:
@@ -380,7 +289,7 @@ def test_search_transactions_by_account_returns_paged_items(authed, api_up):
             "page": 1,
             "pageSize": 20,
             "sortBy": "occurredAtUtc",
-            "sortDescending": True,
+            "sortDesc": True,
         }
     )
 
@@ -427,10 +336,7 @@ def test_import_transactions_unknown_account_identifier_returns_200_with_errors_
     Import processing returns a result DTO even for partial failures.
     Unknown AccountIdentifier should appear in Errors with ErrorCount > 0.
     """
-    csv = (
-        "AccountIdentifier,Type,TransferMethod,Amount,CurrencyCode,OccurredAtUtc,CpName,CpBank,CpBranch,CpAccount,CpIdentifierType,CpIdentifier,CpCountryCode\n"
-        f"UNKNOWN-ACC,Deposit,,10.00,BRL,{_now_iso_z()},,,,,,,\n"
-    ).encode("utf-8")
+    csv = b"".join(import_file_chunks("tx.csv", TRANSACTION_IMPORT_HEADER, transaction_rows(["UNKNOWN-ACC"], 1)))
 
     r = authed.transactions_import("tx.csv", csv)
 
@@ -447,20 +353,26 @@ def test_import_transactions_unknown_account_identifier_returns_200_with_errors_
     assert body["errorCount"] >= 1
 
 
-def test_import_transactions_success_csv_returns_200_or_skips_if_fx_seed_missing(authed, api_up):
-    client = _create_client_or_skip(authed)
-    account = _create_account_or_skip(authed, client["id"])
+@pytest.mark.parametrize(
+    "file_name,content_type",
+    [
+        ("tx.csv", "text/csv"),
+        ("tx.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ],
+)
+def test_import_transactions_success_returns_200_or_skips_if_fx_seed_missing(
+    authed, data_factory, api_up, file_name, content_type
+):
+    _, account = data_factory.client_with_account()
 
     account_identifier = account.get("accountIdentifier")
     if not account_identifier:
-        pytest.skip("AccountResponseDto did not include accountIdentifier; cannot build import CSV reliably.")
+        pytest.skip("AccountResponseDto did not include accountIdentifier; cannot build import file reliably.")
 
-    csv = (
-        "AccountIdentifier,Type,TransferMethod,Amount,CurrencyCode,OccurredAtUtc,CpName,CpBank,CpBranch,CpAccount,CpIdentifierType,CpIdentifier,CpCountryCode\n"
-        f"{account_identifier},Deposit,,10.00,BRL,{_now_iso_z()},,,,,,,\n"
-    ).encode("utf-8")
+    rows = transaction_rows([account_identifier], 3, seed=1, kinds=("Deposit", "Withdrawal", "Transfer"))
+    body = b"".join(import_file_chunks(file_name, TRANSACTION_IMPORT_HEADER, rows))
 
-    r = authed.transactions_import("tx.csv", csv)
+    r = authed.transactions_import(file_name, body, content_type=content_type)
 
     if r.status_code == 404:
         pytest.skip("POST /api/transactions/import not implemented (404).")
@@ -471,7 +383,50 @@ def test_import_transactions_success_csv_returns_200_or_skips_if_fx_seed_missing
     assert_status(r, 200)
     body = r.json()
 
-    assert body["totalProcessed"] >= 1
+    assert body["totalProcessed"] == 3
     assert "successCount" in body
     assert "errorCount" in body
     assert "errors" in body
+
+
+def test_iter_transactions_walks_every_page_of_account(authed, data_factory, api_up):
+    _, account = data_factory.client_with_account()
+
+    created_ids = set()
+    for _ in range(3):
+        created = authed.transaction_create(_valid_deposit_payload(account["id"]))
+        if created.status_code == 400:
+            _skip_if_fx_or_country_seed_issue(created)
+        assert_status(created, 201)
+        created_ids.add(created.json()["id"])
+
+    # pageSize=1 forces the iterator through three pages (with next-page prefetch).
+    seen = [tx["id"] for tx in authed.iter_transactions({"accountId": account["id"]}, page_size=1)]
+
+    assert len(seen) == len(set(seen)) == 3
+    assert set(seen) == created_ids
+
+
+@pytest.mark.parametrize("sort_desc", [True, False])
+def test_scan_all_transactions_concurrently_matches_sequential_walk(authed, data_factory, api_up, sort_desc):
+    _, account = data_factory.client_with_account()
+
+    created_ids = []
+    for _ in range(4):
+        created = authed.transaction_create(_valid_deposit_payload(account["id"]))
+        if created.status_code == 400:
+            _skip_if_fx_or_country_seed_issue(created)
+        assert_status(created, 201)
+        created_ids.append(created.json()["id"])
+
+    # TransactionsController.GetTransactions binds the direction as `sortDesc` (default true).
+    params = {"accountId": account["id"], "sortBy": "createdAtUtc", "sortDesc": sort_desc}
+    sequential = [tx["id"] for tx in authed.iter_transactions(params, page_size=1, prefetch=False)]
+    ordered = [tx["id"] for tx in authed.scan_all("/api/transactions", params, concurrency=4, page_size=1)]
+    unordered = [
+        tx["id"] for tx in authed.scan_all("/api/transactions", params, concurrency=4, ordered=False, page_size=1)
+    ]
+
+    assert sequential == (created_ids[::-1] if sort_desc else created_ids)
+    assert ordered == sequential
+    assert sorted(unordered) == sorted(sequential)